@@ -0,0 +1,113 @@
+"""Compare chapter text extraction before and after memoized lxml parsing
+
+Usage:
+    python -m benchmarks.chapter_text [book.epub ...] [--chapters N] [--repeat N]
+
+Without EPUB paths a synthetic book of large chapters is generated.
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from collections.abc import Callable
+
+from bs4 import BeautifulSoup
+from ebooklib import ITEM_DOCUMENT, epub
+
+from src.infrastructure.external.epub.epub_reader import Chapter
+
+logger = logging.getLogger(__name__)
+
+# Extractions per chapter before memoization: read_chapters' length check, the
+# worker payload and the summarizer (which re-parsed the already plain text)
+LEGACY_EXTRACTIONS_PER_CHAPTER = 3
+
+
+def _legacy_text(content: str) -> str:
+    """Chapter.get_text_content as it was: a fresh html.parser tree on every call"""
+    soup = BeautifulSoup(content, "html.parser")
+    for script in soup(["script", "style"]):
+        script.decompose()
+    text = soup.get_text()
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return "\n".join(chunk for chunk in chunks if chunk)
+
+
+def _legacy_pipeline(documents: list[str]) -> list[str]:
+    texts = []
+    for content in documents:
+        text = _legacy_text(content)
+        if len(text) <= 50:
+            continue
+        text = _legacy_text(content)
+        texts.append(_legacy_text(text))
+    return texts
+
+
+def _memoized_pipeline(documents: list[str]) -> list[str]:
+    texts = []
+    for index, content in enumerate(documents):
+        chapter = Chapter(index=index, title=None, content=content)
+        if len(chapter.get_text_content()) <= 50:
+            continue
+        chapter.get_text_content()
+        texts.append(chapter.get_text_content())
+    return texts
+
+
+def _read_documents(epub_path: str) -> list[str]:
+    book = epub.read_epub(epub_path)
+    documents = (item.get_content().decode("utf-8", errors="ignore") for item in book.get_items_of_type(ITEM_DOCUMENT))
+    return [content for content in documents if len(content) >= 100]
+
+
+def _synthetic_documents(chapters: int) -> list[str]:
+    paragraph = "<p>吾輩は<ruby>猫<rt>ねこ</rt></ruby>である。名前はまだ無い。<em>どこで</em>生れたかとんと見当がつかぬ。  The quick brown fox.</p>\n"
+    body = paragraph * 2000
+    return [
+        f'<?xml version="1.0" encoding="utf-8"?><html xmlns="http://www.w3.org/1999/xhtml"><head><title>Chapter {index}</title>'
+        f"<style>p {{ margin: 0 }}</style></head><body><h1>Chapter {index}</h1>{body}</body></html>"
+        for index in range(chapters)
+    ]
+
+
+def _time(pipeline: Callable[[list[str]], list[str]], documents: list[str], repeat: int) -> tuple[float, list[str]]:
+    timings = []
+    texts: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        texts = pipeline(documents)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), texts
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("epub_paths", nargs="*", help="EPUB files to benchmark")
+    parser.add_argument("--chapters", type=int, default=40, help="Chapters of the synthetic book used when no EPUB is given")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path; the median is reported")
+    args = parser.parse_args()
+
+    books = [(path, _read_documents(path)) for path in args.epub_paths] or [("synthetic", _synthetic_documents(args.chapters))]
+    for name, documents in books:
+        size_mb = sum(len(content.encode("utf-8")) for content in documents) / 1024 / 1024
+        legacy_seconds, legacy_texts = _time(_legacy_pipeline, documents, args.repeat)
+        memoized_seconds, memoized_texts = _time(_memoized_pipeline, documents, args.repeat)
+        unmatched = abs(len(legacy_texts) - len(memoized_texts))
+        mismatches = unmatched + sum(1 for old, new in zip(legacy_texts, memoized_texts, strict=False) if old != new)
+        logger.info(
+            f"{name}: {len(documents)} documents, {size_mb:.1f} MB HTML | "
+            f"html.parser x{LEGACY_EXTRACTIONS_PER_CHAPTER}: {legacy_seconds:.3f}s | "
+            f"lxml memoized: {memoized_seconds:.3f}s | "
+            f"speedup {legacy_seconds / memoized_seconds:.1f}x | chapters with different text: {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+
+from sqlalchemy.orm import Session
+
+from src.config.app_config import AppConfig
+from src.config.db import SessionLocal, init_db
+from src.domain.book.entities.book_index_job import BookIndexJob
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.external.epub import EpubParser
+from src.infrastructure.external.gcs import GCSClient
+from src.infrastructure.memory.memory_service import MemoryService
+from src.infrastructure.postgres.book import BookIndexJobQueueImpl, BookRepositoryImpl
+from src.usecase.book.create_book_vector_index_usecase import CreateBookVectorIndexUseCaseImpl
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+class BookIndexWorker:
+    """Claims book indexing jobs from the queue and indexes the stored EPUBs with bounded concurrency
+
+    Run with ``python -m src.book_index_worker``. Uploads only enqueue a job, so
+    downloading, parsing and embedding books never runs in the API process.
+    Claiming, leases and recovery work as in the podcast worker: jobs whose
+    lease expires are put back in the queue until they run out of attempts.
+    """
+
+    def __init__(self, config: AppConfig) -> None:
+        self.concurrency = config.book_index_worker_concurrency
+        self.visibility_timeout_seconds = config.book_index_job_visibility_timeout_seconds
+        self.max_attempts = config.book_index_job_max_attempts
+        self.poll_interval_seconds = config.book_index_worker_poll_interval_seconds
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.gcs_client = GCSClient()
+        self._stop_event = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; running jobs are allowed to finish"""
+        if not self._stop_event.is_set():
+            logger.info(f"Worker {self.worker_id} stopping after in-flight jobs finish")
+            self._stop_event.set()
+
+    async def run(self) -> None:
+        """Recover abandoned work, then process jobs until stopped"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, self.stop)
+
+        logger.info(f"Worker {self.worker_id} started (concurrency={self.concurrency}, visibility_timeout={self.visibility_timeout_seconds}s)")
+        await self._recover()
+        await ClientRegistry.warm_up(openai=True)
+
+        try:
+            await asyncio.gather(self._recovery_loop(), *(self._claim_loop(slot) for slot in range(self.concurrency)))
+        finally:
+            EpubParser.shutdown()
+            await ClientRegistry.close()
+            logger.info(f"Worker {self.worker_id} stopped")
+
+    async def _recover(self) -> None:
+        """Release expired leases"""
+        session = SessionLocal()
+        try:
+            requeued, exhausted = await self._job_queue(session).recover_abandoned()
+            for job in requeued:
+                logger.warning(f"Requeued abandoned job {job.id} for book {job.book_id} (attempt {job.attempts}/{job.max_attempts})")
+            for job in exhausted:
+                logger.error(f"Giving up on job {job.id} for book {job.book_id} after {job.attempts} attempts")
+        except Exception as e:
+            logger.error(f"Error recovering book index jobs: {str(e)}")
+        finally:
+            session.close()
+
+    async def _recovery_loop(self) -> None:
+        """Periodically reclaim jobs abandoned by other workers"""
+        while not await self._wait_for_stop(self.visibility_timeout_seconds):
+            await self._recover()
+
+    async def _claim_loop(self, slot: int) -> None:
+        """Claim and run jobs one at a time until stopped"""
+        while not self._stop_event.is_set():
+            session = SessionLocal()
+            try:
+                job = await self._job_queue(session).claim(self.worker_id, self.visibility_timeout_seconds)
+                if job is not None:
+                    logger.info(f"[slot {slot}] Claimed job {job.id} for book {job.book_id} (attempt {job.attempts}/{job.max_attempts})")
+                    await self._process(job, session)
+            except Exception as e:
+                logger.error(f"[slot {slot}] Error processing book index job: {str(e)}")
+                job = None
+            finally:
+                session.close()
+
+            if job is None:
+                await self._wait_for_stop(self.poll_interval_seconds)
+
+    async def _process(self, job: BookIndexJob, session: Session) -> None:
+        """Index the stored EPUB of a claimed job while keeping its lease alive"""
+        job_queue = self._job_queue(session)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            book = BookRepositoryImpl(session=session, memory_service=MemoryService()).find_by_id(job.book_id)
+            if book is None:
+                # Deleted after the upload; there is nothing left to index
+                logger.info(f"Book {job.book_id} of job {job.id} no longer exists, skipping")
+            else:
+                object_name = self.gcs_client.get_object_name(book.file_path)
+                await CreateBookVectorIndexUseCaseImpl().execute_from_storage(object_name, book.user_id, book.id.value)
+        except Exception as e:
+            logger.error(f"Job {job.id} for book {job.book_id} failed: {str(e)}")
+            await job_queue.fail(job.id, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+        await job_queue.complete(job.id)
+        logger.info(f"Job {job.id} for book {job.book_id} succeeded")
+
+    async def _heartbeat(self, job: BookIndexJob) -> None:
+        """Extend the job lease at a third of the visibility timeout"""
+        interval = self.visibility_timeout_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            session = SessionLocal()
+            try:
+                if not await self._job_queue(session).extend_lease(job.id, self.worker_id, self.visibility_timeout_seconds):
+                    logger.warning(f"Lost lease on job {job.id}; another worker may pick it up")
+            except Exception as e:
+                logger.error(f"Error extending lease on job {job.id}: {str(e)}")
+            finally:
+                session.close()
+
+    async def _wait_for_stop(self, seconds: float) -> bool:
+        """Sleep up to the given seconds; True if the worker was asked to stop"""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        return self._stop_event.is_set()
+
+    def _job_queue(self, session: Session) -> BookIndexJobQueueImpl:
+        return BookIndexJobQueueImpl(session=session, max_attempts=self.max_attempts)
+
+
+def main() -> None:
+    init_db()
+    asyncio.run(BookIndexWorker(AppConfig.get_config()).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
-from typing import Self
+import os
+import tempfile
+from typing import Literal, Self
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -13,7 +15,62 @@ class AppConfig(BaseSettings):
     gcp_project_id: str = Field(default="bookwith", description="Google Cloud Project ID")
     gcs_bucket_name: str = Field(default="bookwith-bucket", description="GCS bucket name")
     gemini_api_key: str | None = Field(default=None, description="Gemini API Key")
+    gemini_rate_limit_tier: Literal["free", "tier1", "tier2", "tier3"] = Field(
+        default="free", description="Gemini APIの利用ティア（レート制限の既定値）"
+    )
+    gemini_requests_per_minute: int | None = Field(default=None, ge=1, description="Gemini APIの1分あたりリクエスト数上限（ティアの既定値を上書き）")
+    gemini_tokens_per_minute: int | None = Field(default=None, ge=1, description="Gemini APIの1分あたりトークン数上限（ティアの既定値を上書き）")
     openai_api_key: str = Field(min_length=1, description="OpenAI API Key")
+    epub_parser_max_workers: int = Field(default=2, ge=1, description="EPUB解析ワーカープロセス数")
+    epub_parser_memory_limit_mb: int = Field(default=1536, ge=256, description="EPUB解析ワーカー1プロセスあたりのメモリ上限（MB）")
+    epub_parser_timeout_seconds: float = Field(default=120.0, gt=0, description="EPUB解析1タスクあたりのタイムアウト（秒）")
+    epub_parser_max_tasks_per_child: int = Field(default=20, ge=1, description="EPUB解析ワーカーを再起動するまでのタスク数")
+    audio_processor_max_workers: int = Field(default=1, ge=1, description="音声処理ワーカープロセス数")
+    audio_processor_memory_limit_mb: int = Field(default=2048, ge=256, description="音声処理ワーカー1プロセスあたりのメモリ上限（MB）")
+    audio_processor_timeout_seconds: float = Field(default=600.0, gt=0, description="音声処理1タスクあたりのタイムアウト（秒）")
+    audio_processor_max_tasks_per_child: int = Field(default=10, ge=1, description="音声処理ワーカーを再起動するまでのタスク数")
+    audio_processor_max_pending_tasks: int = Field(default=4, ge=1, description="音声処理の実行中・待機中タスク数の上限")
+    podcast_worker_concurrency: int = Field(default=2, ge=1, description="ポッドキャスト生成ワーカーの同時実行数")
+    podcast_job_visibility_timeout_seconds: float = Field(default=600.0, gt=0, description="ポッドキャスト生成ジョブのロック有効期間（秒）")
+    podcast_job_max_attempts: int = Field(default=3, ge=1, description="ポッドキャスト生成ジョブの最大試行回数")
+    podcast_segmented_output: bool = Field(default=False, description="ポッドキャスト音声を合成済みのセグメントから順に公開するか")
+    podcast_streaming_script: bool = Field(default=False, description="台本をストリーミング生成し、届いた発話から音声合成を始めるか")
+    podcast_translate_scripts: bool = Field(default=False, description="同じ本の他言語の台本があれば、生成し直さず翻訳して使うか")
+    podcast_worker_poll_interval_seconds: float = Field(default=2.0, gt=0, description="ポッドキャスト生成ワーカーのジョブ取得間隔（秒）")
+    podcast_status_stream_interval_seconds: float = Field(
+        default=15.0, gt=0, description="ポッドキャスト状態ストリームが変更通知なしでも状態を確認し直す間隔（秒）"
+    )
+    podcast_status_stream_heartbeat_seconds: float = Field(default=15.0, gt=0, description="状態ストリームのハートビート間隔（秒）")
+    book_index_worker_concurrency: int = Field(default=2, ge=1, description="書籍インデックス作成ワーカーの同時実行数")
+    book_index_job_visibility_timeout_seconds: float = Field(default=600.0, gt=0, description="書籍インデックス作成ジョブのロック有効期間（秒）")
+    book_index_job_max_attempts: int = Field(default=3, ge=1, description="書籍インデックス作成ジョブの最大試行回数")
+    book_index_worker_poll_interval_seconds: float = Field(default=2.0, gt=0, description="書籍インデックス作成ワーカーのジョブ取得間隔（秒）")
+    tts_cache_dir: str = Field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "bookwith", "tts_cache"), description="合成済み音声キャッシュのディレクトリ"
+    )
+    tts_cache_max_mb: int = Field(default=1024, ge=0, description="合成済み音声キャッシュの容量上限（MB、0で無効）")
+    book_file_cache_dir: str = Field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "bookwith", "book_cache"),
+        description="書籍ファイルと解析結果のキャッシュのディレクトリ",
+    )
+    openai_max_connections: int = Field(default=100, ge=1, description="OpenAI APIへの同時接続数の上限")
+    openai_max_keepalive_connections: int = Field(default=20, ge=0, description="OpenAI APIへの接続のうちキープアライブで保持する数")
+    openai_keepalive_expiry_seconds: float = Field(default=60.0, gt=0, description="OpenAI APIへの未使用接続を保持する時間（秒）")
+    gemini_cache_dir: str = Field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "bookwith", "gemini_cache"),
+        description="Gemini APIの応答キャッシュのディレクトリ",
+    )
+    gemini_cache_max_mb: int = Field(default=256, ge=0, description="Gemini APIの応答キャッシュの容量上限（MB、0で無効）")
+    gemini_cache_ttl_seconds: float = Field(default=7 * 24 * 3600, gt=0, description="Gemini APIの応答キャッシュの有効期間（秒）")
+    book_file_cache_max_mb: int = Field(default=2048, ge=0, description="書籍ファイルと解析結果のキャッシュの容量上限（MB、0で無効）")
+    openai_chat_requests_per_minute: int = Field(default=500, ge=1, description="OpenAIチャットモデルの1分あたりリクエスト数上限")
+    openai_chat_tokens_per_minute: int = Field(default=30_000, ge=1, description="OpenAIチャットモデルの1分あたりトークン数上限")
+    openai_embedding_requests_per_minute: int = Field(default=3_000, ge=1, description="OpenAI埋め込みモデルの1分あたりリクエスト数上限")
+    openai_embedding_tokens_per_minute: int = Field(default=1_000_000, ge=1, description="OpenAI埋め込みモデルの1分あたりトークン数上限")
+    llm_interactive_reserve_ratio: float = Field(
+        default=0.2, ge=0, lt=1, description="対話的な呼び出しが続く間、バックグラウンドの呼び出しに使わせないレート制限枠の割合"
+    )
+    llm_interactive_window_seconds: float = Field(default=30.0, ge=0, description="最後の対話的な呼び出しから、レート制限枠の予約を続ける時間（秒）")
 
     @classmethod
     def get_config(cls) -> Self:
@@ -0,0 +1,30 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.book.value_objects.book_id import BookId
+
+
+class BookIndexJobStatus(str, Enum):
+    """書籍インデックス作成ジョブの状態"""
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class BookIndexJob(BaseModel):
+    """保存済みEPUBのベクトルインデックス作成を依頼するジョブ"""
+
+    id: str
+    book_id: BookId
+    status: BookIndexJobStatus
+    attempts: int = 0
+    max_attempts: int
+    locked_by: str | None = None
+    locked_until: datetime | None = None
+    last_error: str | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
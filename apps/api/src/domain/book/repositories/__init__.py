@@ -1,3 +1,4 @@
+from src.domain.book.repositories.book_index_job_queue import BookIndexJobQueue
 from src.domain.book.repositories.book_repository import BookRepository
 
-__all__ = ["BookRepository"]
+__all__ = ["BookIndexJobQueue", "BookRepository"]
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+from src.domain.book.entities.book_index_job import BookIndexJob
+from src.domain.book.value_objects.book_id import BookId
+
+
+class BookIndexJobQueue(ABC):
+    """APIとインデックス作成ワーカーが共有する、書籍インデックス作成ジョブの永続キュー"""
+
+    @abstractmethod
+    async def enqueue(self, book_id: BookId) -> BookIndexJob:
+        """書籍のインデックス作成ジョブを登録する（待機中・実行中のジョブがあればそれを返す）"""
+
+    @abstractmethod
+    async def claim(self, worker_id: str, visibility_timeout_seconds: float) -> BookIndexJob | None:
+        """最も古い待機中のジョブを、ロック有効期間が切れるまでこのワーカーに割り当てる"""
+
+    @abstractmethod
+    async def extend_lease(self, job_id: str, worker_id: str, visibility_timeout_seconds: float) -> bool:
+        """実行中のジョブのロックを延長する（ロックを失っていればFalse）"""
+
+    @abstractmethod
+    async def complete(self, job_id: str) -> None:
+        """ジョブを成功にする"""
+
+    @abstractmethod
+    async def fail(self, job_id: str, error_message: str) -> None:
+        """ジョブを失敗にする"""
+
+    @abstractmethod
+    async def recover_abandoned(self) -> tuple[list[BookIndexJob], list[BookIndexJob]]:
+        """ロック有効期間が切れた実行中のジョブを解放する
+
+        Returns:
+            (待機状態に戻したジョブ, 試行回数を使い切って失敗にしたジョブ)
+
+        """
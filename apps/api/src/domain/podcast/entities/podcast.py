@@ -7,7 +7,9 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 from src.domain.book.value_objects.book_id import BookId
 from src.domain.chat.value_objects.user_id import UserId
 from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.domain.podcast.value_objects.podcast_audio_segment import PodcastAudioSegment
 from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.domain.podcast.value_objects.podcast_progress import PodcastProgress
 from src.domain.podcast.value_objects.podcast_script import PodcastScript
 from src.domain.podcast.value_objects.podcast_status import PodcastStatus
 
@@ -22,8 +24,10 @@ class Podcast(BaseModel):
     status: PodcastStatus
     language: PodcastLanguage = PodcastLanguage.EN_US
     audio_url: str | None = None
+    audio_segments: list[PodcastAudioSegment] = Field(default_factory=list)
     script: PodcastScript | None = None
     error_message: str | None = None
+    progress: PodcastProgress | None = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
@@ -35,6 +39,8 @@ class Podcast(BaseModel):
             UserId: lambda x: x.value,
             PodcastStatus: lambda x: str(x),
             PodcastScript: lambda x: x.to_list() if x else None,
+            PodcastAudioSegment: lambda x: x.to_dict(),
+            PodcastProgress: lambda x: {"stage": x.stage.value, "current": x.current, "total": x.total},
         },
     )
 
@@ -57,6 +63,8 @@ class Podcast(BaseModel):
             self.audio_url = audio_url
         if error_message is not None:
             self.error_message = error_message
+        if not status.is_processing():
+            self.progress = None
         self.updated_at = datetime.now(UTC)
 
     def set_script(self, script: PodcastScript) -> None:
@@ -64,6 +72,18 @@ class Podcast(BaseModel):
         self.script = script
         self.updated_at = datetime.now(UTC)
 
+    def set_progress(self, progress: PodcastProgress | None) -> None:
+        """Set the current generation stage"""
+        self.progress = progress
+        self.updated_at = datetime.now(UTC)
+
+    def add_audio_segment(self, segment: PodcastAudioSegment) -> None:
+        """Append a published audio segment to the playback manifest"""
+        if segment.index != len(self.audio_segments):
+            raise ValueError(f"Expected audio segment {len(self.audio_segments)}, got {segment.index}")
+        self.audio_segments.append(segment)
+        self.updated_at = datetime.now(UTC)
+
     def mark_as_processing(self) -> None:
         """Mark podcast as processing"""
         self.update_status(PodcastStatus.processing())
@@ -0,0 +1,28 @@
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.domain.podcast.value_objects.podcast_audio_segment import PodcastAudioSegment
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.domain.podcast.value_objects.podcast_script import PodcastScript
+
+
+class PodcastArtifact(BaseModel):
+    """Canonical output of podcast generation for one book content, language and config version
+
+    Shared by every user who generates a podcast for the same book, so the
+    pipeline runs once per edition rather than once per user.
+    """
+
+    key: str
+    book_hash: str
+    language: PodcastLanguage
+    config_version: str
+    script: PodcastScript
+    audio_url: str
+    audio_segments: list[PodcastAudioSegment] = Field(default_factory=list)
+    source_podcast_id: PodcastId | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -0,0 +1,34 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+
+
+class PodcastJobStatus(str, Enum):
+    """Lifecycle states of a podcast generation job"""
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class PodcastJob(BaseModel):
+    """A queued request to generate audio for a podcast"""
+
+    id: str
+    podcast_id: PodcastId
+    status: PodcastJobStatus
+    attempts: int = 0
+    max_attempts: int
+    locked_by: str | None = None
+    locked_until: datetime | None = None
+    last_error: str | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def has_attempts_left(self) -> bool:
+        """Whether the job may be picked up again after an abandoned attempt"""
+        return self.attempts < self.max_attempts
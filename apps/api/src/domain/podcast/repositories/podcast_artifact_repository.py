@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from src.domain.podcast.entities.podcast_artifact import PodcastArtifact
+
+
+class PodcastArtifactRepository(ABC):
+    """Repository interface for canonical podcast artifacts shared across users"""
+
+    @abstractmethod
+    async def find_by_key(self, key: str) -> PodcastArtifact | None:
+        """Find the artifact generated for a book content, language and config version"""
+
+    @abstractmethod
+    async def find_by_book_hash(self, book_hash: str, config_version: str) -> list[PodcastArtifact]:
+        """Find the artifacts generated for a book content and config version, in every language"""
+
+    @abstractmethod
+    async def save(self, artifact: PodcastArtifact) -> None:
+        """Save an artifact (the first one saved for a key is kept)"""
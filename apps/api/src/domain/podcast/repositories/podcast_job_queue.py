@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+
+from src.domain.podcast.entities.podcast_job import PodcastJob
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+
+
+class PodcastJobQueue(ABC):
+    """Durable queue of podcast generation jobs shared by API and worker processes"""
+
+    @abstractmethod
+    async def enqueue(self, podcast_id: PodcastId) -> PodcastJob:
+        """Queue a generation job for the podcast (no-op if one is already queued or running)"""
+
+    @abstractmethod
+    async def claim(self, worker_id: str, visibility_timeout_seconds: float) -> PodcastJob | None:
+        """Lock the oldest queued job for this worker until the visibility timeout expires"""
+
+    @abstractmethod
+    async def extend_lease(self, job_id: str, worker_id: str, visibility_timeout_seconds: float) -> bool:
+        """Push back the visibility timeout of a running job; False if the worker lost the lock"""
+
+    @abstractmethod
+    async def complete(self, job_id: str) -> None:
+        """Mark a job as succeeded"""
+
+    @abstractmethod
+    async def fail(self, job_id: str, error_message: str) -> None:
+        """Mark a job as failed"""
+
+    @abstractmethod
+    async def has_active_job(self, podcast_id: PodcastId) -> bool:
+        """Whether the podcast has a queued or running job"""
+
+    @abstractmethod
+    async def recover_abandoned(self) -> tuple[list[PodcastJob], list[PodcastJob]]:
+        """Release running jobs whose visibility timeout expired
+
+        Returns:
+            (jobs put back in the queue, jobs failed because they ran out of attempts)
+
+        """
@@ -1,10 +1,15 @@
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 
 from src.domain.book.value_objects.book_id import BookId
 from src.domain.chat.value_objects.user_id import UserId
 from src.domain.podcast.entities.podcast import Podcast
+from src.domain.podcast.value_objects.podcast_audio_segment import PodcastAudioSegment
 from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.domain.podcast.value_objects.podcast_progress import PodcastProgress
 from src.domain.podcast.value_objects.podcast_status import PodcastStatus
+from src.domain.podcast.value_objects.podcast_status_view import PodcastStatusView
 
 
 class PodcastRepository(ABC):
@@ -18,6 +23,14 @@ class PodcastRepository(ABC):
     async def find_by_id(self, podcast_id: PodcastId) -> Podcast | None:
         """Find a podcast by its ID"""
 
+    @abstractmethod
+    async def find_status_view(self, podcast_id: PodcastId) -> PodcastStatusView | None:
+        """Find the generation state of a podcast without loading its script"""
+
+    @abstractmethod
+    def watch_status_changes(self, podcast_id: PodcastId) -> AbstractContextManager[asyncio.Event]:
+        """Event set whenever the status view of a podcast changes, while the context is open"""
+
     @abstractmethod
     async def find_by_book_id(self, book_id: BookId) -> list[Podcast]:
         """Find all podcasts for a specific book"""
@@ -40,6 +53,14 @@ class PodcastRepository(ABC):
     ) -> None:
         """Update podcast status and optionally audio_url or error_message"""
 
+    @abstractmethod
+    async def update_progress(self, podcast_id: PodcastId, progress: PodcastProgress | None) -> None:
+        """Record the current generation stage of a podcast (None clears it)"""
+
+    @abstractmethod
+    async def update_audio_segments(self, podcast_id: PodcastId, audio_segments: list[PodcastAudioSegment]) -> None:
+        """Replace the published audio segments of a podcast"""
+
     @abstractmethod
     async def delete(self, podcast_id: PodcastId) -> None:
         """Delete a podcast by its ID"""
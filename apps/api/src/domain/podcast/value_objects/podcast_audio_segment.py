@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TypedDict
+
+
+class PodcastAudioSegmentDict(TypedDict):
+    index: int
+    url: str
+    duration_seconds: float
+
+
+@dataclass(frozen=True)
+class PodcastAudioSegment:
+    """One published piece of a podcast's audio, playable as soon as it is uploaded"""
+
+    index: int
+    url: str
+    duration_seconds: float
+
+    def __post_init__(self) -> None:
+        if self.index < 0:
+            raise ValueError("index must not be negative")
+        if not self.url:
+            raise ValueError("url must be a non-empty string")
+        if self.duration_seconds < 0:
+            raise ValueError("duration_seconds must not be negative")
+
+    def to_dict(self) -> PodcastAudioSegmentDict:
+        return {"index": self.index, "url": self.url, "duration_seconds": self.duration_seconds}
+
+    @classmethod
+    def from_dict(cls, data: PodcastAudioSegmentDict) -> PodcastAudioSegment:
+        return cls(index=data["index"], url=data["url"], duration_seconds=data["duration_seconds"])
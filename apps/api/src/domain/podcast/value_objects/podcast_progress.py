@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class PodcastGenerationStage(str, Enum):
+    EXTRACTING = "EXTRACTING"
+    SUMMARIZING = "SUMMARIZING"
+    SCRIPTING = "SCRIPTING"
+    TRANSLATING = "TRANSLATING"
+    SYNTHESIZING = "SYNTHESIZING"
+    ENCODING = "ENCODING"
+    UPLOADING = "UPLOADING"
+
+
+@dataclass(frozen=True)
+class PodcastProgress:
+    """Current stage of podcast generation, with n of m steps done when the stage is countable"""
+
+    stage: PodcastGenerationStage
+    current: int | None = None
+    total: int | None = None
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.stage, PodcastGenerationStage):
+            raise ValueError("stage must be a PodcastGenerationStage instance")
+        if (self.current is None) != (self.total is None):
+            raise ValueError("current and total must be given together")
+        if self.current is not None and self.total is not None and not 0 <= self.current <= self.total:
+            raise ValueError("current must be between 0 and total")
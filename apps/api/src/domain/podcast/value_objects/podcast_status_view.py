@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from .language import PodcastLanguage
+from .podcast_audio_segment import PodcastAudioSegment
+from .podcast_id import PodcastId
+from .podcast_progress import PodcastProgress
+from .podcast_status import PodcastStatus
+
+
+@dataclass(frozen=True)
+class PodcastStatusView:
+    """Lightweight read model of a podcast's generation state (the script itself is never loaded)"""
+
+    id: PodcastId
+    book_id: str
+    user_id: str
+    title: str
+    language: PodcastLanguage
+    status: PodcastStatus
+    created_at: datetime
+    updated_at: datetime
+    audio_url: str | None = None
+    error_message: str | None = None
+    progress: PodcastProgress | None = None
+    script_turn_count: int | None = None
+    script_character_count: int | None = None
+    audio_segments: list[PodcastAudioSegment] = field(default_factory=list)
+
+    def is_finished(self) -> bool:
+        """Whether generation has ended and the view will not change on its own"""
+        return self.status.is_completed() or self.status.is_failed()
@@ -0,0 +1,101 @@
+"""書籍ファイルと解析結果のローカルディスクキャッシュ."""
+
+import logging
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+from src.config.app_config import AppConfig
+from src.infrastructure.disk_cache import DiskCache, cache_key
+
+if TYPE_CHECKING:
+    from src.infrastructure.external.gcs import GCSClient
+
+logger = logging.getLogger(__name__)
+
+
+class BookFileCache:
+    """ストレージ上の書籍ファイルとその解析結果を、内容のハッシュ単位でローカルディスクに保持するキャッシュ.
+
+    - キーはストレージが持つMD5のため、同じEPUBであれば別の書籍・別のアップロードでも共有される
+    - ポッドキャスト生成とインデックス作成のワーカーが同じディレクトリを共有し、同じ本を何度もダウンロード・解析しない
+    - 呼び出し側にはハードリンク（別ファイルシステムならコピー）を渡すため、使用中に追い出されても影響しない
+    """
+
+    _shared: "BookFileCache | None" = None
+
+    @classmethod
+    def get_shared(cls) -> "BookFileCache":
+        """プロセス共通のキャッシュを取得する（容量上限が0なら何も保持しない）."""
+        if cls._shared is None:
+            config = AppConfig.get_config()
+            max_bytes = config.book_file_cache_max_mb * 1024 * 1024
+            cls._shared = cls(DiskCache(config.book_file_cache_dir, max_bytes) if max_bytes > 0 else None)
+        return cls._shared
+
+    def __init__(self, disk_cache: DiskCache | None) -> None:
+        """書籍ファイルキャッシュの初期化."""
+        self.disk_cache = disk_cache
+
+    def download_to_file(self, gcs_client: "GCSClient", object_name: str, destination_path: str, content_hash: str | None = None) -> str | None:
+        """オブジェクトの内容をdestination_pathに用意し、内容のハッシュを返す.
+
+        キャッシュにあればネットワークを使わずにリンクし、なければストレージからキャッシュへ
+        チャンク単位で直接ダウンロードしてからリンクする.
+
+        Args:
+            gcs_client: 読み出しに使うストレージクライアント
+            object_name: ストレージ上のオブジェクト名
+            destination_path: 書き出し先のパス
+            content_hash: 既知であればオブジェクトのMD5（省略時はメタデータから取得する）
+
+        Returns:
+            内容のハッシュ（ストレージがMD5を持たない場合はNone）
+
+        """
+        if self.disk_cache is None:
+            gcs_client.download_to_file(object_name, destination_path)
+            return content_hash
+
+        content_hash = content_hash or gcs_client.get_object_md5(object_name)
+        if content_hash is None:
+            gcs_client.download_to_file(object_name, destination_path)
+            return None
+
+        key = cache_key("book_file", content_hash)
+        cached_path = self.disk_cache.get_path(key)
+        if cached_path is not None and self._link(cached_path, destination_path):
+            logger.info(f"キャッシュ済みの書籍ファイルを使用します: {object_name}")
+            return content_hash
+
+        cached_path = self.disk_cache.set_file(key, lambda temp_path: gcs_client.download_to_file(object_name, temp_path))
+        if cached_path is None or not self._link(cached_path, destination_path):
+            # 容量上限を超えた、または直後に追い出されたためキャッシュを経由できない
+            gcs_client.download_to_file(object_name, destination_path)
+        return content_hash
+
+    def get_artifact(self, content_hash: str, name: str) -> bytes | None:
+        """書籍ファイルから作った解析結果を取得する（存在しなければNone）."""
+        if self.disk_cache is None:
+            return None
+        return self.disk_cache.get(cache_key("artifact", content_hash, name))
+
+    def set_artifact(self, content_hash: str, name: str, data: bytes) -> None:
+        """書籍ファイルから作った解析結果を保存する."""
+        if self.disk_cache is not None:
+            self.disk_cache.set(cache_key("artifact", content_hash, name), data)
+
+    @staticmethod
+    def _link(source_path: str, destination_path: str) -> bool:
+        """キャッシュ上のファイルをリンクし、できなければコピーする（既に追い出されていればFalse）."""
+        try:
+            os.link(source_path, destination_path)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # 別のファイルシステムなどでハードリンクを作れない
+            try:
+                shutil.copyfile(source_path, destination_path)
+            except FileNotFoundError:
+                return False
+        return True
@@ -0,0 +1,155 @@
+"""外部APIクライアントのプロセス共有レジストリ."""
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from typing import ClassVar
+
+import httpx
+
+from src.config.app_config import AppConfig
+from src.infrastructure.external.cloud_tts.tts_client import CloudTTSClient
+from src.infrastructure.external.gemini import GeminiClient
+from src.infrastructure.openai_rate_limits import RateLimitedChatOpenAI, RateLimitedOpenAIEmbeddings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHAT_MODEL = "gpt-4o"
+EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+# OpenAI SDKの既定値に合わせる（ストリーミング応答は長時間になりうる）
+OPENAI_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+class ClientRegistry:
+    """LLM・埋め込み・音声合成のクライアントをプロセス内で共有するレジストリ.
+
+    - リクエストごとのクライアント生成（設定の検証、モデルの構築、gRPCチャネルの作成）をなくす
+    - OpenAIへのHTTP接続はキープアライブのコネクションプールで使い回し、TLSハンドシェイクを初回だけにする
+    - 起動時のwarm_upで生成と接続を済ませ、最初のリクエストが待たされないようにする
+    - OpenAIのモデルは呼び出しごとにプロセス共通のレート制限の枠を取得する
+    """
+
+    _http_client: httpx.Client | None = None
+    _async_http_client: httpx.AsyncClient | None = None
+    _chat_models: ClassVar[dict[tuple[str, bool], RateLimitedChatOpenAI]] = {}
+    _embedding_model: RateLimitedOpenAIEmbeddings | None = None
+    _gemini_client: GeminiClient | None = None
+    _tts_client: CloudTTSClient | None = None
+
+    @classmethod
+    def _limits(cls) -> httpx.Limits:
+        config = AppConfig.get_config()
+        return httpx.Limits(
+            max_connections=config.openai_max_connections,
+            max_keepalive_connections=config.openai_max_keepalive_connections,
+            keepalive_expiry=config.openai_keepalive_expiry_seconds,
+        )
+
+    @classmethod
+    def get_http_client(cls) -> httpx.Client:
+        """OpenAIの同期呼び出しで共有するHTTPクライアントを取得する."""
+        if cls._http_client is None:
+            cls._http_client = httpx.Client(limits=cls._limits(), timeout=OPENAI_TIMEOUT)
+        return cls._http_client
+
+    @classmethod
+    def get_async_http_client(cls) -> httpx.AsyncClient:
+        """OpenAIの非同期呼び出しで共有するHTTPクライアントを取得する."""
+        if cls._async_http_client is None:
+            cls._async_http_client = httpx.AsyncClient(limits=cls._limits(), timeout=OPENAI_TIMEOUT)
+        return cls._async_http_client
+
+    @classmethod
+    def get_chat_model(cls, model: str = DEFAULT_CHAT_MODEL, streaming: bool = False) -> RateLimitedChatOpenAI:
+        """共有のチャットモデルを取得する（モデル名とストリーミング有無ごとに1つ）."""
+        key = (model, streaming)
+        if key not in cls._chat_models:
+            cls._chat_models[key] = RateLimitedChatOpenAI(
+                model_name=model,
+                streaming=streaming,
+                # 独自のHTTPクライアントを渡すと既定で有効にならないため、ストリーミングでも使用量を受け取るよう明示する
+                stream_usage=True,
+                http_client=cls.get_http_client(),
+                http_async_client=cls.get_async_http_client(),
+            )
+        return cls._chat_models[key]
+
+    @classmethod
+    def get_embedding_model(cls) -> RateLimitedOpenAIEmbeddings:
+        """共有の埋め込みモデルを取得する."""
+        if cls._embedding_model is None:
+            cls._embedding_model = RateLimitedOpenAIEmbeddings(
+                model=EMBEDDING_MODEL,
+                max_retries=2,
+                http_client=cls.get_http_client(),
+                http_async_client=cls.get_async_http_client(),
+            )
+        return cls._embedding_model
+
+    @classmethod
+    def get_gemini_client(cls) -> GeminiClient:
+        """共有のGeminiクライアントを取得する."""
+        if cls._gemini_client is None:
+            cls._gemini_client = GeminiClient()
+        return cls._gemini_client
+
+    @classmethod
+    def get_tts_client(cls) -> CloudTTSClient:
+        """共有の音声合成クライアント（gRPCチャネルを1本だけ持つ）を取得する."""
+        if cls._tts_client is None:
+            cls._tts_client = CloudTTSClient()
+        return cls._tts_client
+
+    @classmethod
+    async def warm_up(cls, openai: bool = False, gemini: bool = False, tts: bool = False) -> None:
+        """指定したクライアントを生成し、接続を事前に確立する.
+
+        失敗しても起動は止めず、最初の利用時に改めて生成・接続する.
+        """
+        if openai:
+            await cls._warm_up_step("OpenAI", cls._warm_up_openai)
+        if gemini:
+            await cls._warm_up_step("Gemini", lambda: asyncio.to_thread(cls.get_gemini_client))
+        if tts:
+            await cls._warm_up_step("Text-to-Speech", lambda: asyncio.to_thread(cls._warm_up_tts))
+
+    @classmethod
+    async def _warm_up_step(cls, name: str, step: Callable[[], Awaitable[object]]) -> None:
+        try:
+            await step()
+            logger.info(f"{name} クライアントの準備が完了しました")
+        except Exception as e:
+            logger.warning(f"{name} クライアントの事前準備に失敗しました: {str(e)}")
+
+    @classmethod
+    async def _warm_up_openai(cls) -> None:
+        await asyncio.to_thread(cls.get_chat_model, DEFAULT_CHAT_MODEL, True)
+        await asyncio.to_thread(cls.get_chat_model)
+        await asyncio.to_thread(cls.get_embedding_model)
+        # 応答の内容は問わない。TLS接続をプールに残すことが目的
+        base_url = os.environ.get("OPENAI_BASE_URL") or DEFAULT_OPENAI_BASE_URL
+        await cls.get_async_http_client().head(base_url)
+
+    @classmethod
+    def _warm_up_tts(cls) -> None:
+        # 軽量なRPCでgRPCチャネルを接続しておく
+        cls.get_tts_client().client.list_voices(language_code="en-US")
+
+    @classmethod
+    async def close(cls) -> None:
+        """共有クライアントの接続を閉じる."""
+        if cls._async_http_client is not None:
+            await cls._async_http_client.aclose()
+        if cls._http_client is not None:
+            cls._http_client.close()
+        if cls._tts_client is not None:
+            cls._tts_client.client.transport.close()
+        cls._http_client = None
+        cls._async_http_client = None
+        cls._chat_models = {}
+        cls._embedding_model = None
+        cls._gemini_client = None
+        cls._tts_client = None
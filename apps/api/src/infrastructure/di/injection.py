@@ -1,18 +1,22 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from src.config.app_config import AppConfig
 from src.config.db import get_db
 from src.domain.annotation.repositories.annotation_repository import AnnotationRepository
+from src.domain.book.repositories.book_index_job_queue import BookIndexJobQueue
 from src.domain.book.repositories.book_repository import BookRepository
 from src.domain.chat.repositories.chat_repository import ChatRepository
 from src.domain.message.repositories.message_repository import MessageRepository
+from src.domain.podcast.repositories.podcast_artifact_repository import PodcastArtifactRepository
+from src.domain.podcast.repositories.podcast_job_queue import PodcastJobQueue
 from src.domain.podcast.repositories.podcast_repository import PodcastRepository
 from src.infrastructure.memory.memory_service import MemoryService
 from src.infrastructure.postgres.annotation.annotation_repository import AnnotationRepositoryImpl
-from src.infrastructure.postgres.book.book_repository import BookRepositoryImpl
+from src.infrastructure.postgres.book import BookIndexJobQueueImpl, BookRepositoryImpl
 from src.infrastructure.postgres.chat.chat_repository import ChatRepositoryImpl
 from src.infrastructure.postgres.message.message_repository import MessageRepositoryImpl
-from src.infrastructure.postgres.podcast import PodcastRepositoryImpl
+from src.infrastructure.postgres.podcast import PodcastArtifactRepositoryImpl, PodcastJobQueueImpl, PodcastRepositoryImpl
 from src.usecase.annotation.update_annotation_use_case import SyncAnnotationsUseCase, SyncAnnotationsUseCaseImpl
 from src.usecase.book.create_book_usecase import (
     CreateBookUseCase,
@@ -28,6 +32,10 @@ from src.usecase.book.delete_book_usecase import (
     DeleteBookUseCase,
     DeleteBookUseCaseImpl,
 )
+from src.usecase.book.finalize_book_upload_usecase import (
+    FinalizeBookUploadUseCase,
+    FinalizeBookUploadUseCaseImpl,
+)
 from src.usecase.book.find_book_by_id_usecase import (
     FindBookByIdUseCase,
     FindBookByIdUseCaseImpl,
@@ -38,10 +46,18 @@ from src.usecase.book.find_books_usecase import (
     FindBooksUseCase,
     FindBooksUseCaseImpl,
 )
+from src.usecase.book.reserve_book_upload_usecase import (
+    ReserveBookUploadUseCase,
+    ReserveBookUploadUseCaseImpl,
+)
 from src.usecase.book.update_book_usecase import (
     UpdateBookUseCase,
     UpdateBookUseCaseImpl,
 )
+from src.usecase.book.upload_book_usecase import (
+    UploadBookUseCase,
+    UploadBookUseCaseImpl,
+)
 from src.usecase.chat.create_chat_usecase import (
     CreateChatUseCase,
     CreateChatUseCaseImpl,
@@ -85,8 +101,8 @@ from src.usecase.message.find_messages_usecase import (
 from src.usecase.podcast.create_podcast_usecase import CreatePodcastUseCase
 from src.usecase.podcast.find_podcast_by_id_usecase import FindPodcastByIdUseCase
 from src.usecase.podcast.find_podcasts_by_book_id_usecase import FindPodcastsByBookIdUseCase
-from src.usecase.podcast.generate_podcast_usecase import GeneratePodcastUseCase
 from src.usecase.podcast.get_podcast_status_usecase import GetPodcastStatusUseCase
+from src.usecase.podcast.watch_podcast_status_usecase import WatchPodcastStatusUseCase
 
 # ==============================================================================
 # Book
@@ -103,6 +119,22 @@ def get_create_book_usecase(
     return CreateBookUseCaseImpl(book_repository)
 
 
+def get_upload_book_usecase(
+    book_repository: BookRepository = Depends(get_book_repository),
+) -> UploadBookUseCase:
+    return UploadBookUseCaseImpl(book_repository)
+
+
+def get_reserve_book_upload_usecase() -> ReserveBookUploadUseCase:
+    return ReserveBookUploadUseCaseImpl()
+
+
+def get_finalize_book_upload_usecase(
+    book_repository: BookRepository = Depends(get_book_repository),
+) -> FinalizeBookUploadUseCase:
+    return FinalizeBookUploadUseCaseImpl(book_repository)
+
+
 def get_find_books_usecase(
     book_repository: BookRepositoryImpl = Depends(get_book_repository),
 ) -> FindBooksUseCase:
@@ -148,6 +180,10 @@ def get_create_book_vector_index_usecase() -> CreateBookVectorIndexUseCase:
     return CreateBookVectorIndexUseCaseImpl()
 
 
+def get_book_index_job_queue(db: Session = Depends(get_db)) -> BookIndexJobQueue:
+    return BookIndexJobQueueImpl(session=db, max_attempts=AppConfig.get_config().book_index_job_max_attempts)
+
+
 # ==============================================================================
 # Chat
 # ==============================================================================
@@ -259,11 +295,20 @@ def get_podcast_repository(db: Session = Depends(get_db)) -> PodcastRepository:
     return PodcastRepositoryImpl(session=db)
 
 
+def get_podcast_artifact_repository(db: Session = Depends(get_db)) -> PodcastArtifactRepository:
+    return PodcastArtifactRepositoryImpl(session=db)
+
+
+def get_podcast_job_queue(db: Session = Depends(get_db)) -> PodcastJobQueue:
+    return PodcastJobQueueImpl(session=db, max_attempts=AppConfig.get_config().podcast_job_max_attempts)
+
+
 async def get_create_podcast_usecase(
     podcast_repository: PodcastRepository = Depends(get_podcast_repository),
     book_repository: BookRepository = Depends(get_book_repository),
+    artifact_repository: PodcastArtifactRepository = Depends(get_podcast_artifact_repository),
 ) -> CreatePodcastUseCase:
-    return CreatePodcastUseCase(podcast_repository, book_repository)
+    return CreatePodcastUseCase(podcast_repository, book_repository, artifact_repository)
 
 
 async def get_find_podcast_by_id_usecase(
@@ -284,11 +329,7 @@ async def get_podcast_status_usecase(
     return GetPodcastStatusUseCase(podcast_repository)
 
 
-async def get_generate_podcast_usecase(
+async def get_watch_podcast_status_usecase(
     podcast_repository: PodcastRepository = Depends(get_podcast_repository),
-    book_repository: BookRepository = Depends(get_book_repository),
-) -> GeneratePodcastUseCase:
-    return GeneratePodcastUseCase(
-        podcast_repository=podcast_repository,
-        book_repository=book_repository,
-    )
+) -> WatchPodcastStatusUseCase:
+    return WatchPodcastStatusUseCase(podcast_repository)
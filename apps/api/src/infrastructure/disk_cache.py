@@ -0,0 +1,163 @@
+"""サイズ上限付きのコンテンツアドレス型ディスクキャッシュ."""
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# 上限超過時はこの割合まで削減し、書き込みのたびに削除が走らないようにする
+EVICTION_TARGET_RATIO = 0.9
+
+
+def cache_key(*parts: str | int | float) -> str:
+    """値の組から安定したキャッシュキー（SHA-256）を生成する."""
+    return hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """ファイル単位で値を保存し、合計サイズが上限を超えたら最終アクセスの古い順に削除するキャッシュ.
+
+    - 書き込みは一時ファイル経由の置き換えで行うため、複数プロセスで同じディレクトリを共有できる
+    - 読み込み時に更新日時を更新し、LRUの順序として使う
+    - キャッシュの失敗は呼び出し側を失敗させず、ミスとして扱う
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """ディスクキャッシュの初期化."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def _path(self, key: str) -> str:
+        # 1ディレクトリのファイル数が増えすぎないよう先頭2文字で分散する
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> bytes | None:
+        """キャッシュされた値を取得する（存在しなければNone）."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"キャッシュの読み込みに失敗しました ({key}): {str(e)}")
+            return None
+
+    def get_path(self, key: str) -> str | None:
+        """キャッシュされたファイルのパスを取得する（存在しなければNone）.
+
+        返したパスは後続の書き込みで削除されうるため、使い続ける場合は呼び出し側でリンクかコピーを取る.
+        """
+        path = self._path(key)
+        try:
+            os.utime(path)
+            return path
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"キャッシュの読み込みに失敗しました ({key}): {str(e)}")
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """値を保存し、必要なら古いエントリを削除する."""
+        if len(data) > self.max_bytes:
+            return
+
+        def write(temp_path: str) -> None:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+
+        self.set_file(key, write)
+
+    def set_file(self, key: str, fill: Callable[[str], None]) -> str | None:
+        """fillに一時ファイルのパスを渡して内容を書き込ませ、エントリとして保存する.
+
+        大きなファイルをメモリに載せずにストリーミングで保存するために使う.
+        fillのOSError以外の例外はそのまま送出し、いずれの場合も書き込み途中のファイルは残さない.
+
+        Returns:
+            保存したファイルのパス（上限を超える、または書き込みに失敗した場合はNone）
+
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            os.close(fd)
+        except OSError as e:
+            logger.warning(f"キャッシュの書き込みに失敗しました ({key}): {str(e)}")
+            return None
+
+        try:
+            fill(temp_path)
+            size = os.path.getsize(temp_path)
+            if size > self.max_bytes:
+                os.unlink(temp_path)
+                return None
+            os.replace(temp_path, path)
+        except OSError as e:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            logger.warning(f"キャッシュの書き込みに失敗しました ({key}): {str(e)}")
+            return None
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return path
+
+    def _entries(self) -> list[tuple[str, int, float]]:
+        """保存済みエントリの (パス, サイズ, 更新日時) 一覧."""
+        entries: list[tuple[str, int, float]] = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # 他プロセスが削除した
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _scan_total_bytes(self) -> int:
+        return sum(size for _path, size, _mtime in self._entries())
+
+    def _evict(self) -> None:
+        """他プロセスの書き込みも含めて実サイズを数え直し、古い順に削除する."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _path, size, _mtime in entries)
+        target = int(self.max_bytes * EVICTION_TARGET_RATIO)
+        removed = 0
+        for path, size, _mtime in entries:
+            if total <= target:
+                break
+            # 他プロセスが先に削除していてもよい
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        logger.info(f"キャッシュから {removed} 件を削除しました (合計 {total / 1024 / 1024:.1f} MB)")
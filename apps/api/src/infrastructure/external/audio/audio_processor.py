@@ -1,114 +1,212 @@
+import asyncio
 import io
 import logging
+import os
+import subprocess
+import tempfile
+import wave
 from pathlib import Path
 
+import numpy as np
 from pydub import AudioSegment
 
 from src.config.app_config import AppConfig
+from src.infrastructure.process_pool import IsolatedProcessPool
 
 logger = logging.getLogger(__name__)
 
-
-class AudioProcessor:
-    """Service for processing and combining audio files"""
-
-    def __init__(self) -> None:
-        self.config = AppConfig.get_config()
-        self.output_sample_rate = 44100
-        self.output_bitrate = "192k"
-
-    async def process_audio(self, audio_data: bytes | list[bytes], crossfade_ms: int = 0) -> bytes:
-        """Process and combine audio data
-
-        Args:
-            audio_data: Single audio bytes or list of audio chunks
-            crossfade_ms: Milliseconds of crossfade between segments
-
-        Returns:
-            Processed audio in MP3 format
-
-        """
+# Text-to-Speech LINEAR16 output: 16-bit mono PCM
+PCM_SAMPLE_WIDTH = 2
+DEFAULT_PCM_SAMPLE_RATE = 24000
+
+
+# --- Tasks executed in the worker processes; audio is exchanged as files, not pickled bytes ---
+
+
+def _encode_segments_task(
+    segment_paths: list[str],
+    output_path: str,
+    output_sample_rate: int,
+    output_bitrate: str,
+    target_dBFS: float,  # noqa: N803
+    fade_in_ms: int,
+    fade_out_ms: int,
+) -> None:
+    """Pipe normalized PCM of every segment through a single ffmpeg MP3 encode"""
+    _samples, sample_rate = _decode_linear16(Path(segment_paths[0]).read_bytes())
+    log_path = f"{output_path}.log"
+    command = [
+        AudioSegment.converter,
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "s16le",
+        "-ar",
+        str(sample_rate),
+        "-ac",
+        "1",
+        "-i",
+        "pipe:0",
+        "-ar",
+        str(output_sample_rate),
+        "-b:a",
+        output_bitrate,
+        "-f",
+        "mp3",
+        "-y",
+        output_path,
+    ]
+    with open(log_path, "wb") as log_file:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=log_file)
+        assert process.stdin is not None
         try:
-            # Handle single audio vs multiple chunks
-            if isinstance(audio_data, bytes):
-                # Single audio file
-                audio_segment = AudioSegment.from_mp3(io.BytesIO(audio_data))
-                processed_audio = self._process_single_audio(audio_segment)
-            else:
-                # Multiple audio chunks to combine
-                processed_audio = self._combine_audio_chunks(audio_data, crossfade_ms)
+            for index, segment_path in enumerate(segment_paths):
+                samples, segment_rate = _decode_linear16(Path(segment_path).read_bytes())
+                if segment_rate != sample_rate:
+                    raise ValueError(f"Segment {index} has sample rate {segment_rate}, expected {sample_rate}")
+                samples = _normalize(samples, target_dBFS)
+                # Fade in/out for smooth listening
+                if index == 0:
+                    samples = _fade(samples, sample_rate * fade_in_ms // 1000, fade_in=True)
+                if index == len(segment_paths) - 1:
+                    samples = _fade(samples, sample_rate * fade_out_ms // 1000, fade_in=False)
+                process.stdin.write(samples.astype("<i2").tobytes())
+            process.stdin.close()
+            return_code = process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
 
-            # Export to bytes
-            output_buffer = io.BytesIO()
-            processed_audio.export(output_buffer, format="mp3", bitrate=self.output_bitrate, parameters=["-ar", str(self.output_sample_rate)])
+    if return_code != 0:
+        raise RuntimeError(f"ffmpeg exited with code {return_code}: {Path(log_path).read_text(errors='replace').strip()}")
 
-            return output_buffer.getvalue()
 
-        except Exception as e:
-            logger.error(f"Error processing audio: {str(e)}")
-            raise
+def _add_background_music_task(voice_path: str, music_path: str, output_path: str, music_volume: float, output_bitrate: str) -> None:
+    # Load voice audio
+    voice = AudioSegment.from_mp3(voice_path)
 
-    def _process_single_audio(self, audio: AudioSegment) -> AudioSegment:
-        """Process a single audio segment
+    # Load and process background music
+    music = AudioSegment.from_file(music_path)
 
-        Args:
-            audio: Audio segment to process
+    # Adjust music volume
+    music = music - (20 * (1 - music_volume))  # Reduce volume
 
-        Returns:
-            Processed audio segment
+    # Loop music if shorter than voice
+    if len(music) < len(voice):
+        music = music * (len(voice) // len(music) + 1)
 
-        """
-        # Convert sample rate if needed
-        if audio.frame_rate != self.output_sample_rate:
-            audio = audio.set_frame_rate(self.output_sample_rate)
+    # Trim music to match voice length
+    music = music[: len(voice)]
 
-        # Normalize audio levels
-        audio = self._normalize_audio(audio)
+    # Overlay music on voice
+    combined = voice.overlay(music)
+    combined.export(output_path, format="mp3", bitrate=output_bitrate)
 
-        # Add fade in/out for smooth listening
-        return audio.fade_in(500).fade_out(500)
 
-    def _combine_audio_chunks(self, audio_chunks: list[bytes], crossfade_ms: int) -> AudioSegment:
-        """Combine multiple audio chunks into one
+def _audio_info_task(audio_path: str) -> dict:
+    audio = AudioSegment.from_mp3(audio_path)
+    return {
+        "duration_seconds": len(audio) / 1000.0,
+        "frame_rate": audio.frame_rate,
+        "channels": audio.channels,
+        "sample_width": audio.sample_width,
+        "max_dBFS": audio.max_dBFS,
+        "dBFS": audio.dBFS,
+        "rms": audio.rms,
+    }
 
-        Args:
-            audio_chunks: List of audio data chunks
-            crossfade_ms: Crossfade duration between chunks
 
-        Returns:
-            Combined audio segment
+def _write_files(directory: str, name: str, chunks: list[bytes]) -> list[str]:
+    paths = []
+    for index, data in enumerate(chunks):
+        path = os.path.join(directory, f"{name}-{index:05d}")
+        with open(path, "wb") as f:
+            f.write(data)
+        paths.append(path)
+    return paths
 
-        """
-        if not audio_chunks:
-            raise ValueError("No audio chunks to combine")
-
-        # Load first chunk
-        combined = AudioSegment.from_mp3(io.BytesIO(audio_chunks[0]))
-        combined = self._normalize_audio(combined)
 
-        # Append remaining chunks
-        for chunk_data in audio_chunks[1:]:
-            chunk = AudioSegment.from_mp3(io.BytesIO(chunk_data))
-            chunk = self._normalize_audio(chunk)
+class AudioProcessor:
+    """Service for processing and combining audio files
+
+    Decoding, mixing and encoding run in an isolated worker process pool so the
+    CPU-heavy work never blocks the event loop. Submissions beyond the pool's
+    pending-task limit wait for a free slot instead of piling up.
+    """
+
+    _shared_pool: IsolatedProcessPool | None = None
+
+    @classmethod
+    def get_pool(cls) -> IsolatedProcessPool:
+        """Get the shared audio pool, creating it on first use"""
+        if cls._shared_pool is None:
+            config = AppConfig.get_config()
+            cls._shared_pool = IsolatedProcessPool(
+                name="audio-processor",
+                max_workers=config.audio_processor_max_workers,
+                memory_limit_mb=config.audio_processor_memory_limit_mb,
+                timeout_seconds=config.audio_processor_timeout_seconds,
+                max_tasks_per_child=config.audio_processor_max_tasks_per_child,
+                max_pending_tasks=config.audio_processor_max_pending_tasks,
+            )
+        return cls._shared_pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the worker processes"""
+        if cls._shared_pool is not None:
+            cls._shared_pool.shutdown()
+            cls._shared_pool = None
 
-            combined = combined.append(chunk, crossfade=crossfade_ms) if crossfade_ms > 0 else combined + chunk
+    def __init__(self) -> None:
+        self.config = AppConfig.get_config()
+        self.output_sample_rate = 44100
+        self.output_bitrate = "192k"
+        self.target_dBFS = -20.0
+        self.fade_ms = 1000
 
-        combined = combined.set_frame_rate(self.output_sample_rate)
-        return combined.fade_in(1000).fade_out(1000)
+    async def process_audio(self, segments: list[bytes], fade_in: bool = True, fade_out: bool = True) -> bytes:
+        """Normalize and join LINEAR16 speech segments, encoding the result to MP3 once
 
-    def _normalize_audio(self, audio: AudioSegment, target_dBFS: float = -20.0) -> AudioSegment:  # noqa: N803
-        """Normalize audio levels
+        Segments are decoded, level-normalized and streamed to the encoder one at
+        a time, so only a single segment is held in memory as PCM.
 
         Args:
-            audio: Audio segment to normalize
-            target_dBFS: Target decibels relative to full scale
+            segments: WAV (LINEAR16) audio segments in playback order
+            fade_in: Fade in at the start (off for parts that continue earlier audio)
+            fade_out: Fade out at the end (off for parts that later audio continues)
 
         Returns:
-            Normalized audio
+            Processed audio in MP3 format
 
         """
-        change_in_dBFS = target_dBFS - audio.dBFS  # noqa: N806
-        return audio.apply_gain(change_in_dBFS)
+        if not segments:
+            raise ValueError("No audio segments to process")
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="podcast-audio-") as work_dir:
+                segment_paths = await asyncio.to_thread(_write_files, work_dir, "segment", segments)
+                output_path = os.path.join(work_dir, "output.mp3")
+                await self.get_pool().run(
+                    _encode_segments_task,
+                    segment_paths,
+                    output_path,
+                    self.output_sample_rate,
+                    self.output_bitrate,
+                    self.target_dBFS,
+                    self.fade_ms if fade_in else 0,
+                    self.fade_ms if fade_out else 0,
+                )
+                return await asyncio.to_thread(Path(output_path).read_bytes)
+        except Exception as e:
+            logger.error(f"Error processing audio: {str(e)}")
+            raise
+
+    def get_duration_seconds(self, segments: list[bytes]) -> float:
+        """Playback length of LINEAR16 segments, read from their headers"""
+        return sum(_linear16_duration_seconds(segment) for segment in segments)
 
     async def add_background_music(self, voice_audio: bytes, music_path: str | None = None, music_volume: float = 0.1) -> bytes:
         """Add background music to voice audio
@@ -126,30 +224,11 @@ class AudioProcessor:
             return voice_audio
 
         try:
-            # Load voice audio
-            voice = AudioSegment.from_mp3(io.BytesIO(voice_audio))
-
-            # Load and process background music
-            music = AudioSegment.from_file(music_path)
-
-            # Adjust music volume
-            music = music - (20 * (1 - music_volume))  # Reduce volume
-
-            # Loop music if shorter than voice
-            if len(music) < len(voice):
-                music = music * (len(voice) // len(music) + 1)
-
-            # Trim music to match voice length
-            music = music[: len(voice)]
-
-            # Overlay music on voice
-            combined = voice.overlay(music)
-
-            # Export to bytes
-            output_buffer = io.BytesIO()
-            combined.export(output_buffer, format="mp3", bitrate=self.output_bitrate)
-
-            return output_buffer.getvalue()
+            with tempfile.TemporaryDirectory(prefix="podcast-audio-") as work_dir:
+                (voice_path,) = await asyncio.to_thread(_write_files, work_dir, "voice", [voice_audio])
+                output_path = os.path.join(work_dir, "output.mp3")
+                await self.get_pool().run(_add_background_music_task, voice_path, music_path, output_path, music_volume, self.output_bitrate)
+                return await asyncio.to_thread(Path(output_path).read_bytes)
 
         except Exception as e:
             logger.error(f"Error adding background music: {str(e)}")
@@ -191,17 +270,54 @@ class AudioProcessor:
 
         """
         try:
-            audio = AudioSegment.from_mp3(io.BytesIO(audio_data))
-
-            return {
-                "duration_seconds": len(audio) / 1000.0,
-                "frame_rate": audio.frame_rate,
-                "channels": audio.channels,
-                "sample_width": audio.sample_width,
-                "max_dBFS": audio.max_dBFS,
-                "dBFS": audio.dBFS,
-                "rms": audio.rms,
-            }
+            with tempfile.TemporaryDirectory(prefix="podcast-audio-") as work_dir:
+                (audio_path,) = _write_files(work_dir, "audio", [audio_data])
+                return self.get_pool().run_blocking(_audio_info_task, audio_path)
         except Exception as e:
             logger.error(f"Error getting audio info: {str(e)}")
             return {}
+
+
+def _decode_linear16(data: bytes) -> tuple[np.ndarray, int]:
+    """Decode a LINEAR16 segment (WAV, or headerless PCM) to mono float samples and its sample rate"""
+    if not data.startswith(b"RIFF"):
+        return np.frombuffer(data, dtype="<i2").astype(np.float32), DEFAULT_PCM_SAMPLE_RATE
+
+    with wave.open(io.BytesIO(data)) as wav:
+        if wav.getsampwidth() != PCM_SAMPLE_WIDTH:
+            raise ValueError(f"Unsupported sample width: {wav.getsampwidth()} bytes")
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2").astype(np.float32)
+        if wav.getnchannels() > 1:
+            samples = samples.reshape(-1, wav.getnchannels()).mean(axis=1)
+        return samples, wav.getframerate()
+
+
+def _linear16_duration_seconds(data: bytes) -> float:
+    if not data.startswith(b"RIFF"):
+        return len(data) / PCM_SAMPLE_WIDTH / DEFAULT_PCM_SAMPLE_RATE
+    with wave.open(io.BytesIO(data)) as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def _normalize(samples: np.ndarray, target_dBFS: float) -> np.ndarray:  # noqa: N803
+    """Apply gain so the segment's RMS level matches target_dBFS"""
+    rms = float(np.sqrt(np.mean(np.square(samples)))) if samples.size else 0.0
+    if rms == 0:
+        return samples
+    dBFS = 20 * np.log10(rms / 32768)  # noqa: N806
+    gain = 10 ** ((target_dBFS - dBFS) / 20)
+    return np.clip(samples * gain, -32768, 32767)
+
+
+def _fade(samples: np.ndarray, length: int, fade_in: bool) -> np.ndarray:
+    """Linear fade over the first (or last) length samples"""
+    length = min(length, samples.size)
+    if length == 0:
+        return samples
+    ramp = np.linspace(0.0, 1.0, length, dtype=np.float32)
+    samples = samples.copy()
+    if fade_in:
+        samples[:length] *= ramp
+    else:
+        samples[-length:] *= ramp[::-1]
+    return samples
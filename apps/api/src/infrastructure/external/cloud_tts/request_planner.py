@@ -0,0 +1,115 @@
+import logging
+import re
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+# Text-to-Speech rejects inputs over 5000 bytes (the SSML markup counts)
+MAX_REQUEST_BYTES = 5000
+# Pause inserted where two turns are merged; roughly the silence between separately synthesized clips
+TURN_BREAK_TIME = "300ms"
+SENTENCE_END_PATTERN = re.compile(r"(?<=[。！？!?．.])")
+
+_SPEAK_OPEN = "<speak>"
+_SPEAK_CLOSE = "</speak>"
+
+
+@dataclass(frozen=True)
+class TTSRequest:
+    """One synthesis request: SSML for consecutive text of a single speaker"""
+
+    speaker: str
+    ssml: str
+    turn_indices: tuple[int, ...]
+
+
+def plan_tts_requests(turns: list[dict], max_bytes: int = MAX_REQUEST_BYTES, turn_break_time: str = TURN_BREAK_TIME) -> list[TTSRequest]:
+    """Merge adjacent turns of the same speaker into as few SSML requests as the byte limit allows
+
+    Turns longer than the limit are split at sentence boundaries. Requests are
+    returned in script order, so concatenating their audio reproduces the script.
+
+    Args:
+        turns: Dialogue turns with 'speaker' and 'text' keys
+        max_bytes: Maximum UTF-8 size of one request's SSML
+        turn_break_time: Pause between merged turns
+
+    Returns:
+        Planned requests
+
+    """
+    separator = f'<break time="{turn_break_time}"/>'
+    overhead = _byte_length(_SPEAK_OPEN + _SPEAK_CLOSE)
+
+    requests: list[TTSRequest] = []
+    speaker: str | None = None
+    parts: list[str] = []
+    indices: list[int] = []
+    size = overhead
+
+    def flush() -> None:
+        nonlocal parts, indices, size
+        if parts and speaker is not None:
+            requests.append(TTSRequest(speaker=speaker, ssml=_SPEAK_OPEN + separator.join(parts) + _SPEAK_CLOSE, turn_indices=tuple(indices)))
+        parts, indices, size = [], [], overhead
+
+    for index, turn in enumerate(turns):
+        if turn["speaker"] != speaker:
+            flush()
+            speaker = turn["speaker"]
+
+        for piece in _split_to_fit(turn["text"], max_bytes - overhead):
+            piece_size = _byte_length(piece) + (_byte_length(separator) if parts else 0)
+            if parts and size + piece_size > max_bytes:
+                flush()
+                piece_size = _byte_length(piece)
+            parts.append(piece)
+            size += piece_size
+            if not indices or indices[-1] != index:
+                indices.append(index)
+
+    flush()
+    logger.info(f"Planned {len(requests)} TTS requests for {len(turns)} turns")
+    return requests
+
+
+def _split_to_fit(text: str, max_bytes: int) -> list[str]:
+    """Escape text for SSML, splitting it at sentence (or character) boundaries to fit max_bytes"""
+    escaped = escape(text.strip())
+    if _byte_length(escaped) <= max_bytes:
+        return [escaped]
+
+    pieces: list[str] = []
+    current = ""
+    for sentence in (s for s in SENTENCE_END_PATTERN.split(text.strip()) if s):
+        for fragment in _split_characters(escape(sentence), max_bytes):
+            candidate = current + fragment
+            if _byte_length(candidate) <= max_bytes:
+                current = candidate
+            else:
+                pieces.append(current.strip())
+                current = fragment
+    if current:
+        pieces.append(current.strip())
+    return pieces
+
+
+def _split_characters(escaped: str, max_bytes: int) -> list[str]:
+    """Hard-split an over-long sentence without breaking XML entities"""
+    if _byte_length(escaped) <= max_bytes:
+        return [escaped]
+    fragments: list[str] = []
+    current = ""
+    for token in re.findall(r"&[a-z]+;|.", escaped, flags=re.DOTALL):
+        if _byte_length(current + token) > max_bytes:
+            fragments.append(current)
+            current = ""
+        current += token
+    if current:
+        fragments.append(current)
+    return fragments
+
+
+def _byte_length(text: str) -> int:
+    return len(text.encode("utf-8"))
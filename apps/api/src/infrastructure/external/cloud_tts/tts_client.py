@@ -1,19 +1,51 @@
+import asyncio
+import io
 import logging
+import unicodedata
+import wave
+from collections.abc import Awaitable, Callable
 
+from google.api_core import exceptions as google_exceptions
 from google.cloud import texttospeech_v1beta1 as tts
 
 from src.config.app_config import AppConfig
 from src.domain.podcast.exceptions import PodcastAudioSynthesisError
+from src.infrastructure.disk_cache import DiskCache, cache_key
+from src.infrastructure.external.cloud_tts.request_planner import MAX_REQUEST_BYTES, TTSRequest, plan_tts_requests
 
 logger = logging.getLogger(__name__)
 
+# Per-request retry of transient Text-to-Speech API errors
+REQUEST_MAX_ATTEMPTS = 3
+REQUEST_RETRY_INITIAL_DELAY_SECONDS = 1.0
+RETRYABLE_ERRORS = (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+)
+
 
 class CloudTTSClient:
     """Google Cloud Text-to-Speech client for audio synthesis"""
 
+    _shared_cache: DiskCache | None = None
+
+    @classmethod
+    def get_segment_cache(cls) -> DiskCache | None:
+        """Get the process-wide cache of synthesized segments, or None when caching is disabled"""
+        if cls._shared_cache is None:
+            config = AppConfig.get_config()
+            if config.tts_cache_max_mb <= 0:
+                return None
+            cls._shared_cache = DiskCache(config.tts_cache_dir, config.tts_cache_max_mb * 1024 * 1024)
+        return cls._shared_cache
+
     def __init__(self) -> None:
         self.config = AppConfig.get_config()
         self.client = tts.TextToSpeechClient()
+        self.segment_cache = self.get_segment_cache()
         # Configure voice settings by language
         self.voices = {
             "en-US": {
@@ -49,92 +81,167 @@ class CloudTTSClient:
         }
         # Configure audio settings
         self.audio_config = tts.AudioConfig(
-            audio_encoding=tts.AudioEncoding.MP3,
+            # Uncompressed PCM (WAV) so the podcast is encoded only once, after mixing
+            audio_encoding=tts.AudioEncoding.LINEAR16,
             sample_rate_hertz=24000,  # 24kHz for synthesis
         )
 
-    async def synthesize_multi_speaker(self, turns: list[dict], language: str = "en-US") -> bytes:
+    async def synthesize_multi_speaker(self, turns: list[dict], language: str = "en-US", max_concurrency: int = 1) -> bytes:
         """Synthesize multi-speaker dialogue using Studio MultiSpeaker voice
 
         Args:
             turns: List of dialogue turns with 'speaker' and 'text' keys
             language: Language of the script
+            max_concurrency: Maximum number of requests synthesized at the same time
         Returns:
-            Audio data in MP3 format
+            Audio data in WAV (LINEAR16) format
 
         """
+        # --- Original multi-speaker implementation (requires allowlist) ---
+        # Build MultiSpeakerMarkup
+        # markup_turns = [
+        #     tts.MultiSpeakerMarkup.Turn(text=turn["text"], speaker=turn["speaker"])
+        #     for turn in turns
+        # ]
+        # multi_speaker_markup = tts.MultiSpeakerMarkup(turns=markup_turns)
+        # synthesis_input = tts.SynthesisInput(multi_speaker_markup=multi_speaker_markup)
+        # response = self.client.synthesize_speech(
+        #     input=synthesis_input,
+        #     voice=self.multi_speaker_voice,
+        #     audio_config=self.audio_config,
+        # )
+        # return response.audio_content
+
+        # --- Fallback implementation using two single-speaker voices ---
+        return _join_wav(await self.synthesize_requests(plan_tts_requests(turns), language, max_concurrency))
+
+    async def synthesize_requests(
+        self,
+        requests: list[TTSRequest],
+        language: str = "en-US",
+        max_concurrency: int = 1,
+        on_request_done: Callable[[], Awaitable[None]] | None = None,
+        on_segment: Callable[[int, bytes], Awaitable[None]] | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[bytes]:
+        """Synthesize planned SSML requests with their speaker's voice, running up to max_concurrency at once
+
+        Args:
+            requests: Requests from plan_tts_requests
+            language: Language of the script
+            max_concurrency: Maximum number of requests synthesized at the same time
+            on_request_done: Awaited after each request finishes, in completion order
+            on_segment: Awaited with (request index, audio) as soon as a request finishes, so its
+                audio is kept even if a later request fails
+            semaphore: Limits concurrency instead of max_concurrency, shared with other
+                synthesis running at the same time
+
+        Returns:
+            One WAV (LINEAR16) segment per request, in the order of the requests
+
+        """
+        limit = semaphore or asyncio.Semaphore(max(1, max_concurrency))
+
+        async def synthesize(index: int, request: TTSRequest) -> bytes:
+            async with limit:
+                audio = await self._synthesize_request(index, request, language)
+            if on_segment:
+                await on_segment(index, audio)
+            if on_request_done:
+                await on_request_done()
+            return audio
+
         try:
-            # --- Original multi-speaker implementation (requires allowlist) ---
-            # Build MultiSpeakerMarkup
-            # markup_turns = [
-            #     tts.MultiSpeakerMarkup.Turn(text=turn["text"], speaker=turn["speaker"])
-            #     for turn in turns
-            # ]
-            # multi_speaker_markup = tts.MultiSpeakerMarkup(turns=markup_turns)
-            # synthesis_input = tts.SynthesisInput(multi_speaker_markup=multi_speaker_markup)
-            # response = self.client.synthesize_speech(
-            #     input=synthesis_input,
-            #     voice=self.multi_speaker_voice,
-            #     audio_config=self.audio_config,
-            # )
-            # return response.audio_content
-
-            # --- Fallback implementation using two single-speaker voices ---
-            audio_contents: list[bytes] = []
-
-            # Get language-specific voices, fallback to English if not found
-            language_voices = self.voices.get(language, self.voices["en-US"])
-
-            for turn in turns:
-                synthesis_input = tts.SynthesisInput(text=turn["text"])
-                # Select voice based on speaker
-                voice_params = language_voices.get(turn["speaker"], language_voices["HOST"])
-                response = self.client.synthesize_speech(
+            # gather keeps results in input order regardless of completion order
+            return list(await asyncio.gather(*(synthesize(index, request) for index, request in enumerate(requests))))
+        except PodcastAudioSynthesisError:
+            raise
+        except Exception as e:
+            logger.error(f"Error synthesizing multi-speaker audio: {str(e)}")
+            raise PodcastAudioSynthesisError(f"Multi-speaker synthesis failed: {str(e)}")
+
+    async def _synthesize_request(self, index: int, request: TTSRequest, language: str) -> bytes:
+        """Synthesize one request off the event loop, retrying transient API errors with backoff"""
+        # Get language-specific voices, fallback to English if not found
+        language_voices = self.voices.get(language, self.voices["en-US"])
+        # Select voice based on speaker
+        voice_params = language_voices.get(request.speaker, language_voices["HOST"])
+        ssml = _normalize_ssml(request.ssml)
+        synthesis_input = tts.SynthesisInput(ssml=ssml)
+
+        key = self._segment_cache_key(voice_params, ssml)
+        if self.segment_cache:
+            cached = await asyncio.to_thread(self.segment_cache.get, key)
+            if cached is not None:
+                return cached
+
+        delay = REQUEST_RETRY_INITIAL_DELAY_SECONDS
+        for attempt in range(1, REQUEST_MAX_ATTEMPTS + 1):
+            try:
+                response = await asyncio.to_thread(
+                    self.client.synthesize_speech,
                     input=synthesis_input,
                     voice=voice_params,
                     audio_config=self.audio_config,
                 )
-                audio_contents.append(response.audio_content)
-
-            return b"".join(audio_contents)
+                if self.segment_cache:
+                    await asyncio.to_thread(self.segment_cache.set, key, response.audio_content)
+                return response.audio_content
+            except RETRYABLE_ERRORS as e:
+                if attempt == REQUEST_MAX_ATTEMPTS:
+                    raise PodcastAudioSynthesisError(f"Request {index} synthesis failed after {attempt} attempts: {str(e)}") from e
+                logger.warning(f"Request {index} synthesis failed (attempt {attempt}/{REQUEST_MAX_ATTEMPTS}), retrying in {delay}s: {str(e)}")
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        raise PodcastAudioSynthesisError(f"Request {index} synthesis failed")
+
+    def _segment_cache_key(self, voice_params: tts.VoiceSelectionParams, ssml: str) -> str:
+        """Key covering everything that determines the synthesized audio"""
+        return cache_key(
+            voice_params.language_code,
+            voice_params.name,
+            self.audio_config.audio_encoding,
+            self.audio_config.sample_rate_hertz,
+            self.audio_config.speaking_rate,
+            self.audio_config.pitch,
+            self.audio_config.volume_gain_db,
+            ssml,
+        )
 
-        except Exception as e:
-            logger.error(f"Error synthesizing multi-speaker audio: {str(e)}")
-            raise PodcastAudioSynthesisError(f"Multi-speaker synthesis failed: {str(e)}")
+    async def synthesize_with_chunks(
+        self, turns: list[dict], max_bytes_per_request: int = MAX_REQUEST_BYTES, language: str = "en-US", max_concurrency: int = 1
+    ) -> list[bytes]:
+        """Synthesize dialogue as SSML requests that each stay within the API size limit
 
-    async def synthesize_with_chunks(self, turns: list[dict], max_chars_per_request: int = 5000, language: str = "en-US") -> list[bytes]:
-        """Synthesize dialogue in chunks if it exceeds the character limit
+        Adjacent turns of the same speaker share a request, so there are usually
+        far fewer requests than turns.
 
         Args:
             turns: List of dialogue turns
-            max_chars_per_request: Maximum characters per synthesis request
+            max_bytes_per_request: Maximum SSML bytes per synthesis request
             language: Language of the script
+            max_concurrency: Maximum number of requests synthesized at the same time
 
         Returns:
-            List of audio chunks in MP3 format
+            List of audio chunks in WAV (LINEAR16) format, one per request
 
         """
-        chunks: list[bytes] = []
-        current_chunk: list[dict] = []
-        current_length = 0
-
-        for turn in turns:
-            turn_length = len(turn["text"])
-
-            # If adding this turn exceeds the limit, synthesize current chunk
-            if current_length + turn_length > max_chars_per_request and current_chunk:
-                audio_chunk = await self.synthesize_multi_speaker(current_chunk, language)
-                chunks.append(audio_chunk)
-                current_chunk = []
-                current_length = 0
-
-            # Add turn to current chunk
-            current_chunk.append(turn)
-            current_length += turn_length
-
-        # Synthesize remaining turns
-        if current_chunk:
-            audio_chunk = await self.synthesize_multi_speaker(current_chunk, language)
-            chunks.append(audio_chunk)
-
-        return chunks
+        return await self.synthesize_requests(plan_tts_requests(turns, max_bytes_per_request), language, max_concurrency)
+
+
+def _normalize_ssml(ssml: str) -> str:
+    """Canonical form of the input; whitespace and Unicode composition do not change the audio"""
+    return " ".join(unicodedata.normalize("NFC", ssml).split())
+
+
+def _join_wav(segments: list[bytes]) -> bytes:
+    """Concatenate WAV segments of the same format into one WAV file"""
+    output = io.BytesIO()
+    with wave.open(output, "wb") as joined:
+        for index, segment in enumerate(segments):
+            with wave.open(io.BytesIO(segment)) as wav:
+                if index == 0:
+                    joined.setparams(wav.getparams())
+                joined.writeframes(wav.readframes(wav.getnframes()))
+    return output.getvalue()
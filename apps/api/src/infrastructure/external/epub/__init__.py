@@ -1,3 +1,6 @@
-from .epub_reader import Chapter
+from .epub_metadata import extract_epub_metadata
+from .epub_parser import EpubParser
+from .epub_reader import Chapter, read_chapters
+from .epub_section_parser import EpubSection, TextBlock, parse_epub_sections
 
-__all__ = ["Chapter"]
+__all__ = ["Chapter", "EpubParser", "EpubSection", "TextBlock", "extract_epub_metadata", "parse_epub_sections", "read_chapters"]
@@ -0,0 +1,101 @@
+import logging
+import posixpath
+import zipfile
+import zlib
+from typing import BinaryIO
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+DC_NAMESPACE = "http://purl.org/dc/elements/1.1/"
+OPF_NAMESPACE = "http://www.idpf.org/2007/opf"
+CONTAINER_NAMESPACE = "urn:oasis:names:tc:opendocument:xmlns:container"
+CONTAINER_PATH = "META-INF/container.xml"
+# Package documents are small; anything larger is refused before it is inflated
+MAX_PACKAGE_DOCUMENT_BYTES = 16 * 1024 * 1024
+
+# Dublin Core element -> book metadata key
+DC_FIELDS = {
+    "title": "title",
+    "creator": "creator",
+    "description": "description",
+    "date": "pubdate",
+    "publisher": "publisher",
+    "identifier": "identifier",
+    "language": "language",
+    "rights": "rights",
+}
+
+# OPF <meta property="..."> -> book metadata key
+OPF_PROPERTIES = {
+    "dcterms:modified": "modified_date",
+    "rendition:layout": "layout",
+    "rendition:orientation": "orientation",
+    "rendition:flow": "flow",
+    "rendition:spread": "spread",
+    "rendition:viewport": "viewport",
+}
+
+
+def extract_epub_metadata(epub_file: str | BinaryIO) -> dict[str, str]:
+    """Read package metadata from an EPUB's OPF document
+
+    Only the zip directory, the container document and the OPF entry are read, so
+    a seekable stream over remote storage fetches a few small ranges rather than
+    the whole book.
+
+    Args:
+        epub_file: Local path to the EPUB file, or a seekable binary stream over it
+
+    Returns:
+        Metadata keyed like the client-side book metadata (title, creator, pubdate, ...)
+
+    Raises:
+        ValueError: If the file is not an EPUB or its package document cannot be found
+
+    """
+    try:
+        with zipfile.ZipFile(epub_file) as archive:
+            opf_path = _find_opf_path(_parse_xml(_read_entry(archive, CONTAINER_PATH)))
+            package = _parse_xml(_read_entry(archive, opf_path))
+    except (zipfile.BadZipFile, KeyError, EOFError, NotImplementedError, zlib.error, etree.XMLSyntaxError) as e:
+        raise ValueError(f"Not a readable EPUB: {str(e)}") from e
+
+    metadata: dict[str, str] = {}
+    metadata_element = package.find(f"{{{OPF_NAMESPACE}}}metadata")
+    if metadata_element is None:
+        return metadata
+
+    for element, key in DC_FIELDS.items():
+        values = [value.text for value in metadata_element.iterfind(f".//{{{DC_NAMESPACE}}}{element}") if value.text and value.text.strip()]
+        if values:
+            metadata[key] = values[0].strip()
+
+    for meta in metadata_element.iterfind(f".//{{{OPF_NAMESPACE}}}meta"):
+        property_key = OPF_PROPERTIES.get(meta.get("property", ""))
+        if property_key and meta.text and meta.text.strip() and property_key not in metadata:
+            metadata[property_key] = meta.text.strip()
+
+    return metadata
+
+
+def _read_entry(archive: zipfile.ZipFile, name: str) -> bytes:
+    info = archive.getinfo(name)
+    if info.file_size > MAX_PACKAGE_DOCUMENT_BYTES:
+        raise zipfile.BadZipFile(f"{name} is {info.file_size} bytes, over the {MAX_PACKAGE_DOCUMENT_BYTES} byte limit")
+    return archive.read(info)
+
+
+def _parse_xml(content: bytes) -> etree._Element:
+    # Parsers are not safe to share between threads, hence one per call.
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, remove_comments=True)
+    return etree.fromstring(content, parser=parser)
+
+
+def _find_opf_path(container: etree._Element) -> str:
+    rootfile = container.find(f".//{{{CONTAINER_NAMESPACE}}}rootfile")
+    full_path = rootfile.get("full-path") if rootfile is not None else None
+    if not full_path:
+        raise KeyError("container.xml does not name a package document")
+    return posixpath.normpath(full_path)
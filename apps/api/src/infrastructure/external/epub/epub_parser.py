@@ -0,0 +1,123 @@
+import asyncio
+import json
+import logging
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from src.config.app_config import AppConfig
+from src.infrastructure.book_file_cache import BookFileCache
+from src.infrastructure.external.epub.epub_reader import Chapter, read_chapters
+from src.infrastructure.external.epub.epub_section_parser import EpubSection, TextBlock, parse_epub_sections
+from src.infrastructure.process_pool import IsolatedProcessPool
+
+logger = logging.getLogger(__name__)
+
+# Bump when a task's payload changes (including how text is extracted) so cached results of the old parser are not reused
+PAYLOAD_VERSION = 2
+
+
+def _pack(payload: Any) -> bytes:  # noqa: ANN401
+    return zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(data: bytes) -> Any:  # noqa: ANN401
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+# Functions below run inside the worker processes and return compact payloads
+
+
+def _parse_sections_task(epub_path: str) -> bytes:
+    sections = parse_epub_sections(epub_path)
+    return _pack(
+        [
+            [
+                section.spine_index,
+                section.idref,
+                section.title,
+                section.text,
+                [[block.start, block.end, block.cfi_path, block.leading_text_length] for block in section.blocks],
+            ]
+            for section in sections
+        ]
+    )
+
+
+def _read_chapters_task(epub_path: str) -> bytes:
+    # Only the plain text crosses the process boundary; the HTML stays in the worker
+    return _pack([[chapter.index, chapter.title, chapter.get_text_content()] for chapter in read_chapters(epub_path)])
+
+
+def _load_sections(data: bytes) -> list[EpubSection]:
+    return [
+        EpubSection(
+            spine_index=spine_index,
+            idref=idref,
+            title=title,
+            text=text,
+            blocks=[TextBlock(start=start, end=end, cfi_path=cfi_path, leading_text_length=leading) for start, end, cfi_path, leading in blocks],
+        )
+        for spine_index, idref, title, text, blocks in _unpack(data)
+    ]
+
+
+def _load_chapters(data: bytes) -> list[Chapter]:
+    # The payload already holds plain text, so it doubles as the extracted text
+    return [Chapter(index=index, title=title, content=text, text_content=text) for index, title, text in _unpack(data)]
+
+
+class EpubParser:
+    """Parses EPUB files in an isolated worker process pool
+
+    Parsing untrusted EPUBs can spike memory; running it out of process keeps
+    those spikes (and hangs) away from the API worker serving chat requests.
+    When the content hash of the file is given, the worker's payload is kept in
+    the book file cache, so the same EPUB is parsed once per task.
+    """
+
+    _shared_pool: IsolatedProcessPool | None = None
+
+    @classmethod
+    def get_pool(cls) -> IsolatedProcessPool:
+        """Get the shared parser pool, creating it on first use"""
+        if cls._shared_pool is None:
+            config = AppConfig.get_config()
+            cls._shared_pool = IsolatedProcessPool(
+                name="epub-parser",
+                max_workers=config.epub_parser_max_workers,
+                memory_limit_mb=config.epub_parser_memory_limit_mb,
+                timeout_seconds=config.epub_parser_timeout_seconds,
+                max_tasks_per_child=config.epub_parser_max_tasks_per_child,
+            )
+        return cls._shared_pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the worker processes"""
+        if cls._shared_pool is not None:
+            cls._shared_pool.shutdown()
+            cls._shared_pool = None
+
+    @classmethod
+    async def parse_sections(cls, epub_path: str, content_hash: str | None = None) -> list[EpubSection]:
+        """Parse spine sections with block positions (see parse_epub_sections)"""
+        return _load_sections(await cls._run(_parse_sections_task, epub_path, content_hash))
+
+    @classmethod
+    async def read_chapters(cls, epub_path: str, content_hash: str | None = None) -> list[Chapter]:
+        """Read chapters as plain text (see read_chapters)"""
+        return _load_chapters(await cls._run(_read_chapters_task, epub_path, content_hash))
+
+    @classmethod
+    async def _run(cls, task: Callable[[str], bytes], epub_path: str, content_hash: str | None) -> bytes:
+        if content_hash is None:
+            return await cls.get_pool().run(task, epub_path)
+        cache = BookFileCache.get_shared()
+        name = f"{task.__name__}:{PAYLOAD_VERSION}"
+        cached = await asyncio.to_thread(cache.get_artifact, content_hash, name)
+        if cached is not None:
+            return cached
+        data = await cls.get_pool().run(task, epub_path)
+        await asyncio.to_thread(cache.set_artifact, content_hash, name, data)
+        return data
@@ -1,30 +1,88 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from bs4 import BeautifulSoup
+from ebooklib import ITEM_DOCUMENT, epub
+from lxml import etree, html
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class Chapter:
-    """Represents a book chapter"""
+    """Represents a book chapter
+
+    The plain text is extracted on first use and kept on the object, so the
+    length check, splitting and summarization do not each re-parse the HTML.
+    """
 
     index: int
     title: str | None
     content: str
+    text_content: str | None = field(default=None, repr=False, compare=False)
 
     def get_text_content(self) -> str:
         """Get plain text content from HTML"""
-        soup = BeautifulSoup(self.content, "html.parser")
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        # Get text
-        text = soup.get_text()
-        # Break into lines and remove leading and trailing space on each
-        lines = (line.strip() for line in text.splitlines())
-        # Break multi-headlines into a line each
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        # Drop blank lines
-        return "\n".join(chunk for chunk in chunks if chunk)
+        if self.text_content is None:
+            self.text_content = html_to_text(self.content)
+        return self.text_content
+
+
+def html_to_text(content: str) -> str:
+    """Extract readable text from chapter HTML, one non-blank phrase per line"""
+    # The HTML was already decoded, so the parser must not follow the document's declared encoding.
+    # Parsers are not safe to share between threads, hence one per call.
+    parser = html.HTMLParser(encoding="utf-8", remove_comments=True, remove_pis=True)
+    try:
+        root = html.document_fromstring(content.encode("utf-8"), parser=parser)
+    except (etree.ParserError, ValueError):
+        # Raised for documents without any elements
+        return ""
+    # Remove script and style elements and ruby readings (furigana), keeping the text that follows them
+    for element in list(root.iter("script", "style", "rt", "rp")):
+        element.drop_tree()
+    # Get text
+    text = root.text_content()
+    # Break into lines and remove leading and trailing space on each
+    lines = (line.strip() for line in text.splitlines())
+    # Break multi-headlines into a line each
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    # Drop blank lines
+    return "\n".join(chunk for chunk in chunks if chunk)
+
+
+def read_chapters(epub_path: str) -> list[Chapter]:
+    """Read document items with substantial text from a local EPUB file
+
+    Args:
+        epub_path: Local path to the EPUB file
+
+    Returns:
+        List of Chapter objects
+
+    """
+    book = epub.read_epub(epub_path)
+    chapters = []
+    chapter_index = 0
+
+    # Get all items of type ITEM_DOCUMENT
+    for item in book.get_items_of_type(ITEM_DOCUMENT):
+        # Get content
+        content = item.get_content().decode("utf-8", errors="ignore")
+
+        # Skip if content is too short (likely navigation or metadata)
+        if len(content) < 100:
+            continue
+
+        # Extract title if available
+        title = item.get_name()
+        if hasattr(item, "title") and item.title:
+            title = item.title
+
+        chapter = Chapter(index=chapter_index, title=title, content=content)
+
+        # Only include chapters with substantial text content (the text stays cached on the chapter)
+        if len(chapter.get_text_content()) > 50:  # Minimum text length
+            chapters.append(chapter)
+            chapter_index += 1
+
+    return chapters
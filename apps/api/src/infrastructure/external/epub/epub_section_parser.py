@@ -0,0 +1,211 @@
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from ebooklib import epub
+
+logger = logging.getLogger(__name__)
+
+# Block-level elements whose text becomes a positioned block in a section
+BLOCK_TAGS = {
+    "p",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "li",
+    "blockquote",
+    "pre",
+    "dd",
+    "dt",
+    "td",
+    "th",
+    "figcaption",
+    "caption",
+    "div",
+    "section",
+    "article",
+    "aside",
+}
+HEADING_TAGS = ["h1", "h2", "h3"]
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@dataclass
+class TextBlock:
+    """A block element's text span inside a section, with its CFI path"""
+
+    start: int
+    end: int
+    cfi_path: str
+    leading_text_length: int
+
+
+@dataclass
+class EpubSection:
+    """Plain text of one spine item, with positions of its block elements"""
+
+    spine_index: int
+    idref: str
+    title: str | None
+    text: str
+    blocks: list[TextBlock] = field(default_factory=list)
+
+    @property
+    def cfi_base(self) -> str:
+        """CFI steps from the package document to this spine item's content document"""
+        # The spine is the third child element of <package> (metadata, manifest, spine)
+        return f"/6/{(self.spine_index + 1) * 2}[{self.idref}]!"
+
+    def cfi_range(self, start: int, end: int) -> str | None:
+        """Build a block-level CFI range covering the given character offsets
+
+        Args:
+            start: Start offset in the section text
+            end: End offset in the section text
+
+        Returns:
+            An ``epubcfi(...)`` string, or None when the section has no blocks
+
+        """
+        start_block = self._find_block(start)
+        end_block = self._find_block(max(start, end - 1))
+        if start_block is None or end_block is None:
+            return None
+
+        start_steps = start_block.cfi_path.split("/")[1:]
+        end_steps = end_block.cfi_path.split("/")[1:]
+        common: list[str] = []
+        for start_step, end_step in zip(start_steps, end_steps, strict=False):
+            if start_step != end_step:
+                break
+            common.append(start_step)
+
+        parent = "".join(f"/{step}" for step in common)
+        start_rest = "".join(f"/{step}" for step in start_steps[len(common) :])
+        end_rest = "".join(f"/{step}" for step in end_steps[len(common) :])
+        return f"epubcfi({self.cfi_base}{parent},{start_rest}/1:0,{end_rest}/1:{end_block.leading_text_length})"
+
+    def _find_block(self, offset: int) -> TextBlock | None:
+        """Find the last block starting at or before the offset"""
+        found = None
+        for block in self.blocks:
+            if block.start > offset:
+                break
+            found = block
+        return found
+
+
+def parse_epub_sections(epub_path: str) -> list[EpubSection]:
+    """Parse an EPUB into per-spine-item text sections in reading order
+
+    Args:
+        epub_path: Local path to the EPUB file
+
+    Returns:
+        Sections that contain text, each with block positions for CFI generation
+
+    """
+    book = epub.read_epub(epub_path)
+    toc_titles = _collect_toc_titles(book.toc)
+
+    sections = []
+    for spine_index, (idref, _linear) in enumerate(book.spine):
+        item = book.get_item_with_id(idref)
+        if item is None or not isinstance(item, epub.EpubHtml):
+            continue
+
+        soup = BeautifulSoup(item.get_content(), "html.parser")
+        for element in soup(["script", "style"]):
+            element.decompose()
+
+        body = soup.find("body")
+        if not isinstance(body, Tag):
+            continue
+
+        text, blocks = _extract_blocks(body)
+        if not text:
+            continue
+
+        title = toc_titles.get(PurePosixPath(item.get_name()).name) or _find_heading(body)
+        sections.append(EpubSection(spine_index=spine_index, idref=idref, title=title, text=text, blocks=blocks))
+
+    logger.info(f"Parsed {len(sections)} text sections from EPUB spine ({len(book.spine)} items)")
+    return sections
+
+
+def _collect_toc_titles(toc: list | tuple) -> dict[str, str]:
+    """Map content document file names to their first TOC title"""
+    titles: dict[str, str] = {}
+    for entry in toc:
+        if isinstance(entry, tuple | list) and len(entry) == 2:
+            section, children = entry
+            _add_toc_title(titles, section)
+            for name, title in _collect_toc_titles(children).items():
+                titles.setdefault(name, title)
+        else:
+            _add_toc_title(titles, entry)
+    return titles
+
+
+def _add_toc_title(titles: dict[str, str], entry: object) -> None:
+    href = getattr(entry, "href", None)
+    title = getattr(entry, "title", None)
+    if href and title:
+        titles.setdefault(PurePosixPath(href.split("#")[0]).name, title)
+
+
+def _find_heading(body: Tag) -> str | None:
+    heading = body.find(HEADING_TAGS)
+    if heading is None:
+        return None
+    text = _normalize(heading.get_text())
+    return text or None
+
+
+def _extract_blocks(body: Tag) -> tuple[str, list[TextBlock]]:
+    """Concatenate the text of leaf block elements and record their positions"""
+    leaves = [element for element in body.find_all(BLOCK_TAGS) if element.find(BLOCK_TAGS) is None]
+    if not leaves:
+        leaves = [body]
+
+    parts: list[str] = []
+    blocks: list[TextBlock] = []
+    offset = 0
+    for element in leaves:
+        block_text = _normalize(element.get_text())
+        if not block_text:
+            continue
+        if parts:
+            offset += 1  # newline separator
+        first = element.contents[0] if element.contents else None
+        leading_text_length = len(first) if isinstance(first, NavigableString) else 0
+        blocks.append(TextBlock(start=offset, end=offset + len(block_text), cfi_path=_cfi_path(element), leading_text_length=leading_text_length))
+        parts.append(block_text)
+        offset += len(block_text)
+
+    return "\n".join(parts), blocks
+
+
+def _cfi_path(element: Tag) -> str:
+    """Build the CFI element path from the document root to the element"""
+    steps = []
+    current = element
+    while isinstance(current.parent, Tag) and current.name != "html":
+        siblings = [child for child in current.parent.children if isinstance(child, Tag)]
+        position = next(index for index, sibling in enumerate(siblings) if sibling is current)
+        step = f"/{(position + 1) * 2}"
+        element_id = current.get("id")
+        if isinstance(element_id, str) and element_id:
+            step += f"[{element_id}]"
+        steps.append(step)
+        current = current.parent
+    return "".join(reversed(steps))
+
+
+def _normalize(text: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
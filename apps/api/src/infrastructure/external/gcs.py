@@ -1,3 +1,10 @@
+import base64
+import io
+from datetime import timedelta
+from typing import BinaryIO
+from urllib.parse import quote
+
+from google.api_core.exceptions import NotFound
 from google.auth.credentials import AnonymousCredentials
 from google.cloud import storage  # type: ignore[attr-defined]
 
@@ -5,11 +12,59 @@ from src.config.app_config import AppConfig
 
 config = AppConfig.get_config()
 
+# ストリーミング転送時のチャンクサイズ（GCSの制約により256KiBの倍数）
+STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+# 範囲読み出し時のバッファサイズ（zipの末尾と中央ディレクトリを数回のリクエストで読める大きさ）
+RANGE_READ_BUFFER_SIZE = 256 * 1024
+
 
 class GCSBucketError(Exception):
     """Error related to GCS bucket operations."""
 
 
+class GCSRangeReader(io.RawIOBase):
+    """GCSオブジェクトを範囲リクエストで読み出すシーク可能なストリーム.
+
+    zipの中央ディレクトリや特定のエントリだけを読む場合に、オブジェクト全体をダウンロードせずに済む.
+    """
+
+    def __init__(self, blob: storage.Blob, size: int) -> None:
+        """範囲リーダーの初期化."""
+        self._blob = blob
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer: "memoryview | bytearray") -> int:  # type: ignore[override]
+        if self._position >= self._size or not len(buffer):
+            return 0
+        end = min(self._position + len(buffer), self._size)
+        try:
+            # endは末尾のバイトを含む
+            data = self._blob.download_as_bytes(start=self._position, end=end - 1)
+        except Exception as e:
+            raise GCSBucketError(f"Failed to read {self._blob.name} at {self._position}: {str(e)}") from e
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 class GCSClient:
     def __init__(self, bucket_name: str = config.gcs_bucket_name) -> None:
         self.config = AppConfig.get_config()
@@ -34,11 +89,93 @@ class GCSClient:
             blob = bucket.blob(file_name)
             blob.upload_from_string(data, content_type=content_type)
 
-            base_url = self.get_gcs_url()
-            return f"{base_url}/{self.bucket_name}/{file_name}"
+            return self.get_object_url(file_name)
         except Exception as e:
             raise GCSBucketError(f"Failed to upload {file_name}: {str(e)}") from e
 
+    def get_object_url(self, file_name: str) -> str:
+        return f"{self.get_gcs_url()}/{self.bucket_name}/{file_name}"
+
+    def get_object_name(self, url: str) -> str:
+        return url.replace(f"{self.get_gcs_url()}/{self.bucket_name}/", "")
+
+    def upload_stream(self, file_name: str, stream: BinaryIO, content_type: str) -> str:
+        try:
+            client = self.get_client()
+            bucket = client.bucket(self.bucket_name)
+            blob = bucket.blob(file_name, chunk_size=STREAM_CHUNK_SIZE)
+            blob.upload_from_file(stream, content_type=content_type, rewind=True)
+
+            return self.get_object_url(file_name)
+        except Exception as e:
+            raise GCSBucketError(f"Failed to upload {file_name}: {str(e)}") from e
+
+    def download_to_file(self, file_name: str, destination_path: str) -> None:
+        try:
+            client = self.get_client()
+            bucket = client.bucket(self.bucket_name)
+            blob = bucket.blob(file_name, chunk_size=STREAM_CHUNK_SIZE)
+            blob.download_to_filename(destination_path)
+        except Exception as e:
+            raise GCSBucketError(f"Failed to download {file_name}: {str(e)}") from e
+
+    def generate_upload_url(self, file_name: str, content_type: str, expiration_seconds: int = 3600) -> str:
+        # fake-gcs-server は署名を検証せず、XML API形式の PUT /{bucket}/{object} でアップロードを受け付ける
+        if self.use_emulator:
+            return f"{self.get_gcs_url()}/{self.bucket_name}/{quote(file_name)}"
+
+        try:
+            client = self.get_client()
+            bucket = client.bucket(self.bucket_name)
+            blob = bucket.blob(file_name)
+            return blob.generate_signed_url(
+                version="v4",
+                expiration=timedelta(seconds=expiration_seconds),
+                method="PUT",
+                content_type=content_type,
+            )
+        except Exception as e:
+            raise GCSBucketError(f"Failed to generate upload URL for {file_name}: {str(e)}") from e
+
+    def get_object_size(self, file_name: str) -> int | None:
+        try:
+            client = self.get_client()
+            bucket = client.bucket(self.bucket_name)
+            blob = bucket.get_blob(file_name)
+            if blob is None:
+                return None
+            return blob.size or 0
+        except Exception as e:
+            raise GCSBucketError(f"Failed to get metadata of {file_name}: {str(e)}") from e
+
+    def get_object_md5(self, file_name: str) -> str | None:
+        try:
+            client = self.get_client()
+            bucket = client.bucket(self.bucket_name)
+            blob = bucket.get_blob(file_name)
+            if blob is None or not blob.md5_hash:
+                return None
+            return base64.b64decode(blob.md5_hash).hex()
+        except Exception as e:
+            raise GCSBucketError(f"Failed to get metadata of {file_name}: {str(e)}") from e
+
+    def download_bytes(self, file_name: str) -> bytes | None:
+        try:
+            client = self.get_client()
+            bucket = client.bucket(self.bucket_name)
+            return bucket.blob(file_name).download_as_bytes()
+        except NotFound:
+            return None
+        except Exception as e:
+            raise GCSBucketError(f"Failed to download {file_name}: {str(e)}") from e
+
+    def open_range_reader(self, file_name: str, size: int) -> BinaryIO:
+        """オブジェクトを範囲リクエストで読み出すシーク可能なストリームを返す（sizeはオブジェクトのサイズ）."""
+        client = self.get_client()
+        bucket = client.bucket(self.bucket_name)
+        reader = GCSRangeReader(bucket.blob(file_name), size)
+        return io.BufferedReader(reader, buffer_size=RANGE_READ_BUFFER_SIZE)
+
     def delete_object(self, file_name: str) -> None:
         try:
             client = self.get_client()
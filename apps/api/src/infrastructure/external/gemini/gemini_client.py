@@ -1,14 +1,19 @@
 import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import google.generativeai as genai
-from google.generativeai.types import HarmBlockThreshold, HarmCategory
+from google.generativeai.types import GenerationConfigDict, HarmBlockThreshold, HarmCategory
 from google.protobuf.json_format import MessageToDict
 
 from src.config.app_config import AppConfig
 from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.infrastructure.disk_cache import cache_key
+from src.infrastructure.external.gemini.gemini_rate_limits import GeminiRateLimiter
+from src.infrastructure.external.gemini.gemini_response_cache import GeminiResponseCache
 from src.infrastructure.external.gemini.prompts.podcast_prompts import get_prompts_with_language
+from src.infrastructure.tokenizer import count_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,13 @@ def _map_to_dict(obj: Any) -> Any:  # noqa: ANN401
     return obj
 
 
+def _chunk_text(chunk: Any) -> str:  # noqa: ANN401
+    """Text of one streamed response chunk, kept unstripped so line breaks survive"""
+    if not chunk.candidates or not chunk.candidates[0].content.parts:
+        return ""
+    return "".join(getattr(part, "text", "") for part in chunk.candidates[0].content.parts)
+
+
 class GeminiClient:
     """Google Gemini API client for text generation and summarization"""
 
@@ -44,6 +56,9 @@ class GeminiClient:
         self.gemini_flash_model = "gemini-2.5-flash"
         self.gemini_pro_model = "gemini-2.5-flash"
 
+        self.rate_limiter = GeminiRateLimiter.get_limiter()
+        self.response_cache = GeminiResponseCache.get_cache()
+
         genai.configure(api_key=self.config.gemini_api_key)
 
         # Initialize models
@@ -75,6 +90,9 @@ class GeminiClient:
     ) -> str:
         """Summarize text using Gemini Pro model
 
+        The same prompt with the same settings is answered from the response cache,
+        and concurrent identical requests share one call.
+
         Args:
             text: Text to summarize
             max_output_tokens: Maximum number of output tokens
@@ -84,17 +102,22 @@ class GeminiClient:
             Summarized text
 
         """
-        try:
-            response = await self.pro_model.generate_content_async(
+
+        async def generate() -> str:
+            response = await self._generate_content(
+                self.pro_model,
                 text,
                 generation_config={
                     "temperature": temperature,
                     "max_output_tokens": max_output_tokens,
                 },
             )
-
             return self._extract_response_text(response)
 
+        try:
+            key = cache_key("summarize_text", self.gemini_pro_model, temperature, max_output_tokens, text)
+            return await self.response_cache.get_or_generate(key, generate)
+
         except Exception as e:
             raise
             logger.error(f"Error summarizing text with Gemini Pro: {str(e)}")
@@ -176,7 +199,8 @@ class GeminiClient:
 
             # Generate response with enhanced error handling
             try:
-                response = await model_with_tools.generate_content_async(
+                response = await self._generate_content(
+                    model_with_tools,
                     prompt,
                     generation_config={
                         "temperature": temperature,
@@ -225,6 +249,110 @@ class GeminiClient:
             logger.error(f"Error generating podcast script with Gemini Flash: {str(e)}")
             raise
 
+    async def stream_podcast_script(
+        self,
+        summary: str,
+        book_title: str,
+        language: PodcastLanguage,
+        target_words: int = 1000,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[dict[str, str]]:
+        """Stream a podcast script, yielding each dialogue turn as soon as its line is complete
+
+        The model writes one "HOST: ..." / "GUEST: ..." line per turn instead of a
+        function call, which only arrives once the whole dialogue is generated.
+
+        Args:
+            summary: Book summary
+            book_title: Title of the book
+            language: Language of the script
+            target_words: Target word count for the script
+            temperature: Sampling temperature (0.0 to 1.0)
+
+        Yields:
+            Dialogue turns with speaker and text, in order
+
+        """
+        logger.info(f"Streaming podcast script for '{book_title}' with target_words={target_words}")
+        prompt = self._create_podcast_prompt(summary, book_title, target_words, language, structured_output=False)
+        generation_config: GenerationConfigDict = {"temperature": temperature, "max_output_tokens": 4096}
+
+        estimated_tokens = count_tokens(prompt) + int(generation_config["max_output_tokens"])
+        await self.rate_limiter.acquire(estimated_tokens)
+        response = await self.flash_model.generate_content_async(prompt, generation_config=generation_config, stream=True)
+
+        buffer = ""
+        turn_count = 0
+        async for chunk in response:
+            buffer += _chunk_text(chunk)
+            complete, _, buffer = buffer.rpartition("\n")
+            for turn in self._parse_dialogue_from_text(complete):
+                turn_count += 1
+                yield turn
+        for turn in self._parse_dialogue_from_text(buffer):
+            turn_count += 1
+            yield turn
+
+        usage = getattr(response, "usage_metadata", None)
+        total_tokens = getattr(usage, "total_token_count", 0) if usage else 0
+        if total_tokens:
+            self.rate_limiter.refund(estimated_tokens - total_tokens)
+
+        if turn_count == 0:
+            finish_reason = response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
+            raise ValueError(f"No dialogue streamed (finish_reason={finish_reason})")
+        logger.info(f"Streamed {turn_count} dialogue turns")
+
+    async def translate_dialogue(
+        self,
+        turns: list[dict[str, str]],
+        book_title: str,
+        source_language: PodcastLanguage,
+        target_language: PodcastLanguage,
+        max_output_tokens: int = 4096,
+        temperature: float = 0.3,
+    ) -> list[str]:
+        """Translate dialogue turns in a single request
+
+        Args:
+            turns: Dialogue turns with speaker and text
+            book_title: Title of the book
+            source_language: Language of the turns
+            target_language: Language to translate into
+            max_output_tokens: Maximum number of output tokens
+            temperature: Sampling temperature
+
+        Returns:
+            The translated text of each turn, in order
+
+        Raises:
+            ValueError: If the response is not one translation per turn
+
+        """
+        template = str(get_prompts_with_language(target_language)["script_translation"])
+        prompt = template.format(
+            book_title=book_title,
+            source_language=source_language.value,
+            turn_count=len(turns),
+            turns=json.dumps(turns, ensure_ascii=False, indent=1),
+        )
+        response = await self._generate_content(
+            self.flash_model,
+            prompt,
+            generation_config={
+                "temperature": temperature,
+                "max_output_tokens": max_output_tokens,
+                "response_mime_type": "application/json",
+            },
+        )
+
+        translations = json.loads(self._extract_response_text(response))
+        if not isinstance(translations, list) or not all(isinstance(text, str) and text.strip() for text in translations):
+            raise ValueError("Translation response is not a list of non-empty strings")
+        if len(translations) != len(turns):
+            raise ValueError(f"Expected {len(turns)} translated turns, got {len(translations)}")
+        return [text.strip() for text in translations]
+
     async def _generate_with_simplified_prompt(
         self,
         summary: str,
@@ -263,7 +391,8 @@ GUEST: [what the guest says]
                 },
             )
 
-            response = await model.generate_content_async(
+            response = await self._generate_content(
+                model,
                 simplified_prompt,
                 generation_config={
                     "temperature": temperature * 0.7,  # Lower temperature for safety
@@ -303,7 +432,26 @@ GUEST: [what the guest says]
                 {"speaker": "GUEST", "text": "I agree. It's worth reading."},
             ]
 
-    def _create_podcast_prompt(self, summary: str, book_title: str, target_words: int, language: PodcastLanguage) -> str:
+    async def _generate_content(self, model: genai.GenerativeModel, prompt: str, generation_config: GenerationConfigDict) -> Any:  # noqa: ANN401
+        """Call the model once the shared rate limiter grants a request slot and token budget
+
+        The budget is estimated as prompt tokens plus max_output_tokens; the unused
+        part is returned once the response reports its actual usage.
+        """
+        estimated_tokens = count_tokens(prompt) + int(generation_config.get("max_output_tokens", 0))
+        await self.rate_limiter.acquire(estimated_tokens)
+
+        response = await model.generate_content_async(prompt, generation_config=generation_config)
+
+        usage = getattr(response, "usage_metadata", None)
+        total_tokens = getattr(usage, "total_token_count", 0) if usage else 0
+        if total_tokens:
+            self.rate_limiter.refund(estimated_tokens - total_tokens)
+        return response
+
+    def _create_podcast_prompt(
+        self, summary: str, book_title: str, target_words: int, language: PodcastLanguage, structured_output: bool = True
+    ) -> str:
         """Create the prompt for podcast script generation with enhanced safety"""
         lang_prompts = get_prompts_with_language(language)
         system_prompt = lang_prompts["system"]
@@ -331,6 +479,17 @@ IMPORTANT SAFETY GUIDELINES:
 - Ensure all content is suitable for general audiences
 """
 
+        if not structured_output:
+            return f"""{system_prompt}
+
+{safety_instruction}
+
+{script_prompt}
+
+Write the dialogue as plain text, one turn per line, each line starting with "HOST:" or "GUEST:" followed by what they say.
+Do not add any other text, headings or blank lines.
+Ensure all content follows the safety guidelines above."""
+
         # Combine system and script prompts with safety instructions
         return f"""{system_prompt}
 
@@ -485,6 +644,7 @@ Ensure all content follows the safety guidelines above."""
         language: PodcastLanguage,
         max_output_tokens: int = 800,
         temperature: float = 0.3,
+        section_labels: list[str] | None = None,
     ) -> str:
         """Combine multiple chapter summaries into a coherent book summary
 
@@ -494,6 +654,7 @@ Ensure all content follows the safety guidelines above."""
             max_output_tokens: Maximum number of output tokens
             temperature: Sampling temperature
             language: Language of the script
+            section_labels: Headings for the summaries (defaults to numbered chapters)
 
         Returns:
             Combined book summary
@@ -507,7 +668,9 @@ Ensure all content follows the safety guidelines above."""
         book_summary_template = str(book_summary_template)
 
         # Format chapter summaries based on language
-        if language == PodcastLanguage.JA_JP:
+        if section_labels is not None:
+            combined_text = "\n\n".join([f"{label}:\n{summary}" for label, summary in zip(section_labels, summaries, strict=True)])
+        elif language == PodcastLanguage.JA_JP:
             combined_text = "\n\n".join([f"第{i + 1}章:\n{summary}" for i, summary in enumerate(summaries)])
         elif language == PodcastLanguage.CMN_CN:
             combined_text = "\n\n".join([f"第{i + 1}章：\n{summary}" for i, summary in enumerate(summaries)])
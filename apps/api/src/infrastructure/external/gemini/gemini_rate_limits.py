@@ -0,0 +1,34 @@
+import logging
+
+from src.config.app_config import AppConfig
+from src.infrastructure.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Published gemini-2.5-flash limits per usage tier: (requests per minute, tokens per minute)
+GEMINI_TIER_LIMITS: dict[str, tuple[int, int]] = {
+    "free": (10, 250_000),
+    "tier1": (1_000, 1_000_000),
+    "tier2": (2_000, 3_000_000),
+    "tier3": (10_000, 8_000_000),
+}
+
+
+class GeminiRateLimiter:
+    """Process-wide rate limiter shared by every Gemini client"""
+
+    _shared_limiter: RateLimiter | None = None
+
+    @classmethod
+    def get_limiter(cls) -> RateLimiter:
+        """Get the shared limiter, sized from the configured tier (and explicit overrides)"""
+        if cls._shared_limiter is None:
+            config = AppConfig.get_config()
+            tier_rpm, tier_tpm = GEMINI_TIER_LIMITS[config.gemini_rate_limit_tier]
+            requests_per_minute = config.gemini_requests_per_minute or tier_rpm
+            tokens_per_minute = config.gemini_tokens_per_minute or tier_tpm
+            cls._shared_limiter = RateLimiter(
+                requests_per_minute, tokens_per_minute, config.llm_interactive_reserve_ratio, config.llm_interactive_window_seconds
+            )
+            logger.info(f"Gemini rate limit: {requests_per_minute} RPM, {tokens_per_minute} TPM (tier={config.gemini_rate_limit_tier})")
+        return cls._shared_limiter
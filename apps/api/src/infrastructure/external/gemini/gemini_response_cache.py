@@ -0,0 +1,94 @@
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from src.config.app_config import AppConfig
+from src.infrastructure.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiResponseCache:
+    """Reuses Gemini responses to identical requests
+
+    Responses are kept on disk for a limited time, so retries and regenerations
+    that send the same prompt cost neither quota nor rate limiter waits. Identical
+    requests already in flight in this process are coalesced into a single call.
+    Only successful responses are cached; a failure is seen by every coalesced
+    caller and the next request tries again.
+    """
+
+    _shared_cache: "GeminiResponseCache | None" = None
+
+    @classmethod
+    def get_cache(cls) -> "GeminiResponseCache":
+        """Get the process-wide cache (coalescing only when the disk cache is disabled)"""
+        if cls._shared_cache is None:
+            config = AppConfig.get_config()
+            max_bytes = config.gemini_cache_max_mb * 1024 * 1024
+            disk_cache = DiskCache(config.gemini_cache_dir, max_bytes) if max_bytes > 0 else None
+            cls._shared_cache = cls(disk_cache, config.gemini_cache_ttl_seconds)
+        return cls._shared_cache
+
+    def __init__(self, disk_cache: DiskCache | None, ttl_seconds: float) -> None:
+        self.disk_cache = disk_cache
+        self.ttl_seconds = ttl_seconds
+        self._in_flight: dict[str, asyncio.Future[str]] = {}
+
+    async def get_or_generate(self, key: str, generate: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached response for key, joining or starting the request that produces it
+
+        Args:
+            key: Hash of everything that determines the response (model, prompt, generation config)
+            generate: Sends the request and returns the response text
+
+        Returns:
+            Response text
+
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._load_or_generate(key, generate))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda future: self._forget(key, future))
+        else:
+            logger.info(f"Joining in-flight Gemini request {key[:12]}")
+        # A cancelled caller must not cancel the request other callers are waiting for
+        return await asyncio.shield(in_flight)
+
+    def _forget(self, key: str, future: asyncio.Future[str]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Retrieve the exception so a request nobody waits for anymore is not reported as unhandled
+        if not future.cancelled():
+            future.exception()
+
+    async def _load_or_generate(self, key: str, generate: Callable[[], Awaitable[str]]) -> str:
+        cached = await asyncio.to_thread(self._load, key)
+        if cached is not None:
+            logger.info(f"Reusing cached Gemini response {key[:12]}")
+            return cached
+        text = await generate()
+        await asyncio.to_thread(self._store, key, text)
+        return text
+
+    def _load(self, key: str) -> str | None:
+        if self.disk_cache is None:
+            return None
+        data = self.disk_cache.get(key)
+        if data is None:
+            return None
+        try:
+            entry = json.loads(data)
+            if time.time() - float(entry["created_at"]) > self.ttl_seconds:
+                return None
+            return str(entry["text"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable cached Gemini response {key[:12]}: {str(e)}")
+            return None
+
+    def _store(self, key: str, text: str) -> None:
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, json.dumps({"created_at": time.time(), "text": text}, ensure_ascii=False).encode("utf-8"))
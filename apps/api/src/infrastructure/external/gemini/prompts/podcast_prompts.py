@@ -40,6 +40,20 @@ Summary:
 """
 
 
+def _build_chapter_group_summary_prompt(language_rule: str) -> str:
+    """連続する複数章の要約プロンプトを構築"""
+    return f"""{language_rule}
+
+The following text contains several consecutive chapters (or parts of chapters) of a book, each starting with a "## " heading.
+Summarize each of them in order. Start each summary with the same "## " heading, then give its main ideas,
+key arguments, and important details in a concise, well-structured, and family-friendly way.
+
+{{chapter_content}}
+
+Summaries:
+"""
+
+
 def _build_book_summary_prompt(language_rule: str) -> str:
     """本の要約プロンプトを構築"""
     return f"""{language_rule}
@@ -97,14 +111,31 @@ Generate the dialogue in a structured format with speaker labels and their text.
 """
 
 
+def _build_script_translation_prompt(language_rule: str) -> str:
+    """台本の翻訳プロンプトを構築"""
+    return f"""{language_rule}
+
+Translate the following podcast dialogue turns about the book "{{book_title}}" from {{source_language}} into the language above.
+- Translate each turn as a natural spoken line by the same speaker, keeping its meaning and tone
+- Do not merge, split, drop, or reorder turns
+- Use the names of the book, its author, and its characters as they are commonly known in that language
+- Return only a JSON array of exactly {{turn_count}} strings: the translated turns, in the same order
+
+Turns (JSON):
+{{turns}}
+"""
+
+
 def get_prompts_with_language(language: PodcastLanguage = PodcastLanguage.EN_US):
     language_rule = build_language_prompts(language)
 
     return {
         "chapter_summary": _build_chapter_summary_prompt(language_rule),
+        "chapter_group_summary": _build_chapter_group_summary_prompt(language_rule),
         "book_summary": _build_book_summary_prompt(language_rule),
         "system": _build_system_prompt(language_rule),
         "script": _build_script_prompt(language_rule),
+        "script_translation": _build_script_translation_prompt(language_rule),
         "openings": [
             "Welcome to our book discussion podcast! Today we're diving into {book_title}.",
             "Hello everyone! We have an exciting book to talk about today: {book_title}.",
@@ -7,6 +7,7 @@ from langchain_openai import OpenAIEmbeddings
 from weaviate.classes.init import AdditionalConfig, Timeout
 
 from src.config.app_config import AppConfig
+from src.infrastructure.client_registry import ClientRegistry
 from src.infrastructure.memory.retry_decorator import retry_on_error
 
 logger = logging.getLogger(__name__)
@@ -41,9 +42,9 @@ class BaseVectorStore:
 
         self.client = BaseVectorStore._shared_client
 
-        # Embedding モデルも共有インスタンスとして保持
+        # Embedding モデルはクライアントレジストリの共有インスタンスを使う（HTTP接続もプールで共有）
         if BaseVectorStore._shared_embedding_model is None:
-            BaseVectorStore._shared_embedding_model = OpenAIEmbeddings(model="text-embedding-3-small", max_retries=2)
+            BaseVectorStore._shared_embedding_model = ClientRegistry.get_embedding_model()
 
         self.embedding_model = BaseVectorStore._shared_embedding_model
 
@@ -1,20 +1,31 @@
 """書籍コンテンツストア."""
 
+import asyncio
 import logging
 import tempfile
 from pathlib import Path
 
 from fastapi import UploadFile
-from langchain_community.document_loaders import UnstructuredEPubLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
 from langchain_weaviate.vectorstores import WeaviateVectorStore
 from weaviate.classes.query import Filter
 
+from src.infrastructure.external.epub import EpubParser, EpubSection
 from src.infrastructure.memory.base_vector_store import BaseVectorStore
+from src.infrastructure.memory.book_text_chunker import BookTextChunker
 from src.infrastructure.memory.retry_decorator import retry_on_error
 
 logger = logging.getLogger(__name__)
 
+# アップロードファイルを一時ファイルへコピーする際のチャンクサイズ
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+# ベクトル付きでチャンクを一括取得する際のページサイズ
+FETCH_PAGE_SIZE = 500
+
+# 検索結果に含める位置メタデータ（引用解決に使用）
+BOOK_CONTENT_METADATA_KEYS = ["book_id", "chunk_id", "spine_index", "chapter_title", "char_offset", "book_percentage", "cfi_range"]
+
 
 class BookContentStore(BaseVectorStore):
     """書籍コンテンツの処理とベクトル化に特化したストア."""
@@ -22,74 +33,117 @@ class BookContentStore(BaseVectorStore):
     def __init__(self) -> None:
         """書籍コンテンツストアの初期化."""
         super().__init__()
+        self.chunker = BookTextChunker()
 
     @retry_on_error(max_retries=3)
     async def create_book_vector_index(self, file: UploadFile, user_id: str, book_id: str) -> dict:
         """EPUBファイルを処理してBookContentコレクションにベクトルインデックス化する."""
         try:
-            # 一時ファイルとしてEPUBファイルを保存
+            # 一時ファイルとしてEPUBファイルを保存（チャンク単位でコピー）
             with tempfile.NamedTemporaryFile(suffix=".epub", delete=False) as temp_file:
-                file_content = await file.read()
-                temp_file.write(file_content)
+                while chunk := await file.read(UPLOAD_COPY_CHUNK_SIZE):
+                    temp_file.write(chunk)
                 temp_path = temp_file.name
 
             try:
-                # EPUBファイルを読み込み
-                docs = UnstructuredEPubLoader(temp_path).load()
-
-                # テキストを適切なサイズに分割
-                splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-                split_docs = splitter.split_documents(docs)
-
-                # 各ドキュメントにbook_idをメタデータとして追加
-                for doc in split_docs:
-                    doc.metadata["book_id"] = book_id
-
-                # ログ出力
-                logger.info(f"Creating book vector index with book_id: {book_id} for user: {user_id}")
-                logger.info(f"Number of document chunks: {len(split_docs)}")
-                if split_docs:
-                    logger.info(f"Sample document metadata: {split_docs[0].metadata}")
-
-                # バッチ処理でベクトルストアにドキュメントを保存
-                BATCH_SIZE = 100  # バッチサイズを定義  # noqa: N806
-                total_docs = len(split_docs)
-
-                for i in range(0, total_docs, BATCH_SIZE):
-                    batch_docs = split_docs[i : i + BATCH_SIZE]
-                    logger.info(f"Processing batch {i // BATCH_SIZE + 1}/{(total_docs + BATCH_SIZE - 1) // BATCH_SIZE}")
-
-                    # ベクトルストアにバッチを保存
-                    WeaviateVectorStore.from_documents(
-                        documents=batch_docs,
-                        embedding=self.embedding_model,
-                        client=self.client,
-                        index_name=self.BOOK_CONTENT_COLLECTION_NAME,
-                        text_key="content",
-                        tenant=user_id,
-                        batch_size=64,
-                    )
-
-                # 保存後の確認
-                self._verify_saved_content(user_id, book_id)
-
-                return {
-                    "message": "Upload and processing completed successfully",
-                    "file_name": file.filename,
-                    "chunk_count": len(split_docs),
-                    "index_name": self.BOOK_CONTENT_COLLECTION_NAME,
-                    "user_id": user_id,
-                    "book_id": book_id,
-                    "success": True,
-                }
+                return await self.create_book_vector_index_from_path(temp_path, file.filename or "", user_id, book_id)
             finally:
                 # 一時ファイルを削除
                 Path(temp_path).unlink(missing_ok=True)
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"書籍ベクトル化エラー: {str(e)}")
             raise ValueError(f"Error occurred during vector indexing: {str(e)}")
 
+    async def create_book_vector_index_from_path(
+        self, epub_path: str, file_name: str, user_id: str, book_id: str, content_hash: str | None = None
+    ) -> dict:
+        """ローカルのEPUBファイルを処理してBookContentコレクションにベクトルインデックス化する.
+
+        content_hashを渡すと、同じ内容のファイルの解析結果をキャッシュから再利用する.
+        """
+        try:
+            # EPUBファイルをスパイン順のセクションとして読み込み（解析は隔離されたワーカープロセスで実行）
+            sections = await EpubParser.parse_sections(epub_path, content_hash)
+
+            return await asyncio.to_thread(self._index_sections, sections, file_name, user_id, book_id)
+
+        except Exception as e:
+            logger.error(f"書籍ベクトル化エラー: {str(e)}")
+            raise ValueError(f"Error occurred during vector indexing: {str(e)}")
+
+    def _index_sections(self, sections: list[EpubSection], file_name: str, user_id: str, book_id: str) -> dict:
+        """セクションをチャンク化してベクトルストアに保存する."""
+        # トークン数を基準に分割し、位置情報をメタデータとして付与
+        split_docs = self._build_chunk_documents(sections, book_id)
+
+        # ログ出力
+        logger.info(f"Creating book vector index with book_id: {book_id} for user: {user_id}")
+        logger.info(f"Number of document chunks: {len(split_docs)}")
+        if split_docs:
+            logger.info(f"Sample document metadata: {split_docs[0].metadata}")
+
+        # バッチ処理でベクトルストアにドキュメントを保存
+        BATCH_SIZE = 100  # バッチサイズを定義  # noqa: N806
+        total_docs = len(split_docs)
+
+        for i in range(0, total_docs, BATCH_SIZE):
+            batch_docs = split_docs[i : i + BATCH_SIZE]
+            logger.info(f"Processing batch {i // BATCH_SIZE + 1}/{(total_docs + BATCH_SIZE - 1) // BATCH_SIZE}")
+
+            # ベクトルストアにバッチを保存
+            WeaviateVectorStore.from_documents(
+                documents=batch_docs,
+                embedding=self.embedding_model,
+                client=self.client,
+                index_name=self.BOOK_CONTENT_COLLECTION_NAME,
+                text_key="content",
+                tenant=user_id,
+                batch_size=64,
+            )
+
+        # 保存後の確認
+        self._verify_saved_content(user_id, book_id)
+
+        return {
+            "message": "Upload and processing completed successfully",
+            "file_name": file_name,
+            "chunk_count": len(split_docs),
+            "index_name": self.BOOK_CONTENT_COLLECTION_NAME,
+            "user_id": user_id,
+            "book_id": book_id,
+            "success": True,
+        }
+
+    def _build_chunk_documents(self, sections: list[EpubSection], book_id: str) -> list[Document]:
+        """セクションをチャンクに分割し、引用に使う位置メタデータを付与する."""
+        total_chars = sum(len(section.text) for section in sections) or 1
+        documents: list[Document] = []
+        section_start = 0
+
+        for section in sections:
+            for chunk_index, chunk in enumerate(self.chunker.split_text(section.text)):
+                char_offset = section_start + chunk.start_offset
+                metadata = {
+                    "book_id": book_id,
+                    "chunk_id": f"{section.spine_index}-{chunk_index}",
+                    "spine_index": section.spine_index,
+                    "chapter_title": section.title or "",
+                    "chunk_index": chunk_index,
+                    "token_count": chunk.token_count,
+                    "start_offset": chunk.start_offset,
+                    "end_offset": chunk.end_offset,
+                    "char_offset": char_offset,
+                    "book_percentage": round(char_offset / total_chars * 100, 1),
+                    "cfi_range": section.cfi_range(chunk.start_offset, chunk.end_offset) or "",
+                }
+                documents.append(Document(page_content=chunk.text, metadata=metadata))
+            section_start += len(section.text) + 1
+
+        return documents
+
     def _verify_saved_content(self, user_id: str, book_id: str) -> None:
         """保存されたコンテンツを確認."""
         try:
@@ -106,6 +160,33 @@ class BookContentStore(BaseVectorStore):
         except Exception as e:
             logger.error(f"Error verifying saved content: {str(e)}")
 
+    @retry_on_error(max_retries=2)
+    def get_book_chunks(self, user_id: str, book_id: str) -> list[dict]:
+        """書籍の全チャンクを埋め込みベクトル付きで読み順に取得する（未インデックスなら空リスト）."""
+        collection = self.client.collections.get(self.BOOK_CONTENT_COLLECTION_NAME).with_tenant(user_id)
+        chunks: list[dict] = []
+        offset = 0
+        while True:
+            response = collection.query.fetch_objects(
+                filters=Filter.by_property("book_id").equal(book_id),
+                limit=FETCH_PAGE_SIZE,
+                offset=offset,
+                include_vector=True,
+                return_properties=["content", "spine_index", "chapter_title", "chunk_index", "token_count"],
+            )
+            for obj in response.objects:
+                vector = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
+                if not vector:
+                    continue
+                chunks.append({**obj.properties, "vector": vector})
+            if len(response.objects) < FETCH_PAGE_SIZE:
+                break
+            offset += FETCH_PAGE_SIZE
+
+        chunks.sort(key=lambda chunk: (chunk.get("spine_index") or 0, chunk.get("chunk_index") or 0))
+        logger.info(f"Fetched {len(chunks)} indexed chunks for book_id: {book_id}")
+        return chunks
+
     @retry_on_error(max_retries=2)
     def delete_book_content(self, user_id: str, book_id: str) -> None:
         """書籍コンテンツをベクトルストアから削除."""
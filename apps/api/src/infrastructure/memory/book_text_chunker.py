@@ -0,0 +1,142 @@
+"""トークン数ベースの書籍テキスト分割."""
+
+import logging
+import re
+from dataclasses import dataclass
+
+from langchain_core.documents import Document
+
+from src.infrastructure.tokenizer import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# 文の区切り（日本語・中国語の句読点、閉じ括弧付きの文末、英語の文末、改行）
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"[。！？!?．]+[」』）)\"']*\s*|\.(?=\s)\s*|\n+")
+
+
+@dataclass
+class TextChunk:
+    """分割されたテキストチャンク."""
+
+    text: str
+    token_count: int
+    start_offset: int
+    end_offset: int
+
+
+@dataclass
+class _Span:
+    start: int
+    end: int
+    token_count: int
+
+
+class BookTextChunker:
+    """トークン数を基準に文境界でテキストを分割するチャンカー.
+
+    文字数ベースの分割ではCJKテキストのチャンクが英語の数倍のトークン数になるため、
+    トークナイザーで計測しながら句読点・改行の位置でチャンクを区切る.
+    """
+
+    def __init__(self, chunk_tokens: int = 400, overlap_tokens: int = 40) -> None:
+        """チャンカーの初期化.
+
+        Args:
+            chunk_tokens: 1チャンクあたりの最大トークン数
+            overlap_tokens: 隣接チャンク間で重複させる最大トークン数
+
+        """
+        if overlap_tokens >= chunk_tokens:
+            raise ValueError("overlap_tokens must be smaller than chunk_tokens")
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+
+    def split_text(self, text: str) -> list[TextChunk]:
+        """テキストをチャンクに分割する."""
+        spans = self._split_spans(text)
+        chunks: list[TextChunk] = []
+        window: list[_Span] = []
+        window_tokens = 0
+
+        for span in spans:
+            if window and window_tokens + span.token_count > self.chunk_tokens:
+                chunks.append(self._build_chunk(text, window))
+                window = self._overlap_tail(window)
+                window_tokens = sum(s.token_count for s in window)
+            window.append(span)
+            window_tokens += span.token_count
+
+        if window:
+            chunks.append(self._build_chunk(text, window))
+
+        return [chunk for chunk in chunks if chunk.text]
+
+    def split_documents(self, documents: list[Document]) -> list[Document]:
+        """ドキュメントを分割し、トークン数とオフセットをメタデータに記録する."""
+        split_docs: list[Document] = []
+        for document in documents:
+            for index, chunk in enumerate(self.split_text(document.page_content)):
+                metadata = {
+                    **document.metadata,
+                    "chunk_index": index,
+                    "token_count": chunk.token_count,
+                    "start_offset": chunk.start_offset,
+                    "end_offset": chunk.end_offset,
+                }
+                split_docs.append(Document(page_content=chunk.text, metadata=metadata))
+        return split_docs
+
+    def _split_spans(self, text: str) -> list[_Span]:
+        """テキストを文単位のスパンに分割する（長すぎる文はさらに分割）."""
+        spans: list[_Span] = []
+        start = 0
+        boundaries = [m.end() for m in SENTENCE_BOUNDARY_PATTERN.finditer(text)]
+        if not boundaries or boundaries[-1] != len(text):
+            boundaries.append(len(text))
+
+        for end in boundaries:
+            if end <= start:
+                continue
+            if text[start:end].strip():
+                spans.extend(self._measure_span(text, start, end))
+            start = end
+        return spans
+
+    def _measure_span(self, text: str, start: int, end: int) -> list[_Span]:
+        """スパンのトークン数を計測し、上限を超える場合は文字位置で等分する."""
+        token_count = count_tokens(text[start:end])
+        if token_count <= self.chunk_tokens:
+            return [_Span(start, end, token_count)]
+
+        # 句読点のない長文は、トークン密度から1チャンク分の文字数を見積もって分割する
+        chars_per_piece = max(1, (end - start) * self.chunk_tokens // token_count)
+        pieces: list[_Span] = []
+        for piece_start in range(start, end, chars_per_piece):
+            piece_end = min(piece_start + chars_per_piece, end)
+            pieces.append(_Span(piece_start, piece_end, count_tokens(text[piece_start:piece_end])))
+        return pieces
+
+    def _overlap_tail(self, window: list[_Span]) -> list[_Span]:
+        """次のチャンクへ引き継ぐ末尾スパンを選ぶ."""
+        tail: list[_Span] = []
+        tail_tokens = 0
+        # 少なくとも1スパンは次のチャンクに進める
+        for span in reversed(window[1:]):
+            if tail_tokens + span.token_count > self.overlap_tokens:
+                break
+            tail.insert(0, span)
+            tail_tokens += span.token_count
+        return tail
+
+    def _build_chunk(self, text: str, window: list[_Span]) -> TextChunk:
+        """スパン列からチャンクを組み立てる."""
+        start = window[0].start
+        end = window[-1].end
+        raw = text[start:end]
+        stripped = raw.strip()
+        if not stripped:
+            return TextChunk(text="", token_count=0, start_offset=start, end_offset=start)
+
+        start += len(raw) - len(raw.lstrip())
+        end = start + len(stripped)
+        return TextChunk(text=stripped, token_count=count_tokens(stripped), start_offset=start, end_offset=end)
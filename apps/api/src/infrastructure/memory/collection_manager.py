@@ -97,6 +97,16 @@ class CollectionManager(BaseVectorStore):
                 properties=[
                     Property(name="content", data_type=DataType.TEXT),
                     Property(name="book_id", data_type=DataType.TEXT, index_searchable=True, description="書籍ID"),
+                    Property(name="chunk_id", data_type=DataType.TEXT, description="チャンクID（スパイン番号-チャンク番号）"),
+                    Property(name="spine_index", data_type=DataType.INT, description="スパイン内の位置"),
+                    Property(name="chapter_title", data_type=DataType.TEXT, description="章タイトル"),
+                    Property(name="chunk_index", data_type=DataType.INT, description="章内のチャンク番号"),
+                    Property(name="token_count", data_type=DataType.INT, description="チャンクのトークン数"),
+                    Property(name="start_offset", data_type=DataType.INT, description="章テキスト内の開始文字位置"),
+                    Property(name="end_offset", data_type=DataType.INT, description="章テキスト内の終了文字位置"),
+                    Property(name="char_offset", data_type=DataType.INT, description="書籍全体での開始文字位置"),
+                    Property(name="book_percentage", data_type=DataType.NUMBER, description="書籍全体に対する位置（%）"),
+                    Property(name="cfi_range", data_type=DataType.TEXT, description="EPUB CFI範囲"),
                 ],
                 multi_tenancy_config=Configure.multi_tenancy(
                     enabled=True,
@@ -54,6 +54,16 @@ class MemoryVectorStore(BaseVectorStore):
         """EPUBファイルを処理してBookContentコレクションにベクトルインデックス化する."""
         return await self.book_content.create_book_vector_index(file, user_id, book_id)
 
+    async def create_book_vector_index_from_path(
+        self, epub_path: str, file_name: str, user_id: str, book_id: str, content_hash: str | None = None
+    ) -> dict:
+        """ローカルのEPUBファイルを処理してBookContentコレクションにベクトルインデックス化する."""
+        return await self.book_content.create_book_vector_index_from_path(epub_path, file_name, user_id, book_id, content_hash)
+
+    def get_book_chunks(self, user_id: str, book_id: str) -> list[dict]:
+        """書籍の全チャンクを埋め込みベクトル付きで読み順に取得する."""
+        return self.book_content.get_book_chunks(user_id, book_id)
+
     # アノテーション関連のメソッド（BookAnnotationStoreに委譲）
     def search_highlights(self, user_id: str, book_id: str, query_vector: list[float], limit: int = 3) -> list[dict[str, Any]]:
         """ハイライト（BookAnnotationコレクション）をベクトル検索する."""
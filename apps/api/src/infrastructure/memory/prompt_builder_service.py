@@ -3,22 +3,13 @@
 import logging
 from typing import Any
 
-import tiktoken
-from tiktoken.core import Encoding
-
 from src.config.app_config import AppConfig
 from src.domain.message.entities.message import Message
 from src.infrastructure.memory.memory_retrieval_service import MemoryRetrievalService
+from src.infrastructure.tokenizer import count_tokens, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
-# tiketokenエンコーダー（トークンカウント用）
-TIKTOKEN_ENCODING: Encoding | None = None
-try:
-    TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")  # GPT-4用のエンコーディング
-except Exception as e:
-    logger.warning(f"tiktokenの初期化に失敗しました: {str(e)}")
-
 
 class PromptBuilderService:
     """プロンプト構築に特化したサービス."""
@@ -109,22 +100,11 @@ class PromptBuilderService:
 
     def _estimate_tokens(self, text: str) -> int:
         """テキストのトークン数を推定."""
-        if TIKTOKEN_ENCODING:
-            return len(TIKTOKEN_ENCODING.encode(text))
-        # フォールバック: 簡易的なトークン数推定
-        return len(text) // 4
+        return count_tokens(text)
 
     def _truncate_text_to_tokens(self, text: str, max_tokens: int) -> str:
         """トークン数制限に基づいてテキストを切り詰める."""
-        if TIKTOKEN_ENCODING:
-            tokens = TIKTOKEN_ENCODING.encode(text)
-            if len(tokens) <= max_tokens:
-                return text
-            return TIKTOKEN_ENCODING.decode(tokens[:max_tokens]) + "..."
-
-        # フォールバック: 大まかな文字数で切り詰め
-        char_per_token = 4  # 平均的な文字/トークン比
-        max_chars = max_tokens * char_per_token
-        if len(text) <= max_chars:
+        truncated = truncate_to_tokens(text, max_tokens)
+        if truncated == text:
             return text
-        return text[:max_chars] + "..."
+        return truncated + "..."
@@ -5,10 +5,11 @@ from datetime import datetime
 
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 
 from src.config.app_config import AppConfig
+from src.infrastructure.client_registry import ClientRegistry
 from src.infrastructure.memory.memory_vector_store import MemoryVectorStore
+from src.infrastructure.rate_limiter import RequestPriority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,9 @@ class SummarizationService:
         """チャットの要約を同期的に生成（条件を満たす場合）."""
         # メッセージ数が閾値の倍数に達した場合に要約を実行
         if message_count > 0 and message_count % self.memory_summarize_threshold == 0:
-            self._summarize_and_vectorize_background(chat_id=chat_id, user_id=user_id)
+            # チャットの応答を待たせないよう、要約とそのベクトル化はバックグラウンドの枠で行う
+            with request_priority(RequestPriority.BACKGROUND):
+                self._summarize_and_vectorize_background(chat_id=chat_id, user_id=user_id)
 
     def _summarize_and_vectorize_background(self, chat_id: str, user_id: str) -> None:
         """チャットメッセージを要約してベクトル化する処理."""
@@ -137,7 +140,7 @@ class SummarizationService:
                 ]
             )
 
-            summary_chain = prompt | ChatOpenAI(model_name="gpt-4o") | StrOutputParser()
+            summary_chain = prompt | ClientRegistry.get_chat_model() | StrOutputParser()
             return summary_chain.invoke({"text": text_to_summarize})
 
         except Exception as e:
@@ -0,0 +1,162 @@
+"""OpenAI APIのレート制限と、それを適用するチャット・埋め込みモデル."""
+
+import logging
+import math
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+from src.config.app_config import AppConfig
+from src.infrastructure.rate_limiter import RateLimiter
+from src.infrastructure.tokenizer import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# max_tokensを指定しない呼び出しで見込む出力トークン数
+DEFAULT_OUTPUT_TOKENS_ESTIMATE = 1024
+
+
+class OpenAIRateLimiter:
+    """OpenAI APIの呼び出しでプロセス全体が共有するレートリミッター.
+
+    OpenAIの上限はモデルごとに数えられるため、チャットと埋め込みで別の枠を持つ.
+    """
+
+    _chat_limiter: RateLimiter | None = None
+    _embedding_limiter: RateLimiter | None = None
+
+    @classmethod
+    def get_chat_limiter(cls) -> RateLimiter:
+        """チャットモデルの共有レートリミッターを取得する."""
+        if cls._chat_limiter is None:
+            config = AppConfig.get_config()
+            cls._chat_limiter = cls._create("chat", config.openai_chat_requests_per_minute, config.openai_chat_tokens_per_minute)
+        return cls._chat_limiter
+
+    @classmethod
+    def get_embedding_limiter(cls) -> RateLimiter:
+        """埋め込みモデルの共有レートリミッターを取得する."""
+        if cls._embedding_limiter is None:
+            config = AppConfig.get_config()
+            cls._embedding_limiter = cls._create("embedding", config.openai_embedding_requests_per_minute, config.openai_embedding_tokens_per_minute)
+        return cls._embedding_limiter
+
+    @classmethod
+    def _create(cls, name: str, requests_per_minute: int, tokens_per_minute: int) -> RateLimiter:
+        config = AppConfig.get_config()
+        logger.info(f"OpenAI {name} のレート制限: {requests_per_minute} RPM, {tokens_per_minute} TPM")
+        return RateLimiter(requests_per_minute, tokens_per_minute, config.llm_interactive_reserve_ratio, config.llm_interactive_window_seconds)
+
+
+class RateLimitedChatOpenAI(ChatOpenAI):
+    """呼び出しの前に共有のレート制限の枠を取得するチャットモデル（優先度は現在のコンテキストに従う）."""
+
+    def _estimate_tokens(self, messages: list[BaseMessage]) -> int:
+        prompt_tokens = sum(count_tokens(message.text) for message in messages)
+        return prompt_tokens + (self.max_tokens or DEFAULT_OUTPUT_TOKENS_ESTIMATE)
+
+    def _refund(self, estimated_tokens: int, result: ChatResult) -> None:
+        token_usage = (result.llm_output or {}).get("token_usage") or {}
+        total_tokens = token_usage.get("total_tokens")
+        if total_tokens is not None:
+            OpenAIRateLimiter.get_chat_limiter().refund(estimated_tokens - int(total_tokens))
+
+    def _refund_stream(self, estimated_tokens: int, total_tokens: int | None, completed: bool) -> None:
+        """ストリーミングの見込みとの差を返却する（失敗・中断したストリームは見込み全体を返す）."""
+        if not completed:
+            OpenAIRateLimiter.get_chat_limiter().refund(estimated_tokens)
+        elif total_tokens is not None:
+            OpenAIRateLimiter.get_chat_limiter().refund(estimated_tokens - total_tokens)
+
+    @staticmethod
+    def _chunk_total_tokens(chunk: ChatGenerationChunk) -> int | None:
+        """使用量を含むチャンク（stream_usage有効時の最後のチャンク）の合計トークン数."""
+        usage = getattr(chunk.message, "usage_metadata", None)
+        return int(usage["total_tokens"]) if usage else None
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        estimated_tokens = self._estimate_tokens(messages)
+        OpenAIRateLimiter.get_chat_limiter().acquire_blocking(estimated_tokens)
+        try:
+            result = super()._generate(messages, stop, run_manager, **kwargs)
+        except BaseException:
+            # 失敗した呼び出し（429やタイムアウトなど）は見込んだトークンを使っていない
+            OpenAIRateLimiter.get_chat_limiter().refund(estimated_tokens)
+            raise
+        self._refund(estimated_tokens, result)
+        return result
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        estimated_tokens = self._estimate_tokens(messages)
+        await OpenAIRateLimiter.get_chat_limiter().acquire(estimated_tokens)
+        try:
+            result = await super()._agenerate(messages, stop, run_manager, **kwargs)
+        except BaseException:
+            OpenAIRateLimiter.get_chat_limiter().refund(estimated_tokens)
+            raise
+        self._refund(estimated_tokens, result)
+        return result
+
+    def _stream(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> Iterator[ChatGenerationChunk]:  # noqa: ANN401
+        estimated_tokens = self._estimate_tokens(messages)
+        OpenAIRateLimiter.get_chat_limiter().acquire_blocking(estimated_tokens)
+        total_tokens = None
+        completed = False
+        try:
+            for chunk in super()._stream(messages, *args, **kwargs):
+                total_tokens = self._chunk_total_tokens(chunk) or total_tokens
+                yield chunk
+            completed = True
+        finally:
+            self._refund_stream(estimated_tokens, total_tokens, completed)
+
+    async def _astream(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:  # noqa: ANN401
+        estimated_tokens = self._estimate_tokens(messages)
+        await OpenAIRateLimiter.get_chat_limiter().acquire(estimated_tokens)
+        total_tokens = None
+        completed = False
+        try:
+            async for chunk in super()._astream(messages, *args, **kwargs):
+                total_tokens = self._chunk_total_tokens(chunk) or total_tokens
+                yield chunk
+            completed = True
+        finally:
+            # キャンセルやクライアントの切断でストリームが閉じられた場合も返却する
+            self._refund_stream(estimated_tokens, total_tokens, completed)
+
+
+class RateLimitedOpenAIEmbeddings(OpenAIEmbeddings):
+    """呼び出しの前に共有のレート制限の枠を取得する埋め込みモデル（優先度は現在のコンテキストに従う）."""
+
+    def _estimate(self, texts: list[str], chunk_size: int | None) -> tuple[int, int]:
+        """推定トークン数と、分割して送られるリクエスト数を返す."""
+        requests = max(1, math.ceil(len(texts) / (chunk_size or self.chunk_size)))
+        return sum(count_tokens(text) for text in texts), requests
+
+    def embed_documents(self, texts: list[str], chunk_size: int | None = None, **kwargs: Any) -> list[list[float]]:  # noqa: ANN401
+        """枠を取得してからテキストを埋め込む."""
+        tokens, requests = self._estimate(texts, chunk_size)
+        OpenAIRateLimiter.get_embedding_limiter().acquire_blocking(tokens, requests=requests)
+        return super().embed_documents(texts, chunk_size, **kwargs)
+
+    async def aembed_documents(self, texts: list[str], chunk_size: int | None = None, **kwargs: Any) -> list[list[float]]:  # noqa: ANN401
+        """枠を取得してからテキストを非同期に埋め込む."""
+        tokens, requests = self._estimate(texts, chunk_size)
+        await OpenAIRateLimiter.get_embedding_limiter().acquire(tokens, requests=requests)
+        return await super().aembed_documents(texts, chunk_size, **kwargs)
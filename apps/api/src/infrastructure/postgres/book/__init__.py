@@ -1,4 +1,6 @@
 from src.infrastructure.postgres.book.book_dto import BookDTO
+from src.infrastructure.postgres.book.book_index_job_dto import BookIndexJobDTO
+from src.infrastructure.postgres.book.book_index_job_queue import BookIndexJobQueueImpl
 from src.infrastructure.postgres.book.book_repository import BookRepositoryImpl
 
-__all__ = ["BookDTO", "BookRepositoryImpl"]
+__all__ = ["BookDTO", "BookIndexJobDTO", "BookIndexJobQueueImpl", "BookRepositoryImpl"]
@@ -0,0 +1,42 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db import Base
+from src.domain.book.entities.book_index_job import BookIndexJob, BookIndexJobStatus
+from src.domain.book.value_objects.book_id import BookId
+from src.infrastructure.postgres.db_util import TimestampMixin
+
+
+class BookIndexJobDTO(TimestampMixin, Base):
+    __tablename__ = "book_index_jobs"
+    __table_args__ = (Index("ix_book_index_jobs_status_available_at", "status", "available_at"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
+    book_id: Mapped[str] = mapped_column(String, ForeignKey("books.id", ondelete="CASCADE"), index=True, nullable=False)
+    status: Mapped[BookIndexJobStatus] = mapped_column(
+        Enum(BookIndexJobStatus, name="book_index_job_status_enum"),
+        nullable=False,
+        default=BookIndexJobStatus.QUEUED,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_by: Mapped[str | None] = mapped_column(String, nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    def to_entity(self) -> BookIndexJob:
+        """Convert DTO to domain entity"""
+        return BookIndexJob(
+            id=self.id,
+            book_id=BookId(self.book_id),
+            status=BookIndexJobStatus(self.status),
+            attempts=self.attempts,
+            max_attempts=self.max_attempts,
+            locked_by=self.locked_by,
+            locked_until=self.locked_until,
+            last_error=self.last_error,
+        )
@@ -0,0 +1,132 @@
+from datetime import timedelta
+
+from sqlalchemy import func, update
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+from src.domain.book.entities.book_index_job import BookIndexJob, BookIndexJobStatus
+from src.domain.book.repositories.book_index_job_queue import BookIndexJobQueue
+from src.domain.book.value_objects.book_id import BookId
+from src.infrastructure.postgres.book.book_index_job_dto import BookIndexJobDTO
+
+ACTIVE_STATUSES = (BookIndexJobStatus.QUEUED, BookIndexJobStatus.RUNNING)
+
+
+class BookIndexJobQueueImpl(BookIndexJobQueue):
+    """SELECT ... FOR UPDATE SKIP LOCKED を使うPostgres上のジョブキュー
+
+    ロック有効期間はデータベースの時刻で計算するため、APIとワーカーのホストの時刻を揃える必要はない
+    (ポッドキャスト生成のジョブキューと同じ方式)
+    """
+
+    def __init__(self, session: Session, max_attempts: int = 3) -> None:
+        self._session = session
+        self._max_attempts = max_attempts
+
+    async def enqueue(self, book_id: BookId) -> BookIndexJob:
+        """書籍のインデックス作成ジョブを登録する（待機中・実行中のジョブがあればそれを返す）"""
+        try:
+            stmt = (
+                select(BookIndexJobDTO)
+                .where((BookIndexJobDTO.book_id == book_id.value) & (BookIndexJobDTO.status.in_(ACTIVE_STATUSES)))
+                .with_for_update()
+            )
+            existing = self._session.execute(stmt).scalars().first()
+            if existing:
+                self._session.commit()
+                return existing.to_entity()
+
+            dto = BookIndexJobDTO(book_id=book_id.value, status=BookIndexJobStatus.QUEUED, attempts=0, max_attempts=self._max_attempts)
+            self._session.add(dto)
+            self._session.commit()
+            return dto.to_entity()
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    async def claim(self, worker_id: str, visibility_timeout_seconds: float) -> BookIndexJob | None:
+        """最も古い待機中のジョブを、ロック有効期間が切れるまでこのワーカーに割り当てる"""
+        try:
+            stmt = (
+                select(BookIndexJobDTO)
+                .where((BookIndexJobDTO.status == BookIndexJobStatus.QUEUED) & (BookIndexJobDTO.available_at <= func.now()))
+                .order_by(BookIndexJobDTO.available_at.asc())
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            dto = self._session.execute(stmt).scalar_one_or_none()
+            if dto is None:
+                self._session.commit()
+                return None
+
+            dto.status = BookIndexJobStatus.RUNNING
+            dto.attempts += 1
+            dto.locked_by = worker_id
+            dto.locked_until = func.now() + timedelta(seconds=visibility_timeout_seconds)
+            self._session.commit()
+            self._session.refresh(dto)
+            return dto.to_entity()
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    async def extend_lease(self, job_id: str, worker_id: str, visibility_timeout_seconds: float) -> bool:
+        """実行中のジョブのロックを延長する（ロックを失っていればFalse）"""
+        try:
+            stmt = (
+                update(BookIndexJobDTO)
+                .where(
+                    (BookIndexJobDTO.id == job_id) & (BookIndexJobDTO.locked_by == worker_id) & (BookIndexJobDTO.status == BookIndexJobStatus.RUNNING)
+                )
+                .values(locked_until=func.now() + timedelta(seconds=visibility_timeout_seconds))
+                .returning(BookIndexJobDTO.id)
+            )
+            extended = self._session.execute(stmt).first() is not None
+            self._session.commit()
+            return extended
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    async def complete(self, job_id: str) -> None:
+        """ジョブを成功にする"""
+        self._finish(job_id, BookIndexJobStatus.SUCCEEDED, None)
+
+    async def fail(self, job_id: str, error_message: str) -> None:
+        """ジョブを失敗にする"""
+        self._finish(job_id, BookIndexJobStatus.FAILED, error_message)
+
+    async def recover_abandoned(self) -> tuple[list[BookIndexJob], list[BookIndexJob]]:
+        """ロック有効期間が切れた実行中のジョブを解放する"""
+        try:
+            stmt = (
+                select(BookIndexJobDTO)
+                .where((BookIndexJobDTO.status == BookIndexJobStatus.RUNNING) & (BookIndexJobDTO.locked_until < func.now()))
+                .with_for_update(skip_locked=True)
+            )
+            requeued: list[BookIndexJob] = []
+            exhausted: list[BookIndexJob] = []
+            for dto in self._session.execute(stmt).scalars().all():
+                dto.locked_by = None
+                dto.locked_until = None
+                if dto.attempts < dto.max_attempts:
+                    dto.status = BookIndexJobStatus.QUEUED
+                    requeued.append(dto.to_entity())
+                else:
+                    dto.status = BookIndexJobStatus.FAILED
+                    dto.last_error = "Job abandoned too many times (worker crashed or timed out)"
+                    exhausted.append(dto.to_entity())
+            self._session.commit()
+            return requeued, exhausted
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    def _finish(self, job_id: str, status: BookIndexJobStatus, error_message: str | None) -> None:
+        try:
+            stmt = update(BookIndexJobDTO).where(BookIndexJobDTO.id == job_id).values(status=status, locked_until=None, last_error=error_message)
+            self._session.execute(stmt)
+            self._session.commit()
+        except Exception as e:
+            self._session.rollback()
+            raise e
@@ -1,3 +1,5 @@
+from .podcast_artifact_repository import PodcastArtifactRepositoryImpl
+from .podcast_job_queue import PodcastJobQueueImpl
 from .podcast_repository import PodcastRepositoryImpl
 
-__all__ = ["PodcastRepositoryImpl"]
+__all__ = ["PodcastArtifactRepositoryImpl", "PodcastJobQueueImpl", "PodcastRepositoryImpl"]
@@ -0,0 +1,53 @@
+from sqlalchemy import JSON, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db import Base
+from src.domain.podcast.entities.podcast_artifact import PodcastArtifact
+from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.domain.podcast.value_objects.podcast_audio_segment import PodcastAudioSegment, PodcastAudioSegmentDict
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.domain.podcast.value_objects.podcast_script import PodcastScript, ScriptTurnDict
+from src.infrastructure.postgres.db_util import TimestampMixin
+
+
+class PodcastArtifactDTO(TimestampMixin, Base):
+    __tablename__ = "podcast_artifacts"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    book_hash: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    language: Mapped[str] = mapped_column(String(10), nullable=False)
+    config_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    script: Mapped[list[ScriptTurnDict]] = mapped_column(JSON, nullable=False)
+    audio_url: Mapped[str] = mapped_column(String, nullable=False)
+    audio_segments: Mapped[list[PodcastAudioSegmentDict] | None] = mapped_column(JSON, nullable=True)
+    # Kept when the source podcast is deleted: its audio files are not removed with it
+    source_podcast_id: Mapped[str | None] = mapped_column(String, ForeignKey("podcasts.id", ondelete="SET NULL"), nullable=True)
+
+    def to_entity(self) -> PodcastArtifact:
+        """Convert DTO to domain entity"""
+        return PodcastArtifact(
+            key=self.key,
+            book_hash=self.book_hash,
+            language=PodcastLanguage(self.language),
+            config_version=self.config_version,
+            script=PodcastScript.from_list(self.script),
+            audio_url=self.audio_url,
+            audio_segments=[PodcastAudioSegment.from_dict(segment) for segment in self.audio_segments or []],
+            source_podcast_id=PodcastId(self.source_podcast_id) if self.source_podcast_id else None,
+            created_at=self.created_at,
+        )
+
+    @classmethod
+    def from_entity(cls, artifact: PodcastArtifact) -> "PodcastArtifactDTO":
+        """Create DTO from domain entity"""
+        return cls(
+            key=artifact.key,
+            book_hash=artifact.book_hash,
+            language=artifact.language.value,
+            config_version=artifact.config_version,
+            script=artifact.script.to_list(),
+            audio_url=artifact.audio_url,
+            audio_segments=[segment.to_dict() for segment in artifact.audio_segments],
+            source_podcast_id=artifact.source_podcast_id.value if artifact.source_podcast_id else None,
+            created_at=artifact.created_at,
+        )
@@ -0,0 +1,41 @@
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+from src.domain.podcast.entities.podcast_artifact import PodcastArtifact
+from src.domain.podcast.repositories.podcast_artifact_repository import PodcastArtifactRepository
+from src.infrastructure.postgres.podcast.podcast_artifact_dto import PodcastArtifactDTO
+
+
+class PodcastArtifactRepositoryImpl(PodcastArtifactRepository):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    async def find_by_key(self, key: str) -> PodcastArtifact | None:
+        """Find the artifact generated for a book content, language and config version"""
+        stmt = select(PodcastArtifactDTO).where(PodcastArtifactDTO.key == key)
+        dto = self._session.execute(stmt).scalar_one_or_none()
+        return dto.to_entity() if dto else None
+
+    async def find_by_book_hash(self, book_hash: str, config_version: str) -> list[PodcastArtifact]:
+        """Find the artifacts generated for a book content and config version, in every language"""
+        stmt = (
+            select(PodcastArtifactDTO)
+            .where((PodcastArtifactDTO.book_hash == book_hash) & (PodcastArtifactDTO.config_version == config_version))
+            .order_by(PodcastArtifactDTO.created_at.asc())
+        )
+        return [dto.to_entity() for dto in self._session.execute(stmt).scalars().all()]
+
+    async def save(self, artifact: PodcastArtifact) -> None:
+        """Save an artifact (the first one saved for a key is kept)"""
+        dto = PodcastArtifactDTO.from_entity(artifact)
+        # Unset columns (updated_at) are left to their server defaults
+        values = {column.name: getattr(dto, column.name) for column in PodcastArtifactDTO.__table__.columns if getattr(dto, column.name) is not None}
+        # Concurrent generations of the same book may finish together; either result is equivalent
+        stmt = insert(PodcastArtifactDTO).values(**values).on_conflict_do_nothing(index_elements=[PodcastArtifactDTO.key])
+        try:
+            self._session.execute(stmt)
+            self._session.commit()
+        except Exception as e:
+            self._session.rollback()
+            raise e
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import JSON, Enum, ForeignKey, String
+from sqlalchemy import JSON, Enum, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.config.db import Base
@@ -9,7 +9,9 @@ from src.domain.book.value_objects.book_id import BookId
 from src.domain.chat.value_objects.user_id import UserId
 from src.domain.podcast.entities.podcast import Podcast
 from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.domain.podcast.value_objects.podcast_audio_segment import PodcastAudioSegment, PodcastAudioSegmentDict
 from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.domain.podcast.value_objects.podcast_progress import PodcastGenerationStage, PodcastProgress
 from src.domain.podcast.value_objects.podcast_script import PodcastScript, ScriptTurnDict
 from src.domain.podcast.value_objects.podcast_status import PodcastStatus, PodcastStatusEnum
 from src.infrastructure.postgres.db_util import TimestampMixin
@@ -28,6 +30,7 @@ class PodcastDTO(TimestampMixin, Base):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     language: Mapped[str] = mapped_column(String(10), nullable=False, default=PodcastLanguage.EN_US.value)
     audio_url: Mapped[str | None] = mapped_column(String, nullable=True)
+    audio_segments: Mapped[list[PodcastAudioSegmentDict] | None] = mapped_column(JSON, nullable=True)
     status: Mapped[PodcastStatusEnum] = mapped_column(
         Enum(PodcastStatusEnum, name="podcast_status_enum"),
         nullable=False,
@@ -35,6 +38,9 @@ class PodcastDTO(TimestampMixin, Base):
     )
     script: Mapped[list[ScriptTurnDict] | None] = mapped_column(JSON, nullable=True)
     error_message: Mapped[str | None] = mapped_column(String, nullable=True)
+    progress_stage: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    progress_current: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    progress_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Relationships
     book: Mapped["BookDTO"] = relationship("BookDTO", back_populates="podcasts", uselist=False)
@@ -53,9 +59,11 @@ class PodcastDTO(TimestampMixin, Base):
             title=str(self.title),
             language=PodcastLanguage(self.language),
             audio_url=str(self.audio_url) if self.audio_url else None,
+            audio_segments=[PodcastAudioSegment.from_dict(segment) for segment in self.audio_segments or []],
             status=PodcastStatus.from_string(str(self.status.value)),
             script=script_obj,
             error_message=self.error_message,
+            progress=self.progress_from_columns(self.progress_stage, self.progress_current, self.progress_total),
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
@@ -74,9 +82,20 @@ class PodcastDTO(TimestampMixin, Base):
             title=podcast.title,
             language=podcast.language.value,
             audio_url=podcast.audio_url,
+            audio_segments=[segment.to_dict() for segment in podcast.audio_segments],
             status=podcast.status.value,
             script=script_data,
             error_message=podcast.error_message,
+            progress_stage=podcast.progress.stage.value if podcast.progress else None,
+            progress_current=podcast.progress.current if podcast.progress else None,
+            progress_total=podcast.progress.total if podcast.progress else None,
             created_at=podcast.created_at,
             updated_at=podcast.updated_at,
         )
+
+    @staticmethod
+    def progress_from_columns(stage: str | None, current: int | None, total: int | None) -> PodcastProgress | None:
+        """Convert the progress columns to a value object"""
+        if not stage:
+            return None
+        return PodcastProgress(stage=PodcastGenerationStage(stage), current=current, total=total)
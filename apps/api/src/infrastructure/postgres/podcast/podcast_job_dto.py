@@ -0,0 +1,42 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db import Base
+from src.domain.podcast.entities.podcast_job import PodcastJob, PodcastJobStatus
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.infrastructure.postgres.db_util import TimestampMixin
+
+
+class PodcastJobDTO(TimestampMixin, Base):
+    __tablename__ = "podcast_jobs"
+    __table_args__ = (Index("ix_podcast_jobs_status_available_at", "status", "available_at"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
+    podcast_id: Mapped[str] = mapped_column(String, ForeignKey("podcasts.id", ondelete="CASCADE"), index=True, nullable=False)
+    status: Mapped[PodcastJobStatus] = mapped_column(
+        Enum(PodcastJobStatus, name="podcast_job_status_enum"),
+        nullable=False,
+        default=PodcastJobStatus.QUEUED,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_by: Mapped[str | None] = mapped_column(String, nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    def to_entity(self) -> PodcastJob:
+        """Convert DTO to domain entity"""
+        return PodcastJob(
+            id=self.id,
+            podcast_id=PodcastId(self.podcast_id),
+            status=PodcastJobStatus(self.status),
+            attempts=self.attempts,
+            max_attempts=self.max_attempts,
+            locked_by=self.locked_by,
+            locked_until=self.locked_until,
+            last_error=self.last_error,
+        )
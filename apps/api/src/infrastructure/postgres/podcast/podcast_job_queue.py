@@ -0,0 +1,135 @@
+from datetime import timedelta
+
+from sqlalchemy import func, update
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+from src.domain.podcast.entities.podcast_job import PodcastJob, PodcastJobStatus
+from src.domain.podcast.repositories.podcast_job_queue import PodcastJobQueue
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.infrastructure.postgres.podcast.podcast_job_dto import PodcastJobDTO
+
+ACTIVE_STATUSES = (PodcastJobStatus.QUEUED, PodcastJobStatus.RUNNING)
+
+
+class PodcastJobQueueImpl(PodcastJobQueue):
+    """Postgres-backed job queue using SELECT ... FOR UPDATE SKIP LOCKED
+
+    Lease times are computed with the database clock so API and worker hosts
+    do not need synchronized clocks.
+    """
+
+    def __init__(self, session: Session, max_attempts: int = 3) -> None:
+        self._session = session
+        self._max_attempts = max_attempts
+
+    async def enqueue(self, podcast_id: PodcastId) -> PodcastJob:
+        """Queue a generation job for the podcast (no-op if one is already queued or running)"""
+        try:
+            stmt = (
+                select(PodcastJobDTO)
+                .where((PodcastJobDTO.podcast_id == podcast_id.value) & (PodcastJobDTO.status.in_(ACTIVE_STATUSES)))
+                .with_for_update()
+            )
+            existing = self._session.execute(stmt).scalars().first()
+            if existing:
+                self._session.commit()
+                return existing.to_entity()
+
+            dto = PodcastJobDTO(podcast_id=podcast_id.value, status=PodcastJobStatus.QUEUED, attempts=0, max_attempts=self._max_attempts)
+            self._session.add(dto)
+            self._session.commit()
+            return dto.to_entity()
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    async def claim(self, worker_id: str, visibility_timeout_seconds: float) -> PodcastJob | None:
+        """Lock the oldest queued job for this worker until the visibility timeout expires"""
+        try:
+            stmt = (
+                select(PodcastJobDTO)
+                .where((PodcastJobDTO.status == PodcastJobStatus.QUEUED) & (PodcastJobDTO.available_at <= func.now()))
+                .order_by(PodcastJobDTO.available_at.asc())
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            dto = self._session.execute(stmt).scalar_one_or_none()
+            if dto is None:
+                self._session.commit()
+                return None
+
+            dto.status = PodcastJobStatus.RUNNING
+            dto.attempts += 1
+            dto.locked_by = worker_id
+            dto.locked_until = func.now() + timedelta(seconds=visibility_timeout_seconds)
+            self._session.commit()
+            self._session.refresh(dto)
+            return dto.to_entity()
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    async def extend_lease(self, job_id: str, worker_id: str, visibility_timeout_seconds: float) -> bool:
+        """Push back the visibility timeout of a running job; False if the worker lost the lock"""
+        try:
+            stmt = (
+                update(PodcastJobDTO)
+                .where((PodcastJobDTO.id == job_id) & (PodcastJobDTO.locked_by == worker_id) & (PodcastJobDTO.status == PodcastJobStatus.RUNNING))
+                .values(locked_until=func.now() + timedelta(seconds=visibility_timeout_seconds))
+                .returning(PodcastJobDTO.id)
+            )
+            extended = self._session.execute(stmt).first() is not None
+            self._session.commit()
+            return extended
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    async def complete(self, job_id: str) -> None:
+        """Mark a job as succeeded"""
+        self._finish(job_id, PodcastJobStatus.SUCCEEDED, None)
+
+    async def fail(self, job_id: str, error_message: str) -> None:
+        """Mark a job as failed"""
+        self._finish(job_id, PodcastJobStatus.FAILED, error_message)
+
+    async def has_active_job(self, podcast_id: PodcastId) -> bool:
+        """Whether the podcast has a queued or running job"""
+        stmt = select(PodcastJobDTO.id).where((PodcastJobDTO.podcast_id == podcast_id.value) & (PodcastJobDTO.status.in_(ACTIVE_STATUSES))).limit(1)
+        return self._session.execute(stmt).first() is not None
+
+    async def recover_abandoned(self) -> tuple[list[PodcastJob], list[PodcastJob]]:
+        """Release running jobs whose visibility timeout expired"""
+        try:
+            stmt = (
+                select(PodcastJobDTO)
+                .where((PodcastJobDTO.status == PodcastJobStatus.RUNNING) & (PodcastJobDTO.locked_until < func.now()))
+                .with_for_update(skip_locked=True)
+            )
+            requeued: list[PodcastJob] = []
+            exhausted: list[PodcastJob] = []
+            for dto in self._session.execute(stmt).scalars().all():
+                dto.locked_by = None
+                dto.locked_until = None
+                if dto.attempts < dto.max_attempts:
+                    dto.status = PodcastJobStatus.QUEUED
+                    requeued.append(dto.to_entity())
+                else:
+                    dto.status = PodcastJobStatus.FAILED
+                    dto.last_error = "Job abandoned too many times (worker crashed or timed out)"
+                    exhausted.append(dto.to_entity())
+            self._session.commit()
+            return requeued, exhausted
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    def _finish(self, job_id: str, status: PodcastJobStatus, error_message: str | None) -> None:
+        try:
+            stmt = update(PodcastJobDTO).where(PodcastJobDTO.id == job_id).values(status=status, locked_until=None, last_error=error_message)
+            self._session.execute(stmt)
+            self._session.commit()
+        except Exception as e:
+            self._session.rollback()
+            raise e
@@ -1,6 +1,8 @@
+import asyncio
+from contextlib import AbstractContextManager
 from datetime import UTC
 
-from sqlalchemy import update
+from sqlalchemy import Row, Select, case, func, update
 from sqlalchemy.future import select
 from sqlalchemy.orm import Session
 
@@ -9,9 +11,14 @@ from src.domain.chat.value_objects.user_id import UserId
 from src.domain.podcast.entities.podcast import Podcast
 from src.domain.podcast.exceptions.podcast_exceptions import PodcastNotFoundError
 from src.domain.podcast.repositories.podcast_repository import PodcastRepository
+from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.domain.podcast.value_objects.podcast_audio_segment import PodcastAudioSegment
 from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.domain.podcast.value_objects.podcast_progress import PodcastProgress
 from src.domain.podcast.value_objects.podcast_status import PodcastStatus
+from src.domain.podcast.value_objects.podcast_status_view import PodcastStatusView
 from src.infrastructure.postgres.podcast.podcast_dto import PodcastDTO
+from src.infrastructure.postgres.podcast.podcast_status_notifier import PODCAST_STATUS_CHANNEL, PodcastStatusNotifier
 
 
 class PodcastRepositoryImpl(PodcastRepository):
@@ -36,6 +43,67 @@ class PodcastRepositoryImpl(PodcastRepository):
         dto = result.scalar_one_or_none()
         return dto.to_entity() if dto else None
 
+    async def find_status_view(self, podcast_id: PodcastId) -> PodcastStatusView | None:
+        """Find the generation state of a podcast without loading its script"""
+        # Script statistics are computed in the database so the script JSON never leaves it.
+        # A podcast without a script stores JSON null (not SQL NULL), which the array functions reject
+        script = case((func.json_typeof(PodcastDTO.script) == "array", PodcastDTO.script))
+        turns = func.json_array_elements(script).table_valued("value").render_derived(name="turn")
+        script_character_count = select(func.coalesce(func.sum(func.length(turns.c.value.op("->>")("text"))), 0)).scalar_subquery()
+        stmt = select(
+            PodcastDTO.id,
+            PodcastDTO.book_id,
+            PodcastDTO.user_id,
+            PodcastDTO.title,
+            PodcastDTO.language,
+            PodcastDTO.status,
+            PodcastDTO.audio_url,
+            PodcastDTO.audio_segments,
+            PodcastDTO.error_message,
+            PodcastDTO.progress_stage,
+            PodcastDTO.progress_current,
+            PodcastDTO.progress_total,
+            PodcastDTO.created_at,
+            PodcastDTO.updated_at,
+            func.json_array_length(script).label("script_turn_count"),
+            script_character_count.label("script_character_count"),
+        ).where(PodcastDTO.id == podcast_id.value)
+        # Status streams call this for every change; the query runs off the event loop
+        row = await asyncio.to_thread(self._fetch_status_row, stmt)
+        if row is None:
+            return None
+
+        return PodcastStatusView(
+            id=PodcastId(row.id),
+            book_id=row.book_id,
+            user_id=row.user_id,
+            title=row.title,
+            language=PodcastLanguage(row.language),
+            status=PodcastStatus.from_string(str(row.status.value)),
+            audio_url=row.audio_url,
+            audio_segments=[PodcastAudioSegment.from_dict(segment) for segment in row.audio_segments or []],
+            error_message=row.error_message,
+            progress=PodcastDTO.progress_from_columns(row.progress_stage, row.progress_current, row.progress_total),
+            script_turn_count=row.script_turn_count,
+            script_character_count=row.script_character_count if row.script_turn_count is not None else None,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    def _fetch_status_row(self, stmt: Select) -> Row | None:
+        row = self._session.execute(stmt).one_or_none()
+        # End the read transaction so long-lived watchers do not keep it open between changes
+        self._session.commit()
+        return row
+
+    def watch_status_changes(self, podcast_id: PodcastId) -> AbstractContextManager[asyncio.Event]:
+        """Event set whenever the status view of a podcast changes, while the context is open"""
+        return PodcastStatusNotifier.get_shared().subscribe(podcast_id.value)
+
+    def _notify_status_change(self, podcast_id: str) -> None:
+        """Notify status watchers in every process once the current transaction commits"""
+        self._session.execute(select(func.pg_notify(PODCAST_STATUS_CHANNEL, podcast_id)))
+
     async def find_by_book_id(self, book_id: BookId) -> list[Podcast]:
         """Find all podcasts for a specific book"""
         stmt = select(PodcastDTO).where(PodcastDTO.book_id == book_id.value).order_by(PodcastDTO.created_at.desc())
@@ -59,6 +127,7 @@ class PodcastRepositoryImpl(PodcastRepository):
         dto = PodcastDTO.from_entity(podcast)
         try:
             self._session.merge(dto)
+            self._notify_status_change(dto.id)
             self._session.commit()
         except Exception as e:
             self._session.rollback()
@@ -88,12 +157,58 @@ class PodcastRepositoryImpl(PodcastRepository):
             stmt = stmt.values(audio_url=audio_url)
         if error_message is not None:
             stmt = stmt.values(error_message=error_message)
+        if not status.is_processing():
+            # Stage progress only describes a running generation
+            stmt = stmt.values(progress_stage=None, progress_current=None, progress_total=None)
 
         result = self._session.execute(stmt)
         if result.rowcount == 0:
             raise PodcastNotFoundError(str(podcast_id))
+        self._notify_status_change(podcast_id.value)
         self._session.commit()
 
+    async def update_progress(self, podcast_id: PodcastId, progress: PodcastProgress | None) -> None:
+        """Record the current generation stage of a podcast (None clears it)"""
+        from datetime import datetime
+
+        stmt = (
+            update(PodcastDTO)
+            .where(PodcastDTO.id == podcast_id.value)
+            .values(
+                progress_stage=progress.stage.value if progress else None,
+                progress_current=progress.current if progress else None,
+                progress_total=progress.total if progress else None,
+                updated_at=datetime.now(UTC),
+            )
+        )
+        try:
+            self._session.execute(stmt)
+            self._notify_status_change(podcast_id.value)
+            self._session.commit()
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
+    async def update_audio_segments(self, podcast_id: PodcastId, audio_segments: list[PodcastAudioSegment]) -> None:
+        """Replace the published audio segments of a podcast"""
+        from datetime import datetime
+
+        stmt = (
+            update(PodcastDTO)
+            .where(PodcastDTO.id == podcast_id.value)
+            .values(
+                audio_segments=[segment.to_dict() for segment in audio_segments],
+                updated_at=datetime.now(UTC),
+            )
+        )
+        try:
+            self._session.execute(stmt)
+            self._notify_status_change(podcast_id.value)
+            self._session.commit()
+        except Exception as e:
+            self._session.rollback()
+            raise e
+
     async def delete(self, podcast_id: PodcastId) -> None:
         """Delete a podcast by its ID"""
         stmt = select(PodcastDTO).where(PodcastDTO.id == podcast_id.value)
@@ -104,6 +219,7 @@ class PodcastRepositoryImpl(PodcastRepository):
 
         try:
             self._session.delete(dto)
+            self._notify_status_change(podcast_id.value)
             self._session.commit()
         except Exception as e:
             self._session.rollback()
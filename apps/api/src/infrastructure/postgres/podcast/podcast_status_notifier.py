@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import select
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from src.config.db import engine
+
+logger = logging.getLogger(__name__)
+
+# Channel the podcast repository notifies (payload: podcast ID) when a podcast's status view changes
+PODCAST_STATUS_CHANNEL = "podcast_status"
+RECONNECT_DELAY_SECONDS = 5.0
+SELECT_TIMEOUT_SECONDS = 1.0
+
+
+class PodcastStatusNotifier:
+    """Process-wide listener for podcast status changes
+
+    A single background thread LISTENs on one dedicated connection and wakes the
+    watchers of the notified podcast, so status streams no longer query the
+    database on a timer. Notifications arrive from every process writing podcasts,
+    including the generation worker.
+    """
+
+    _shared: "PodcastStatusNotifier | None" = None
+
+    @classmethod
+    def get_shared(cls) -> "PodcastStatusNotifier":
+        """Get the shared notifier, starting its listener on first use"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the listener thread"""
+        if cls._shared is not None:
+            cls._shared._stopped.set()
+            cls._shared = None
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._watchers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._listen_forever, name="podcast-status-notifier", daemon=True)
+        self._thread.start()
+
+    @contextmanager
+    def subscribe(self, podcast_id: str) -> Iterator[asyncio.Event]:
+        """Event set whenever the podcast is notified as changed, for the duration of the block
+
+        Must be entered on the event loop that waits for the event.
+        """
+        watcher = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._watchers.setdefault(podcast_id, set()).add(watcher)
+        try:
+            yield watcher[1]
+        finally:
+            with self._lock:
+                watchers = self._watchers.get(podcast_id)
+                if watchers is not None:
+                    watchers.discard(watcher)
+                    if not watchers:
+                        del self._watchers[podcast_id]
+
+    def _dispatch(self, podcast_id: str) -> None:
+        with self._lock:
+            watchers = list(self._watchers.get(podcast_id, ()))
+        for loop, event in watchers:
+            # RuntimeError: the watcher's loop has closed; it unsubscribes as it unwinds
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(event.set)
+
+    def _listen_forever(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.warning(f"Podcast status listener disconnected, reconnecting in {RECONNECT_DELAY_SECONDS}s: {str(e)}")
+                self._stopped.wait(RECONNECT_DELAY_SECONDS)
+
+    def _listen(self) -> None:
+        conn = psycopg2.connect(engine.url.set(drivername="postgresql").render_as_string(hide_password=False))
+        try:
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {PODCAST_STATUS_CHANNEL}")
+            # Changes made while disconnected were not notified
+            self._wake_all()
+            while not self._stopped.is_set():
+                if select.select([conn], [], [], SELECT_TIMEOUT_SECONDS) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    self._dispatch(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+
+    def _wake_all(self) -> None:
+        with self._lock:
+            podcast_ids = list(self._watchers)
+        for podcast_id in podcast_ids:
+            self._dispatch(podcast_id)
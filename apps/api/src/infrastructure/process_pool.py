@@ -0,0 +1,192 @@
+"""メモリ上限・タイムアウト付きのプロセスプール."""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, NoReturn
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPoolTaskError(Exception):
+    """プロセスプールでのタスク実行に失敗した場合の例外."""
+
+
+def _limit_memory(memory_limit_bytes: int) -> None:
+    """ワーカープロセスのアドレス空間に上限を設定する（LinuxはRLIMIT_RSSを強制しないためRLIMIT_ASを使う）."""
+    try:
+        import resource
+
+        _soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = memory_limit_bytes if hard == resource.RLIM_INFINITY else min(memory_limit_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"ワーカープロセスのメモリ上限を設定できませんでした: {str(e)}")
+
+
+class IsolatedProcessPool:
+    """重い処理をAPIプロセスから隔離して実行するプロセスプール.
+
+    - ワーカーごとにメモリ上限を設定し、超過したタスクはMemoryErrorで失敗させる（ワーカーはそのまま使い続ける）
+    - タイムアウトしたタスクはワーカーごと強制終了し、プールを作り直す
+    - プールの作り直しで巻き添えになった他のタスクは、新しいプールで再実行する
+    - ワーカーの異常終了でプールが壊れた場合、実行中だったタスクは単独のワーカーで1回だけ再実行し、原因のタスクだけを失敗させる
+    - 一定数のタスクを処理したワーカーは再起動してメモリの断片化を解消する
+    - max_pending_tasks を指定すると、実行中・待機中のタスク数がそれを超えないよう run の呼び出し側を待たせる
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        memory_limit_mb: int,
+        timeout_seconds: float,
+        max_tasks_per_child: int,
+        max_pending_tasks: int | None = None,
+    ) -> None:
+        """プロセスプールの初期化."""
+        self.name = name
+        self.max_workers = max_workers
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self.timeout_seconds = timeout_seconds
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_pending_tasks = max_pending_tasks
+        self._executor: ProcessPoolExecutor | None = None
+        # タイムアウトしたタスクのために強制終了したプール（同じプールで実行中だった他のタスクは巻き添え）
+        self._preempted: weakref.WeakSet[ProcessPoolExecutor] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._pending: asyncio.Semaphore | None = None
+
+    def _create_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            # max_tasks_per_child は fork 以外の開始方式が必要
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_memory,
+            initargs=(self.memory_limit_bytes,),
+            max_tasks_per_child=self.max_tasks_per_child,
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """プロセスプールを取得（未作成なら作成）."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor(self.max_workers)
+                logger.info(f"[{self.name}] プロセスプールを起動しました (workers={self.max_workers})")
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor, preempted: bool = False) -> None:
+        """プロセスプールのワーカーを強制終了し、次回のタスクで作り直す.
+
+        実行中・待機中だった他のタスクはBrokenProcessPoolで失敗し、_retry_on_broken_poolで再実行される.
+        """
+        with self._lock:
+            if preempted:
+                self._preempted.add(executor)
+            current = self._executor is executor
+            if current:
+                self._executor = None
+        # 停止済みのプールは _processes が None になる
+        for process in list((executor._processes or {}).values()):
+            process.kill()
+        # 待機中のタスクをキャンセルすると呼び出し側のキャンセルと区別できないため、BrokenProcessPoolで失敗させる
+        executor.shutdown(wait=False)
+        if current:
+            logger.warning(f"[{self.name}] プロセスプールを再作成します")
+
+    def _handle_timeout(self, executor: ProcessPoolExecutor, future: Future) -> NoReturn:
+        """タイムアウトしたタスクを止めて例外を送出する（ワーカーが処理中の場合のみプールを作り直す）."""
+        if not future.cancel():
+            # 処理中のタスクは、そのワーカーを終了させないと止められない
+            self._discard_executor(executor, preempted=True)
+        raise ProcessPoolTaskError(f"[{self.name}] タスクがタイムアウトしました ({self.timeout_seconds}秒)")
+
+    def _retry_on_broken_pool(self, executor: ProcessPoolExecutor, isolated: bool, error: BrokenProcessPool) -> bool:
+        """壊れたプールで失敗したタスクの再実行方法を返す（Trueなら単独のワーカー、再実行しない場合は例外を送出）."""
+        with self._lock:
+            preempted = executor in self._preempted
+        if preempted:
+            # 他のタスクのタイムアウトで強制終了されただけで、このタスクに原因はない
+            logger.info(f"[{self.name}] 他のタスクのタイムアウトで中断されたタスクを再実行します")
+            return isolated
+
+        self._discard_executor(executor)
+        if isolated:
+            # 単独のワーカーでも異常終了したため、このタスクが原因
+            raise ProcessPoolTaskError(f"[{self.name}] ワーカープロセスが異常終了しました: {str(error)}") from error
+        # どのタスクが原因か分からないため、他のタスクを巻き込まないよう単独のワーカーで再実行する
+        logger.warning(f"[{self.name}] ワーカープロセスが異常終了したため、タスクを単独のワーカーで再実行します")
+        return True
+
+    def _submit(self, func: Callable[..., Any], *args: Any, isolated: bool = False) -> tuple[ProcessPoolExecutor, Future]:  # noqa: ANN401
+        if isolated:
+            executor = self._create_executor(1)
+            return executor, executor.submit(func, *args)
+
+        executor = self._get_executor()
+        try:
+            return executor, executor.submit(func, *args)
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            executor = self._get_executor()
+            return executor, executor.submit(func, *args)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """タスクをワーカープロセスで実行し、結果を待つ."""
+        if self.max_pending_tasks is None:
+            return await self._run(func, *args)
+
+        if self._pending is None:
+            self._pending = asyncio.Semaphore(self.max_pending_tasks)
+        if self._pending.locked():
+            logger.info(f"[{self.name}] 待機中のタスクが上限 ({self.max_pending_tasks}) に達しているため空きを待ちます")
+        async with self._pending:
+            return await self._run(func, *args)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        isolated = False
+        while True:
+            attempt_isolated = isolated
+            executor, future = self._submit(func, *args, isolated=attempt_isolated)
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_seconds)
+            except TimeoutError:
+                self._handle_timeout(executor, future)
+            except MemoryError as e:
+                raise ProcessPoolTaskError(f"[{self.name}] タスクがメモリ上限を超えました") from e
+            except BrokenProcessPool as e:
+                isolated = self._retry_on_broken_pool(executor, attempt_isolated, e)
+            finally:
+                if attempt_isolated:
+                    executor.shutdown(wait=False)
+
+    def run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """同期コンテキストからタスクをワーカープロセスで実行し、結果を待つ."""
+        isolated = False
+        while True:
+            attempt_isolated = isolated
+            executor, future = self._submit(func, *args, isolated=attempt_isolated)
+            try:
+                return future.result(timeout=self.timeout_seconds)
+            except FutureTimeoutError:
+                self._handle_timeout(executor, future)
+            except MemoryError as e:
+                raise ProcessPoolTaskError(f"[{self.name}] タスクがメモリ上限を超えました") from e
+            except BrokenProcessPool as e:
+                isolated = self._retry_on_broken_pool(executor, attempt_isolated, e)
+            finally:
+                if attempt_isolated:
+                    executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """プロセスプールを停止する."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,213 @@
+"""優先度付きトークンバケット方式のレートリミッター."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+# 補充を待つ以外の理由（優先度の高い取得の待機）で待つ場合に状態を確認し直す間隔
+POLL_INTERVAL_SECONDS = 0.05
+
+
+class RequestPriority(IntEnum):
+    """レート制限の枠を取得する優先度（値が小さいほど優先）."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+# 呼び出し元から優先度を渡せない取得（ライブラリ内部の埋め込みなど）が使う優先度
+current_request_priority: ContextVar[RequestPriority] = ContextVar("current_request_priority", default=RequestPriority.BACKGROUND)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """ブロック内の取得の優先度を一時的に変更する."""
+    token = current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_request_priority.reset(token)
+
+
+class TokenBucket:
+    """一定速度で補充されるトークンバケット.
+
+    - 容量までのバーストを許可し、それを超える取得は補充を待つ
+    - 対話的な取得が待っている間、バックグラウンドの取得は枠を取らずに譲る
+    - 対話的な取得が直近にあった間は、容量の一部をバックグラウンドの取得に使わせない
+    - 同じ優先度の非同期の取得は到着順に処理され、大きな要求が小さな要求に追い越されることはない
+    - 同期の取得はスレッドから行え、非同期の取得の順番を待たない（イベントループを止めても詰まらない）
+    - イベントループのスレッドからの同期の取得は待たずに枠を前借りする（待つとループごと止まり、枠を使う側も返す側も進めなくなる）
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        interactive_reserve_ratio: float = 0.0,
+        interactive_window_seconds: float = 0.0,
+    ) -> None:
+        """トークンバケットの初期化."""
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity と refill_per_second は正の値である必要があります")
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.interactive_reserve = capacity * interactive_reserve_ratio
+        self.interactive_window_seconds = interactive_window_seconds
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._last_interactive_at = -float("inf")
+        self._waiting = dict.fromkeys(RequestPriority, 0)
+        self._condition = threading.Condition()
+        self._async_locks = {priority: asyncio.Lock() for priority in RequestPriority}
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    def _try_take(self, amount: float, priority: RequestPriority) -> float:
+        """枠を取得できれば0を、できなければ次に確認するまでの秒数を返す（ロック保持中に呼ぶ）."""
+        now = time.monotonic()
+        self._refill(now)
+        reserve = 0.0
+        reserved_until = now
+        if priority == RequestPriority.BACKGROUND:
+            if self._waiting[RequestPriority.INTERACTIVE]:
+                return POLL_INTERVAL_SECONDS
+            reserved_until = self._last_interactive_at + self.interactive_window_seconds
+            if now < reserved_until:
+                reserve = self.interactive_reserve
+
+        needed = min(amount + reserve, self.capacity)
+        if self._tokens >= needed:
+            self._tokens -= amount
+            return 0.0
+
+        wait = (needed - self._tokens) / self.refill_per_second
+        if reserve:
+            # 予約が切れれば早く取得できる
+            wait = min(wait, reserved_until - now)
+        return wait
+
+    def _enter(self, priority: RequestPriority) -> None:
+        with self._condition:
+            self._waiting[priority] += 1
+            if priority == RequestPriority.INTERACTIVE:
+                self._last_interactive_at = time.monotonic()
+
+    def _leave(self, priority: RequestPriority) -> None:
+        with self._condition:
+            self._waiting[priority] -= 1
+            self._condition.notify_all()
+
+    async def acquire(self, amount: float = 1.0, priority: RequestPriority = RequestPriority.BACKGROUND) -> None:
+        """トークンを取得する（不足していれば補充を待つ）."""
+        # 容量を超える要求は永遠に満たせないため、容量分で打ち切る
+        amount = min(amount, self.capacity)
+        self._enter(priority)
+        try:
+            async with self._async_locks[priority]:
+                while True:
+                    with self._condition:
+                        wait = self._try_take(amount, priority)
+                    if not wait:
+                        return
+                    await asyncio.sleep(wait)
+        finally:
+            self._leave(priority)
+
+    def acquire_blocking(self, amount: float = 1.0, priority: RequestPriority = RequestPriority.BACKGROUND) -> None:
+        """トークンを取得する（不足していれば呼び出し元のスレッドで補充を待つ）."""
+        amount = min(amount, self.capacity)
+        if _on_event_loop_thread():
+            # 前借りした分は残高がマイナスになり、後続の取得が補充を待つことで返済される
+            logger.debug("イベントループのスレッドから同期で取得されたため、待たずに枠を前借りします")
+            with self._condition:
+                self._refill(time.monotonic())
+                self._tokens -= amount
+            return
+        self._enter(priority)
+        try:
+            with self._condition:
+                while wait := self._try_take(amount, priority):
+                    self._condition.wait(wait)
+        finally:
+            self._leave(priority)
+
+    def refund(self, amount: float) -> None:
+        """使わなかったトークンを返却する."""
+        if amount <= 0:
+            return
+        with self._condition:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + amount)
+            self._condition.notify_all()
+
+
+def _on_event_loop_thread() -> bool:
+    """現在のスレッドでイベントループが動いているか."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class RateLimiter:
+    """1分あたりのリクエスト数（RPM）とトークン数（TPM）を同時に、優先度付きで制限するレートリミッター.
+
+    同じAPIの枠を使う呼び出しはすべて1つのインスタンスを共有し、チャットなどの対話的な
+    呼び出しを、取り込みやポッドキャスト生成などのバックグラウンドの呼び出しより優先する。
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int | None = None,
+        interactive_reserve_ratio: float = 0.0,
+        interactive_window_seconds: float = 0.0,
+    ) -> None:
+        """レートリミッターの初期化."""
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60, interactive_reserve_ratio, interactive_window_seconds)
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60, interactive_reserve_ratio, interactive_window_seconds)
+            if tokens_per_minute
+            else None
+        )
+
+    async def acquire(self, tokens: int = 0, priority: RequestPriority | None = None, requests: int = 1) -> None:
+        """リクエスト数と推定トークン数の枠を取得する（優先度の省略時は現在のコンテキストの優先度）."""
+        priority = current_request_priority.get() if priority is None else priority
+        started_at = time.monotonic()
+        await self._requests.acquire(requests, priority)
+        if self._tokens and tokens > 0:
+            await self._tokens.acquire(tokens, priority)
+        self._log_wait(started_at, priority)
+
+    def acquire_blocking(self, tokens: int = 0, priority: RequestPriority | None = None, requests: int = 1) -> None:
+        """リクエスト数と推定トークン数の枠を、呼び出し元のスレッドで待って取得する."""
+        priority = current_request_priority.get() if priority is None else priority
+        started_at = time.monotonic()
+        self._requests.acquire_blocking(requests, priority)
+        if self._tokens and tokens > 0:
+            self._tokens.acquire_blocking(tokens, priority)
+        self._log_wait(started_at, priority)
+
+    def refund(self, tokens: int) -> None:
+        """推定より少なかったトークン数を返却する."""
+        if self._tokens:
+            self._tokens.refund(tokens)
+
+    def _log_wait(self, started_at: float, priority: RequestPriority) -> None:
+        waited = time.monotonic() - started_at
+        if waited >= 1:
+            logger.info(f"レート制限のため {waited:.1f} 秒待機しました (priority={priority.name})")
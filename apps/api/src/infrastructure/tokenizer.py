@@ -0,0 +1,38 @@
+"""トークンカウントユーティリティ."""
+
+import logging
+
+import tiktoken
+from tiktoken.core import Encoding
+
+logger = logging.getLogger(__name__)
+
+# tiktokenエンコーダー（トークンカウント用）
+TIKTOKEN_ENCODING: Encoding | None = None
+try:
+    TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")  # GPT-4用のエンコーディング
+except Exception as e:
+    logger.warning(f"tiktokenの初期化に失敗しました: {str(e)}")
+
+# フォールバック時の平均的な文字/トークン比
+FALLBACK_CHARS_PER_TOKEN = 4
+
+
+def count_tokens(text: str) -> int:
+    """テキストのトークン数を数える."""
+    if TIKTOKEN_ENCODING:
+        return len(TIKTOKEN_ENCODING.encode(text, disallowed_special=()))
+    # フォールバック: 簡易的なトークン数推定
+    return len(text) // FALLBACK_CHARS_PER_TOKEN
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """トークン数制限に基づいてテキストを切り詰める（省略記号は付与しない）."""
+    if TIKTOKEN_ENCODING:
+        tokens = TIKTOKEN_ENCODING.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return TIKTOKEN_ENCODING.decode(tokens[:max_tokens])
+
+    # フォールバック: 大まかな文字数で切り詰め
+    return text[: max_tokens * FALLBACK_CHARS_PER_TOKEN]
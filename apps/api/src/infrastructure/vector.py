@@ -1,5 +1,6 @@
 from langchain_weaviate.vectorstores import WeaviateVectorStore
 
+from src.infrastructure.memory.book_content_store import BOOK_CONTENT_METADATA_KEYS
 from src.infrastructure.memory.memory_vector_store import MemoryVectorStore
 
 
@@ -15,6 +16,7 @@ def get_book_content_vector_store() -> WeaviateVectorStore:
             text_key="content",
             index_name=MemoryVectorStore.BOOK_CONTENT_COLLECTION_NAME,
             embedding=MemoryVectorStore.get_embedding_model(),
+            attributes=BOOK_CONTENT_METADATA_KEYS,
         )
     except Exception:
         raise
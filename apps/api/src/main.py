@@ -7,6 +7,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
 from src.config.db import get_db, init_db
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.external.audio import AudioProcessor
+from src.infrastructure.external.epub import EpubParser
+from src.infrastructure.postgres.podcast.podcast_status_notifier import PodcastStatusNotifier
 from src.presentation.api import setup_routes
 from src.presentation.api.error_messages.error_handlers import setup_exception_handlers
 
@@ -25,10 +29,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logging.error(f"Database initialization error: {e}")
 
+    # Build the shared LLM clients and open their connections before the first request
+    await ClientRegistry.warm_up(openai=True)
+
     yield
 
     # Shutdown
     logging.info("Closing database connection")
+    EpubParser.shutdown()
+    AudioProcessor.shutdown()
+    PodcastStatusNotifier.shutdown()
+    await ClientRegistry.close()
 
 
 app = FastAPI(title="BookWith API", description="Book related API service", lifespan=lifespan)
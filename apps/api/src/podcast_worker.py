@@ -0,0 +1,186 @@
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+
+from sqlalchemy.orm import Session
+
+from src.config.app_config import AppConfig
+from src.config.db import SessionLocal, init_db
+from src.domain.podcast.entities.podcast_job import PodcastJob
+from src.domain.podcast.value_objects.podcast_status import PodcastStatus
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.external.audio import AudioProcessor
+from src.infrastructure.external.epub import EpubParser
+from src.infrastructure.memory.memory_service import MemoryService
+from src.infrastructure.postgres.book.book_repository import BookRepositoryImpl
+from src.infrastructure.postgres.podcast import PodcastArtifactRepositoryImpl, PodcastJobQueueImpl, PodcastRepositoryImpl
+from src.usecase.podcast.generate_podcast_usecase import GeneratePodcastUseCase
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+class PodcastWorker:
+    """Claims podcast generation jobs from the queue and runs them with bounded concurrency
+
+    Run with ``python -m src.podcast_worker``. Any number of worker processes may
+    run side by side; jobs are claimed with ``SKIP LOCKED`` and held with a lease
+    that is extended while the job runs. Jobs whose lease expires (crashed or
+    killed worker) are put back in the queue until they run out of attempts.
+    """
+
+    def __init__(self, config: AppConfig) -> None:
+        self.concurrency = config.podcast_worker_concurrency
+        self.visibility_timeout_seconds = config.podcast_job_visibility_timeout_seconds
+        self.max_attempts = config.podcast_job_max_attempts
+        self.poll_interval_seconds = config.podcast_worker_poll_interval_seconds
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._stop_event = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; running jobs are allowed to finish"""
+        if not self._stop_event.is_set():
+            logger.info(f"Worker {self.worker_id} stopping after in-flight jobs finish")
+            self._stop_event.set()
+
+    async def run(self) -> None:
+        """Recover abandoned work, then process jobs until stopped"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, self.stop)
+
+        logger.info(f"Worker {self.worker_id} started (concurrency={self.concurrency}, visibility_timeout={self.visibility_timeout_seconds}s)")
+        await self._recover(requeue_orphans=True)
+        await ClientRegistry.warm_up(openai=True, gemini=True, tts=True)
+
+        try:
+            await asyncio.gather(self._recovery_loop(), *(self._claim_loop(slot) for slot in range(self.concurrency)))
+        finally:
+            EpubParser.shutdown()
+            AudioProcessor.shutdown()
+            await ClientRegistry.close()
+            logger.info(f"Worker {self.worker_id} stopped")
+
+    async def _recover(self, requeue_orphans: bool = False) -> None:
+        """Release expired leases and sync podcast statuses with the queue"""
+        session = SessionLocal()
+        try:
+            job_queue = self._job_queue(session)
+            podcast_repository = PodcastRepositoryImpl(session=session)
+
+            requeued, exhausted = await job_queue.recover_abandoned()
+            for job in requeued:
+                logger.warning(f"Requeued abandoned job {job.id} for podcast {job.podcast_id} (attempt {job.attempts}/{job.max_attempts})")
+                await podcast_repository.update_status(job.podcast_id, PodcastStatus.pending())
+            for job in exhausted:
+                logger.error(f"Giving up on job {job.id} for podcast {job.podcast_id} after {job.attempts} attempts")
+                await podcast_repository.update_status(job.podcast_id, PodcastStatus.failed(), error_message=job.last_error)
+
+            if not requeue_orphans:
+                return
+
+            # Podcasts left behind by API-process generation (or lost enqueues) have no job at all
+            for status in (PodcastStatus.pending(), PodcastStatus.processing()):
+                for podcast in await podcast_repository.find_by_status(status):
+                    if await job_queue.has_active_job(podcast.id):
+                        continue
+                    if podcast.status.is_processing():
+                        await podcast_repository.update_status(podcast.id, PodcastStatus.pending())
+                    await job_queue.enqueue(podcast.id)
+                    logger.warning(f"Enqueued orphaned podcast {podcast.id} (was {status})")
+        except Exception as e:
+            logger.error(f"Error recovering podcast jobs: {str(e)}")
+        finally:
+            session.close()
+
+    async def _recovery_loop(self) -> None:
+        """Periodically reclaim jobs abandoned by other workers"""
+        while not await self._wait_for_stop(self.visibility_timeout_seconds):
+            await self._recover()
+
+    async def _claim_loop(self, slot: int) -> None:
+        """Claim and run jobs one at a time until stopped"""
+        while not self._stop_event.is_set():
+            session = SessionLocal()
+            try:
+                job = await self._job_queue(session).claim(self.worker_id, self.visibility_timeout_seconds)
+                if job is not None:
+                    logger.info(f"[slot {slot}] Claimed job {job.id} for podcast {job.podcast_id} (attempt {job.attempts}/{job.max_attempts})")
+                    await self._process(job, session)
+            except Exception as e:
+                logger.error(f"[slot {slot}] Error processing podcast job: {str(e)}")
+                job = None
+            finally:
+                session.close()
+
+            if job is None:
+                await self._wait_for_stop(self.poll_interval_seconds)
+
+    async def _process(self, job: PodcastJob, session: Session) -> None:
+        """Run podcast generation for a claimed job while keeping its lease alive"""
+        job_queue = self._job_queue(session)
+        podcast_repository = PodcastRepositoryImpl(session=session)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            if job.attempts > 1:
+                # A previous attempt died mid-generation and left the podcast marked as processing
+                podcast = await podcast_repository.find_by_id(job.podcast_id)
+                if podcast and podcast.status.is_processing():
+                    await podcast_repository.update_status(job.podcast_id, PodcastStatus.pending())
+
+            usecase = GeneratePodcastUseCase(
+                podcast_repository=podcast_repository,
+                book_repository=BookRepositoryImpl(session=session, memory_service=MemoryService()),
+                artifact_repository=PodcastArtifactRepositoryImpl(session=session),
+            )
+            await usecase.execute(job.podcast_id)
+        except Exception as e:
+            logger.error(f"Job {job.id} for podcast {job.podcast_id} failed: {str(e)}")
+            await job_queue.fail(job.id, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+        await job_queue.complete(job.id)
+        logger.info(f"Job {job.id} for podcast {job.podcast_id} succeeded")
+
+    async def _heartbeat(self, job: PodcastJob) -> None:
+        """Extend the job lease at a third of the visibility timeout"""
+        interval = self.visibility_timeout_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            session = SessionLocal()
+            try:
+                if not await self._job_queue(session).extend_lease(job.id, self.worker_id, self.visibility_timeout_seconds):
+                    logger.warning(f"Lost lease on job {job.id}; another worker may pick it up")
+            except Exception as e:
+                logger.error(f"Error extending lease on job {job.id}: {str(e)}")
+            finally:
+                session.close()
+
+    async def _wait_for_stop(self, seconds: float) -> bool:
+        """Sleep up to the given seconds; True if the worker was asked to stop"""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        return self._stop_event.is_set()
+
+    def _job_queue(self, session: Session) -> PodcastJobQueueImpl:
+        return PodcastJobQueueImpl(session=session, max_attempts=self.max_attempts)
+
+
+def main() -> None:
+    init_db()
+    asyncio.run(PodcastWorker(AppConfig.get_config()).run())
+
+
+if __name__ == "__main__":
+    main()
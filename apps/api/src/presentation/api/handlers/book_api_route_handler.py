@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
 from src.config.app_config import TEST_USER_ID
@@ -10,13 +11,18 @@ from src.domain.book.exceptions.book_exceptions import (
     BookNotFoundException,
     BookPermissionDeniedException,
 )
+from src.domain.book.repositories.book_index_job_queue import BookIndexJobQueue
 from src.infrastructure.di.injection import (
+    get_book_index_job_queue,
     get_bulk_delete_books_usecase,
     get_create_book_usecase,
     get_delete_book_usecase,
+    get_finalize_book_upload_usecase,
     get_find_book_by_id_usecase,
     get_find_books_by_user_id_usecase,
+    get_reserve_book_upload_usecase,
     get_update_book_usecase,
+    get_upload_book_usecase,
 )
 from src.infrastructure.external.gcs import GCSClient
 from src.presentation.api.error_messages.book_error_message import (
@@ -39,6 +45,9 @@ from src.presentation.api.schemas.book_schema import (
     BookResponse,
     BooksResponse,
     BookUpdateRequest,
+    BookUploadFinalizeRequest,
+    BookUploadReservationRequest,
+    BookUploadReservationResponse,
     BulkDeleteRequestBody,
     BulkDeleteResponse,
     CoversResponse,
@@ -48,11 +57,14 @@ from src.usecase.book.delete_book_usecase import (
     BulkDeleteBooksUseCase,
     DeleteBookUseCase,
 )
+from src.usecase.book.finalize_book_upload_usecase import FinalizeBookUploadUseCase
 from src.usecase.book.find_book_by_id_usecase import FindBookByIdUseCase
 from src.usecase.book.find_books_usecase import (
     FindBooksByUserIdUseCase,
 )
+from src.usecase.book.reserve_book_upload_usecase import ReserveBookUploadUseCase
 from src.usecase.book.update_book_usecase import UpdateBookUseCase
+from src.usecase.book.upload_book_usecase import UploadBookUseCase
 
 router = APIRouter()
 
@@ -209,6 +221,99 @@ async def post_book(
         )
 
 
+@router.post("/upload", response_model=BookResponse)
+async def upload_book(
+    file: UploadFile = File(..., description="EPUB file"),
+    user_id: str = Form(..., description="User ID"),
+    book_name: str | None = Form(None, description="Book name (file name is used if not specified)"),
+    book_metadata: str | None = Form(None, description="Book metadata (JSON string)"),
+    cover_image: UploadFile | None = File(None, description="Cover image"),
+    create_vector_index: bool = Form(True, description="Index the stored EPUB for RAG in the background"),
+    upload_book_usecase: UploadBookUseCase = Depends(get_upload_book_usecase),
+    book_index_job_queue: BookIndexJobQueue = Depends(get_book_index_job_queue),
+):
+    """マルチパートで受け取ったEPUBをストレージへストリーミング保存し、インデックス作成をキューに入れる."""
+    try:
+        book = await run_in_threadpool(
+            upload_book_usecase.execute,
+            user_id=user_id,
+            file_name=file.filename or "book.epub",
+            file=file.file,
+            book_name=book_name,
+            cover_image=cover_image.file if cover_image else None,
+            book_metadata=book_metadata,
+        )
+
+        # インデックス作成はAPIのワーカーではなく、書籍インデックス作成ワーカーが保存済みオブジェクトから行う
+        if create_vector_index and book.file_path:
+            await book_index_job_queue.enqueue(book.id)
+
+        return BookResponse(book_detail=BookDetail(**book.model_dump(mode="json")))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=BOOK_CREATE_ERROR.format(error=str(e)),
+        )
+
+
+@router.post("/uploads", response_model=BookUploadReservationResponse)
+async def reserve_book_upload(
+    body: BookUploadReservationRequest,
+    reserve_book_upload_usecase: ReserveBookUploadUseCase = Depends(get_reserve_book_upload_usecase),
+) -> BookUploadReservationResponse:
+    """書籍IDを予約し、EPUBとカバー画像をストレージへ直接アップロードするためのURLを返す."""
+    try:
+        reservation = reserve_book_upload_usecase.execute(body.user_id)
+        return BookUploadReservationResponse(
+            book_id=reservation.book_id,
+            epub_upload_url=reservation.epub_upload_url,
+            cover_upload_url=reservation.cover_upload_url,
+            expires_in=reservation.expires_in,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=SIGNED_URL_GENERATION_ERROR.format(error=str(e)),
+        )
+
+
+@router.post("/{book_id}/finalize", response_model=BookResponse)
+async def finalize_book_upload(
+    book_id: str,
+    body: BookUploadFinalizeRequest,
+    finalize_book_upload_usecase: FinalizeBookUploadUseCase = Depends(get_finalize_book_upload_usecase),
+    book_index_job_queue: BookIndexJobQueue = Depends(get_book_index_job_queue),
+):
+    """直接アップロードされたEPUBを検証してBookを作成し、インデックス作成をキューに入れる."""
+    try:
+        book = await run_in_threadpool(
+            finalize_book_upload_usecase.execute,
+            user_id=body.user_id,
+            book_id=book_id,
+            file_name=body.file_name,
+            book_name=body.book_name,
+            book_metadata=body.book_metadata,
+        )
+
+        if body.create_vector_index and book.file_path:
+            await book_index_job_queue.enqueue(book.id)
+
+        return BookResponse(book_detail=BookDetail(**book.model_dump(mode="json")))
+    except BookFileNotFoundException:
+        raise HTTPException(status_code=404, detail=BOOK_FILE_NOT_FOUND)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except BookDomainException as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=BOOK_CREATE_ERROR.format(error=str(e)),
+        )
+
+
 ####################################################
 # Put
 ####################################################
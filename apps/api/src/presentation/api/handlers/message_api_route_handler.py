@@ -9,6 +9,7 @@ from src.infrastructure.di.injection import (
     get_delete_message_usecase,
     get_find_messages_usecase,
 )
+from src.infrastructure.rate_limiter import RequestPriority, current_request_priority
 from src.presentation.api.error_messages.message_error_message import MessageErrorMessage
 from src.presentation.api.schemas.message_schema import (
     MessageBulkDelete,
@@ -29,6 +30,8 @@ async def stream_create_message(
     create_message_usecase: CreateMessageUseCase = Depends(get_create_message_usecase),
 ) -> StreamingResponse:
     """新しいメッセージを作成し、AI の応答をストリーミングで返す."""
+    # このリクエストのタスク内のLLM呼び出し（ストリーミングの応答を含む）をバックグラウンドの処理より優先する
+    current_request_priority.set(RequestPriority.INTERACTIVE)
     try:
         response_stream = create_message_usecase.execute(
             content=message_create.content,
@@ -1,11 +1,17 @@
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
+from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from src.config.app_config import TEST_USER_ID
+from src.config.app_config import TEST_USER_ID, AppConfig
 from src.domain.book.value_objects.book_id import BookId
 from src.domain.chat.value_objects.user_id import UserId
 from src.domain.podcast.exceptions.podcast_exceptions import PodcastAlreadyExistsError, PodcastNotFoundError
+from src.domain.podcast.repositories.podcast_job_queue import PodcastJobQueue
 from src.domain.podcast.repositories.podcast_repository import PodcastRepository
 from src.domain.podcast.value_objects.podcast_id import PodcastId
 from src.domain.podcast.value_objects.podcast_status import PodcastStatus
@@ -13,9 +19,10 @@ from src.infrastructure.di.injection import (
     get_create_podcast_usecase,
     get_find_podcast_by_id_usecase,
     get_find_podcasts_by_book_id_usecase,
-    get_generate_podcast_usecase,
+    get_podcast_job_queue,
     get_podcast_repository,
     get_podcast_status_usecase,
+    get_watch_podcast_status_usecase,
 )
 from src.presentation.api.schemas.podcast_schema import (
     CreatePodcastRequest,
@@ -27,8 +34,8 @@ from src.presentation.api.schemas.podcast_schema import (
 from src.usecase.podcast.create_podcast_usecase import CreatePodcastUseCase
 from src.usecase.podcast.find_podcast_by_id_usecase import FindPodcastByIdUseCase
 from src.usecase.podcast.find_podcasts_by_book_id_usecase import FindPodcastsByBookIdUseCase
-from src.usecase.podcast.generate_podcast_usecase import GeneratePodcastUseCase
 from src.usecase.podcast.get_podcast_status_usecase import GetPodcastStatusUseCase
+from src.usecase.podcast.watch_podcast_status_usecase import WatchPodcastStatusUseCase
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -37,9 +44,8 @@ router = APIRouter()
 @router.post("", response_model=CreatePodcastResponse)
 async def create_podcast(
     request: CreatePodcastRequest,
-    background_tasks: BackgroundTasks,
     create_usecase: CreatePodcastUseCase = Depends(get_create_podcast_usecase),
-    generate_usecase: GeneratePodcastUseCase = Depends(get_generate_podcast_usecase),
+    job_queue: PodcastJobQueue = Depends(get_podcast_job_queue),
 ):
     """Create a new podcast for a book"""
     try:
@@ -50,12 +56,17 @@ async def create_podcast(
         title = request.title or f"Podcast for book {request.book_id}"
 
         # Create podcast
-        podcast_id = await create_usecase.execute(book_id, user_id, title, request.language)
+        podcast = await create_usecase.execute(book_id, user_id, title, request.language)
 
-        # Start background generation
-        background_tasks.add_task(generate_usecase.execute, podcast_id)
+        if podcast.is_completed():
+            return CreatePodcastResponse(
+                id=podcast.id.value, status=str(podcast.status), message="Podcast created from an existing generation of this book."
+            )
 
-        return CreatePodcastResponse(id=podcast_id.value, status="PENDING", message="Podcast creation started. Generation is in progress.")
+        # Queue generation for the podcast worker
+        await job_queue.enqueue(podcast.id)
+
+        return CreatePodcastResponse(id=podcast.id.value, status="PENDING", message="Podcast creation started. Generation is in progress.")
 
     except PodcastAlreadyExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Podcast already exists for this book") from e
@@ -122,19 +133,7 @@ async def get_podcast_status(
         podcast_domain_id = PodcastId(podcast_id)
         status_info = await status_usecase.execute(podcast_domain_id)
 
-        return PodcastStatusResponse(
-            id=status_info["id"],
-            status=status_info["status"],
-            title=status_info["title"],
-            language=status_info["language"],
-            audio_url=status_info.get("audio_url"),
-            error_message=status_info.get("error_message"),
-            has_script=status_info["has_script"],
-            script_turn_count=status_info.get("script_turn_count"),
-            script_character_count=status_info.get("script_character_count"),
-            created_at=status_info["created_at"],
-            updated_at=status_info["updated_at"],
-        )
+        return _to_status_response(status_info)
 
     except PodcastNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Podcast not found") from e
@@ -145,13 +144,68 @@ async def get_podcast_status(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get podcast status") from e
 
 
+@router.get("/{podcast_id}/events")
+async def stream_podcast_status(
+    podcast_id: str,
+    watch_usecase: WatchPodcastStatusUseCase = Depends(get_watch_podcast_status_usecase),
+) -> StreamingResponse:
+    """Stream podcast generation status as server-sent events
+
+    A ``status`` event carrying the PodcastStatusResponse is sent for the current
+    state and for every change, including stage progress; the stream closes once
+    generation has completed or failed.
+    """
+    try:
+        updates = watch_usecase.execute(PodcastId(podcast_id))
+        # Read the first state before responding so a missing podcast is still a 404
+        first = await anext(updates)
+    except PodcastNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Podcast not found") from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid podcast ID format") from e
+    except Exception as e:
+        logger.error(f"Error watching podcast status {podcast_id}: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get podcast status") from e
+
+    heartbeat_seconds = AppConfig.get_config().podcast_status_stream_heartbeat_seconds
+
+    async def events() -> AsyncIterator[str]:
+        yield _status_event(first)
+        next_update = asyncio.ensure_future(anext(updates))
+        try:
+            while True:
+                done, _ = await asyncio.wait({next_update}, timeout=heartbeat_seconds)
+                if not done:
+                    # Comment line: keeps proxies from closing an idle connection
+                    yield ": heartbeat\n\n"
+                    continue
+                try:
+                    status_info = next_update.result()
+                except StopAsyncIteration:
+                    return
+                except PodcastNotFoundError:
+                    yield 'event: error\ndata: {"detail": "Podcast not found"}\n\n'
+                    return
+                yield _status_event(status_info)
+                next_update = asyncio.ensure_future(anext(updates))
+        except Exception as e:
+            logger.error(f"Error streaming podcast status {podcast_id}: {str(e)}")
+            yield 'event: error\ndata: {"detail": "Failed to get podcast status"}\n\n'
+        finally:
+            # The watcher must be idle before it can be closed
+            next_update.cancel()
+            await asyncio.wait({next_update})
+            await updates.aclose()
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @router.post("/{podcast_id}/retry", response_model=CreatePodcastResponse)
 async def retry_podcast(
     podcast_id: str,
-    background_tasks: BackgroundTasks,
     find_usecase: FindPodcastByIdUseCase = Depends(get_find_podcast_by_id_usecase),
-    generate_usecase: GeneratePodcastUseCase = Depends(get_generate_podcast_usecase),
     podcast_repository: PodcastRepository = Depends(get_podcast_repository),
+    job_queue: PodcastJobQueue = Depends(get_podcast_job_queue),
 ):
     """Retry failed podcast generation"""
     try:
@@ -166,7 +220,7 @@ async def retry_podcast(
 
         podcast.update_status(PodcastStatus.pending(), error_message="")
         await podcast_repository.update(podcast)
-        background_tasks.add_task(generate_usecase.execute, podcast_domain_id)
+        await job_queue.enqueue(podcast_domain_id)
 
         return CreatePodcastResponse(id=podcast_domain_id.value, status="PENDING", message="Podcast retry started. Generation is in progress.")
 
@@ -177,3 +231,27 @@ async def retry_podcast(
     except Exception as e:
         logger.error(f"Error retrying podcast {podcast_id}: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retry podcast") from e
+
+
+def _to_status_response(status_info: dict[str, Any]) -> PodcastStatusResponse:
+    return PodcastStatusResponse(
+        id=status_info["id"],
+        status=status_info["status"],
+        title=status_info["title"],
+        language=status_info["language"],
+        audio_url=status_info.get("audio_url"),
+        audio_segments=status_info.get("audio_segments", []),
+        error_message=status_info.get("error_message"),
+        progress_stage=status_info.get("progress_stage"),
+        progress_current=status_info.get("progress_current"),
+        progress_total=status_info.get("progress_total"),
+        has_script=status_info["has_script"],
+        script_turn_count=status_info.get("script_turn_count"),
+        script_character_count=status_info.get("script_character_count"),
+        created_at=status_info["created_at"],
+        updated_at=status_info["updated_at"],
+    )
+
+
+def _status_event(status_info: dict[str, Any]) -> str:
+    return f"event: status\ndata: {json.dumps(_to_status_response(status_info).model_dump(mode='json'), ensure_ascii=False)}\n\n"
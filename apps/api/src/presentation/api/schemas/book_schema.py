@@ -18,6 +18,25 @@ class BookCreateRequest(BaseSchemaModel):
     book_metadata: str | None = Field(None, description="Book metadata (JSON string)")
 
 
+class BookUploadReservationRequest(BaseSchemaModel):
+    user_id: str = Field(..., description="User ID")
+
+
+class BookUploadReservationResponse(BaseSchemaModel):
+    book_id: str = Field(..., description="Reserved book ID")
+    epub_upload_url: str = Field(..., description="URL to PUT the EPUB file to (Content-Type: application/epub+zip)")
+    cover_upload_url: str = Field(..., description="URL to PUT the cover image to (Content-Type: image/jpeg)")
+    expires_in: int = Field(..., description="Seconds until the upload URLs expire")
+
+
+class BookUploadFinalizeRequest(BaseSchemaModel):
+    user_id: str = Field(..., description="User ID")
+    file_name: str = Field(..., description="File name")
+    book_name: str | None = Field(None, description="Book name (EPUB title or file name is used if not specified)")
+    book_metadata: str | None = Field(None, description="Book metadata (JSON string, overrides values read from the EPUB)")
+    create_vector_index: bool = Field(True, description="Index the stored EPUB for RAG in the background")
+
+
 class BookUpdateRequest(BaseSchemaModel):
     user_id: str = Field(TEST_USER_ID, description="User ID")
     name: str | None = Field(None, description="Book name")
@@ -20,6 +20,14 @@ class PodcastScriptTurn(BaseModel):
     text: str = Field(..., description="What the speaker says")
 
 
+class PodcastAudioSegmentSchema(BaseModel):
+    """Schema for a published audio segment"""
+
+    index: int = Field(..., description="Playback order of the segment")
+    url: str = Field(..., description="URL to the segment audio")
+    duration_seconds: float = Field(..., description="Segment duration in seconds")
+
+
 class PodcastResponse(BaseModel):
     """Response schema for podcast details"""
 
@@ -30,6 +38,7 @@ class PodcastResponse(BaseModel):
     status: str = Field(..., description="Generation status")
     language: PodcastLanguage = Field(..., description="Language code (BCP-47, e.g. en-US, ja-JP, cmn-CN)")
     audio_url: str | None = Field(None, description="URL to the generated audio")
+    audio_segments: list[PodcastAudioSegmentSchema] = Field(default_factory=list, description="Audio segments published so far, in playback order")
     error_message: str | None = Field(None, description="Error message if generation failed")
     script: list[PodcastScriptTurn] | None = Field(None, description="Podcast script")
     created_at: datetime = Field(..., description="Creation timestamp")
@@ -46,7 +55,11 @@ class PodcastStatusResponse(BaseModel):
     title: str = Field(..., description="Podcast title")
     language: PodcastLanguage = Field(..., description="Language code (BCP-47, e.g. en-US, ja-JP, cmn-CN)")
     audio_url: str | None = Field(None, description="URL to the generated audio if completed")
+    audio_segments: list[PodcastAudioSegmentSchema] = Field(default_factory=list, description="Audio segments published so far, in playback order")
     error_message: str | None = Field(None, description="Error message if failed")
+    progress_stage: str | None = Field(None, description="Current generation stage while processing")
+    progress_current: int | None = Field(None, description="Steps of the current stage done so far")
+    progress_total: int | None = Field(None, description="Steps of the current stage known so far")
     has_script: bool = Field(..., description="Whether script has been generated")
     script_turn_count: int | None = Field(None, description="Number of script turns")
     script_character_count: int | None = Field(None, description="Total character count in script")
@@ -12,6 +12,10 @@ from src.usecase.book.delete_book_usecase import (
     DeleteBookUseCase,
     DeleteBookUseCaseImpl,
 )
+from src.usecase.book.finalize_book_upload_usecase import (
+    FinalizeBookUploadUseCase,
+    FinalizeBookUploadUseCaseImpl,
+)
 from src.usecase.book.find_book_by_id_usecase import (
     FindBookByIdUseCase,
     FindBookByIdUseCaseImpl,
@@ -22,12 +26,22 @@ from src.usecase.book.find_books_usecase import (
     FindBooksUseCase,
     FindBooksUseCaseImpl,
 )
+from src.usecase.book.reserve_book_upload_usecase import (
+    BookUploadReservation,
+    ReserveBookUploadUseCase,
+    ReserveBookUploadUseCaseImpl,
+)
 from src.usecase.book.update_book_usecase import (
     UpdateBookUseCase,
     UpdateBookUseCaseImpl,
 )
+from src.usecase.book.upload_book_usecase import (
+    UploadBookUseCase,
+    UploadBookUseCaseImpl,
+)
 
 __all__ = [
+    "BookUploadReservation",
     "CreateBookUseCase",
     "CreateBookUseCaseImpl",
     "CreateBookVectorIndexUseCase",
@@ -36,12 +50,18 @@ __all__ = [
     "BulkDeleteBooksUseCaseImpl",
     "DeleteBookUseCase",
     "DeleteBookUseCaseImpl",
+    "FinalizeBookUploadUseCase",
+    "FinalizeBookUploadUseCaseImpl",
     "FindBookByIdUseCase",
     "FindBookByIdUseCaseImpl",
     "FindBooksByUserIdUseCase",
     "FindBooksByUserIdUseCaseImpl",
     "FindBooksUseCase",
     "FindBooksUseCaseImpl",
+    "ReserveBookUploadUseCase",
+    "ReserveBookUploadUseCaseImpl",
     "UpdateBookUseCase",
     "UpdateBookUseCaseImpl",
+    "UploadBookUseCase",
+    "UploadBookUseCaseImpl",
 ]
@@ -12,6 +12,52 @@ from src.domain.book.value_objects.book_title import BookTitle
 from src.infrastructure.external.gcs import GCSClient
 
 
+def parse_book_metadata(book_metadata: str | None) -> dict[str, Any]:
+    """JSON文字列の書籍メタデータを辞書に変換する（不正な場合は空）."""
+    if not book_metadata:
+        return {}
+    with contextlib.suppress(json.JSONDecodeError):
+        metadata = json.loads(book_metadata)
+        if isinstance(metadata, dict):
+            return metadata
+    return {}
+
+
+def build_book(
+    book_id: BookId,
+    user_id: str,
+    book_name: str,
+    file_path: str,
+    size: int,
+    cover_path: str | None,
+    metadata: dict[str, Any],
+) -> Book:
+    """アップロード済みファイルの情報とEPUBメタデータからBookエンティティを組み立てる."""
+    return Book.create(
+        id=book_id,
+        name=BookTitle(book_name),
+        user_id=user_id,
+        file_path=file_path,
+        author=metadata.get("creator") or None,
+        size=size,
+        cover_path=cover_path,
+        metadata_title=metadata.get("title"),
+        metadata_creator=metadata.get("creator"),
+        metadata_description=metadata.get("description"),
+        metadata_pubdate=metadata.get("pubdate"),
+        metadata_publisher=metadata.get("publisher"),
+        metadata_identifier=metadata.get("identifier"),
+        metadata_language=metadata.get("language"),
+        metadata_rights=metadata.get("rights"),
+        metadata_modified_date=metadata.get("modified_date"),
+        metadata_layout=metadata.get("layout"),
+        metadata_orientation=metadata.get("orientation"),
+        metadata_flow=metadata.get("flow"),
+        metadata_viewport=metadata.get("viewport"),
+        metadata_spread=metadata.get("spread"),
+    )
+
+
 class CreateBookUseCase(ABC):
     @abstractmethod
     def execute(
@@ -44,10 +90,7 @@ class CreateBookUseCaseImpl(CreateBookUseCase):
         """新しいBookを作成して保存し、作成したBookエンティティを返す."""
         decoded_file_data = base64.b64decode(file_data)
 
-        metadata_dict: dict[str, Any] = {}
-        if book_metadata:
-            with contextlib.suppress(json.JSONDecodeError):
-                metadata_dict = json.loads(book_metadata)
+        metadata_dict = parse_book_metadata(book_metadata)
 
         book_id = BookId.generate()
         book_id_value = book_id.value
@@ -72,28 +115,14 @@ class CreateBookUseCaseImpl(CreateBookUseCase):
                 except Exception as e:
                     self._logger.error(f"カバー画像の保存中にエラーが発生しました: {str(e)}")
 
-            book = Book.create(
-                id=book_id,
-                name=BookTitle(book_name if book_name else file_name),
+            book = build_book(
+                book_id=book_id,
                 user_id=user_id,
+                book_name=book_name or file_name,
                 file_path=file_path,
-                author=metadata_dict.get("creator") or None,
                 size=len(decoded_file_data),
                 cover_path=cover_path,
-                metadata_title=metadata_dict.get("title"),
-                metadata_creator=metadata_dict.get("creator"),
-                metadata_description=metadata_dict.get("description"),
-                metadata_pubdate=metadata_dict.get("pubdate"),
-                metadata_publisher=metadata_dict.get("publisher"),
-                metadata_identifier=metadata_dict.get("identifier"),
-                metadata_language=metadata_dict.get("language"),
-                metadata_rights=metadata_dict.get("rights"),
-                metadata_modified_date=metadata_dict.get("modified_date"),
-                metadata_layout=metadata_dict.get("layout"),
-                metadata_orientation=metadata_dict.get("orientation"),
-                metadata_flow=metadata_dict.get("flow"),
-                metadata_viewport=metadata_dict.get("viewport"),
-                metadata_spread=metadata_dict.get("spread"),
+                metadata=metadata_dict,
             )
 
             self.book_repository.save(book)
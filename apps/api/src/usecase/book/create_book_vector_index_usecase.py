@@ -1,19 +1,46 @@
+import asyncio
+import logging
+import tempfile
 from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
 
 from fastapi import UploadFile
 
+from src.infrastructure.book_file_cache import BookFileCache
+from src.infrastructure.external.gcs import GCSClient
 from src.infrastructure.memory.memory_vector_store import MemoryVectorStore
 
+logger = logging.getLogger(__name__)
+
 
 class CreateBookVectorIndexUseCase(ABC):
     @abstractmethod
     async def execute(self, file: UploadFile, user_id: str, book_id: str) -> dict:
         """EPUBファイルを処理してベクトルストアにインデックス化する."""
 
+    @abstractmethod
+    async def execute_from_storage(self, object_name: str, user_id: str, book_id: str) -> dict:
+        """ストレージに保存済みのEPUBファイルをベクトルストアにインデックス化する."""
+
 
 class CreateBookVectorIndexUseCaseImpl(CreateBookVectorIndexUseCase):
     def __init__(self) -> None:
         self.memory_vector_store = MemoryVectorStore()
+        self.gcs_client = GCSClient()
+        self.book_file_cache = BookFileCache.get_shared()
 
     async def execute(self, file: UploadFile, user_id: str, book_id: str) -> dict:
         return await self.memory_vector_store.create_book_vector_index(file, user_id, book_id)
+
+    async def execute_from_storage(self, object_name: str, user_id: str, book_id: str) -> dict:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = str(Path(temp_dir) / "book.epub")
+            # 同じ内容の書籍はローカルのキャッシュから取り出し、解析結果も再利用する
+            content_hash = await asyncio.to_thread(self.book_file_cache.download_to_file, self.gcs_client, object_name, temp_path)
+
+            result = await self.memory_vector_store.create_book_vector_index_from_path(
+                temp_path, PurePosixPath(object_name).name, user_id, book_id, content_hash
+            )
+
+        logger.info(f"Indexed stored book {object_name}: {result['chunk_count']} chunks")
+        return result
@@ -0,0 +1,81 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+from src.domain.book.entities.book import Book
+from src.domain.book.exceptions.book_exceptions import BookDomainException, BookFileNotFoundException
+from src.domain.book.repositories.book_repository import BookRepository
+from src.domain.book.value_objects.book_id import BookId
+from src.infrastructure.external.epub import extract_epub_metadata
+from src.infrastructure.external.gcs import GCSClient
+from src.usecase.book.create_book_usecase import build_book, parse_book_metadata
+from src.usecase.book.reserve_book_upload_usecase import get_book_object_names
+
+
+class FinalizeBookUploadUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        user_id: str,
+        book_id: str,
+        file_name: str,
+        book_name: str | None = None,
+        book_metadata: str | None = None,
+    ) -> Book:
+        """直接アップロードされたEPUBを検証し、Bookを作成して返す"""
+
+
+class FinalizeBookUploadUseCaseImpl(FinalizeBookUploadUseCase):
+    def __init__(self, book_repository: BookRepository) -> None:
+        self.book_repository = book_repository
+        self.gcs_client = GCSClient()
+        self._logger = logging.getLogger(__name__)
+
+    def execute(
+        self,
+        user_id: str,
+        book_id: str,
+        file_name: str,
+        book_name: str | None = None,
+        book_metadata: str | None = None,
+    ) -> Book:
+        """アップロード済みオブジェクトを検証してメタデータを抽出し、Bookエンティティを保存して返す."""
+        book_id_vo = BookId(book_id)
+        if self.book_repository.find_by_id(book_id_vo) is not None:
+            raise BookDomainException(f"ID {book_id} の書籍は既に登録されています")
+
+        epub_blob_name, cover_blob_name = get_book_object_names(user_id, book_id)
+
+        size = self.gcs_client.get_object_size(epub_blob_name)
+        if not size:
+            raise BookFileNotFoundException
+
+        # EPUBのOPFから抽出したメタデータを基本とし、クライアントが送った値で上書きする
+        metadata = self._extract_metadata(epub_blob_name, size)
+        metadata.update({key: value for key, value in parse_book_metadata(book_metadata).items() if value})
+
+        cover_path = self.gcs_client.get_object_url(cover_blob_name) if self.gcs_client.get_object_size(cover_blob_name) else None
+
+        book = build_book(
+            book_id=book_id_vo,
+            user_id=user_id,
+            book_name=book_name or metadata.get("title") or file_name,
+            file_path=self.gcs_client.get_object_url(epub_blob_name),
+            size=size,
+            cover_path=cover_path,
+            metadata=metadata,
+        )
+
+        self.book_repository.save(book)
+
+        return book
+
+    def _extract_metadata(self, epub_blob_name: str, size: int) -> dict[str, Any]:
+        # ファイル全体はダウンロードせず、zipの中央ディレクトリとcontainer.xml・OPFのエントリだけを範囲読み出しする
+        # ストレージの読み出しエラー（GCSBucketError）は不正なファイルとして扱わずそのまま送出する
+        try:
+            with self.gcs_client.open_range_reader(epub_blob_name, size) as epub_file:
+                return dict(extract_epub_metadata(epub_file))
+        except ValueError as e:
+            self._logger.error(f"EPUBメタデータの抽出中にエラーが発生しました: {str(e)}")
+            raise ValueError(f"Invalid EPUB file: {str(e)}") from e
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.domain.book.value_objects.book_id import BookId
+from src.infrastructure.external.gcs import GCSClient
+
+# アップロード用URLの有効期限（秒）
+UPLOAD_URL_EXPIRATION_SECONDS = 3600
+
+EPUB_CONTENT_TYPE = "application/epub+zip"
+COVER_CONTENT_TYPE = "image/jpeg"
+
+
+def get_book_object_names(user_id: str, book_id: str) -> tuple[str, str]:
+    """書籍ファイルとカバー画像のオブジェクト名を返す."""
+    book_base_path = f"books/{user_id}/{book_id}"
+    return f"{book_base_path}/book.epub", f"{book_base_path}/cover.jpg"
+
+
+@dataclass(frozen=True)
+class BookUploadReservation:
+    book_id: str
+    epub_upload_url: str
+    cover_upload_url: str
+    expires_in: int
+
+
+class ReserveBookUploadUseCase(ABC):
+    @abstractmethod
+    def execute(self, user_id: str) -> BookUploadReservation:
+        """書籍IDを払い出し、ストレージへ直接アップロードするためのURLを返す"""
+
+
+class ReserveBookUploadUseCaseImpl(ReserveBookUploadUseCase):
+    def __init__(self) -> None:
+        self.gcs_client = GCSClient()
+
+    def execute(self, user_id: str) -> BookUploadReservation:
+        """書籍IDを払い出し、EPUBとカバー画像の署名付きアップロードURLを返す."""
+        book_id = BookId.generate().value
+        epub_blob_name, cover_blob_name = get_book_object_names(user_id, book_id)
+
+        return BookUploadReservation(
+            book_id=book_id,
+            epub_upload_url=self.gcs_client.generate_upload_url(epub_blob_name, EPUB_CONTENT_TYPE, UPLOAD_URL_EXPIRATION_SECONDS),
+            cover_upload_url=self.gcs_client.generate_upload_url(cover_blob_name, COVER_CONTENT_TYPE, UPLOAD_URL_EXPIRATION_SECONDS),
+            expires_in=UPLOAD_URL_EXPIRATION_SECONDS,
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.domain.annotation.entities.annotation import Annotation
 from src.domain.book.entities.book import Book
@@ -7,7 +7,10 @@ from src.domain.book.exceptions.book_exceptions import BookNotFoundException
 from src.domain.book.repositories.book_repository import BookRepository
 from src.domain.book.value_objects.book_id import BookId
 from src.domain.book.value_objects.book_title import BookTitle
-from src.presentation.api.schemas.annotation_schema import AnnotationSchema
+
+if TYPE_CHECKING:
+    # 実行時に読み込むとプレゼンテーション層との循環importになる（ワーカーから書籍のユースケースを読み込む場合など）
+    from src.presentation.api.schemas.annotation_schema import AnnotationSchema
 
 
 class UpdateBookUseCase(ABC):
@@ -19,7 +22,7 @@ class UpdateBookUseCase(ABC):
         author: str | None = None,
         cfi: str | None = None,
         percentage: float | None = None,
-        annotations: list[AnnotationSchema] | None = None,
+        annotations: "list[AnnotationSchema] | None" = None,
         book_metadata: dict[str, Any] | None = None,
         definitions: list[str] | None = None,
         configuration: dict[str, Any] | None = None,
@@ -38,7 +41,7 @@ class UpdateBookUseCaseImpl(UpdateBookUseCase):
         author: str | None = None,
         cfi: str | None = None,
         percentage: float | None = None,
-        annotations: list[AnnotationSchema] | None = None,
+        annotations: "list[AnnotationSchema] | None" = None,
         book_metadata: dict[str, Any] | None = None,
         definitions: list[str] | None = None,
         configuration: dict[str, Any] | None = None,
@@ -0,0 +1,88 @@
+import contextlib
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+from src.domain.book.entities.book import Book
+from src.domain.book.repositories.book_repository import BookRepository
+from src.domain.book.value_objects.book_id import BookId
+from src.infrastructure.external.gcs import GCSClient
+from src.usecase.book.create_book_usecase import build_book, parse_book_metadata
+
+
+class UploadBookUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        user_id: str,
+        file_name: str,
+        file: BinaryIO,
+        book_name: str | None = None,
+        cover_image: BinaryIO | None = None,
+        book_metadata: str | None = None,
+    ) -> Book:
+        """EPUBファイルをストリーミングで保存し、新しいBookを作成して返す"""
+
+
+class UploadBookUseCaseImpl(UploadBookUseCase):
+    def __init__(self, book_repository: BookRepository) -> None:
+        self.book_repository = book_repository
+        self.gcs_client = GCSClient()
+        self._logger = logging.getLogger(__name__)
+
+    def execute(
+        self,
+        user_id: str,
+        file_name: str,
+        file: BinaryIO,
+        book_name: str | None = None,
+        cover_image: BinaryIO | None = None,
+        book_metadata: str | None = None,
+    ) -> Book:
+        """ファイルオブジェクトをチャンク単位でストレージに書き込み、Bookエンティティを保存して返す."""
+        metadata_dict = parse_book_metadata(book_metadata)
+
+        book_id = BookId.generate()
+        book_base_path = f"books/{user_id}/{book_id.value}"
+
+        uploaded_files: list[str] = []
+
+        try:
+            epub_blob_name = f"{book_base_path}/book.epub"
+            size = file.seek(0, os.SEEK_END)
+            file_path = self.gcs_client.upload_stream(epub_blob_name, file, "application/epub+zip")
+            uploaded_files.append(epub_blob_name)
+
+            cover_path = None
+            if cover_image is not None:
+                try:
+                    cover_blob_name = f"{book_base_path}/cover.jpg"
+                    cover_path = self.gcs_client.upload_stream(cover_blob_name, cover_image, "image/jpeg")
+                    uploaded_files.append(cover_blob_name)
+                except Exception as e:
+                    self._logger.error(f"カバー画像の保存中にエラーが発生しました: {str(e)}")
+
+            book = build_book(
+                book_id=book_id,
+                user_id=user_id,
+                book_name=book_name or file_name,
+                file_path=file_path,
+                size=size,
+                cover_path=cover_path,
+                metadata=metadata_dict,
+            )
+
+            self.book_repository.save(book)
+
+            return book
+
+        except Exception as e:
+            self._logger.error(f"Book作成中にエラーが発生しました: {str(e)}")
+            self._rollback_storage(uploaded_files)
+            raise
+
+    def _rollback_storage(self, file_names: list[str]) -> None:
+        for file_name in file_names:
+            with contextlib.suppress(Exception):
+                self.gcs_client.delete_object(file_name)
@@ -1,5 +1,6 @@
 """AIレスポンス生成サービス."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Any
 
@@ -10,6 +11,7 @@ from langchain_core.runnables import RunnablePassthrough
 from langchain_openai import ChatOpenAI
 from weaviate.classes.query import Filter
 
+from src.infrastructure.client_registry import ClientRegistry
 from src.infrastructure.vector import get_book_content_vector_store
 from src.usecase.message.highlight_searcher import HighlightSearcher
 
@@ -29,9 +31,13 @@ class AIResponseGenerator:
         question: str,
         user_id: str,
         book_id: str | None = None,
+        citation_sources: dict[str, dict[str, Any]] | None = None,
     ) -> AsyncGenerator[str]:
-        """LLMの応答をストリーミングで返す."""
-        model = ChatOpenAI(model_name="gpt-4o", streaming=True)
+        """LLMの応答をストリーミングで返す.
+
+        citation_sourcesを渡すと、プロンプトに含めたチャンクIDとその位置メタデータの対応が書き込まれる。
+        """
+        model = ClientRegistry.get_chat_model(streaming=True)
 
         # book_idがない場合は記憶ベースの応答のみを返す
         if book_id is None:
@@ -40,7 +46,8 @@ class AIResponseGenerator:
             return
 
         # book_idがある場合は記憶ベースとRAGベースを組み合わせる
-        async for chunk in self._stream_hybrid_response(question, user_id, book_id, model):
+        sources = citation_sources if citation_sources is not None else {}
+        async for chunk in self._stream_hybrid_response(question, user_id, book_id, model, sources):
             yield chunk
 
     async def _stream_memory_based_response(self, question: str, model: ChatOpenAI) -> AsyncGenerator[str]:
@@ -50,7 +57,14 @@ class AIResponseGenerator:
         async for chunk in basic_chain.astream(question):
             yield chunk
 
-    async def _stream_hybrid_response(self, question: str, user_id: str, book_id: str, model: ChatOpenAI) -> AsyncGenerator[str]:
+    async def _stream_hybrid_response(
+        self,
+        question: str,
+        user_id: str,
+        book_id: str,
+        model: ChatOpenAI,
+        citation_sources: dict[str, dict[str, Any]],
+    ) -> AsyncGenerator[str]:
         """記憶ベースとRAGベースを組み合わせたレスポンスをストリーミングで返す."""
         # 書籍コンテンツのベクトルストアを取得
         vector_store = get_book_content_vector_store()
@@ -59,12 +73,13 @@ class AIResponseGenerator:
         )
 
         # 関連するハイライトを検索
-        highlight_texts = self.highlight_searcher.search_relevant_highlights(question, user_id, book_id)
+        # 埋め込みを同期で呼ぶため、イベントループを止めないようスレッドで実行する
+        highlight_texts = await asyncio.to_thread(self.highlight_searcher.search_relevant_highlights, question, user_id, book_id)
 
         # ハイブリッドチェーンを構築
         hybrid_chain: RunnableSerializable[Any, str] = (
             {
-                "book_content": vector_store_retriever | self._format_documents_as_string,
+                "book_content": vector_store_retriever | (lambda documents: self._format_documents_with_ids(documents, citation_sources)),
                 "highlight_texts": lambda _: highlight_texts,
                 "question": lambda _: question,
             }
@@ -81,6 +96,7 @@ class AIResponseGenerator:
 会話の文脈と書籍の情報、ハイライトの両方を考慮して、一貫性のある適切な回答を提供してください。
 書籍の情報やハイライトが関連している場合は、それを優先して使用してください。
 質問に関連する情報がコンテキストに含まれていない場合は、会話の文脈のみに基づいて回答してください。
+書籍の情報を根拠にした文の末尾には、その情報源のID（例: [c1]）を付けてください。位置の説明は不要です。
 \n\n書籍からの関連情報:\n {book_content}\n\nハイライトした箇所:\n {highlight_texts}\n\n
                     """,
                     ),
@@ -94,6 +110,11 @@ class AIResponseGenerator:
         async for chunk in hybrid_chain.astream(question):
             yield chunk
 
-    def _format_documents_as_string(self, documents: list[Document]) -> str:
-        """ドキュメントのリストを文字列としてフォーマットする."""
-        return "\n\n".join(doc.page_content for doc in documents)
+    def _format_documents_with_ids(self, documents: list[Document], citation_sources: dict[str, dict[str, Any]]) -> str:
+        """ドキュメントに短いチャンクIDを付けてフォーマットし、IDと位置メタデータの対応を記録する."""
+        formatted = []
+        for index, doc in enumerate(documents, start=1):
+            source_id = f"c{index}"
+            citation_sources[source_id] = doc.metadata
+            formatted.append(f"[{source_id}] {doc.page_content}")
+        return "\n\n".join(formatted)
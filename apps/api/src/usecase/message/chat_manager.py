@@ -4,7 +4,6 @@ from textwrap import dedent
 
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 
 from src.domain.chat.entities.chat import Chat
 from src.domain.chat.repositories.chat_repository import ChatRepository
@@ -12,6 +11,7 @@ from src.domain.chat.value_objects.book_id import BookId
 from src.domain.chat.value_objects.chat_id import ChatId
 from src.domain.chat.value_objects.chat_title import ChatTitle
 from src.domain.chat.value_objects.user_id import UserId
+from src.infrastructure.client_registry import ClientRegistry
 
 
 class ChatManager:
@@ -54,4 +54,4 @@ class ChatManager:
             ]
         )
 
-        return (prompt | ChatOpenAI(name="gpt-4o") | StrOutputParser()).invoke({"question": question})
+        return (prompt | ClientRegistry.get_chat_model() | StrOutputParser()).invoke({"question": question})
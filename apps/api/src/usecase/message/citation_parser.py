@@ -2,7 +2,7 @@
 
 import logging
 import re
-from typing import TypedDict
+from typing import Any, TypedDict
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +46,54 @@ class CitationParser:
     # 逆マッピング（数字から上付き文字へ）
     REVERSE_SUPERSCRIPT_MAP = {v: k for k, v in SUPERSCRIPT_MAP.items()}
 
+    # チャンクID形式の引用マーカー（例: [c1]）
+    CHUNK_ID_PATTERN = r"\[(c(\d+))\]"
+
+    @classmethod
+    def resolve_chunk_citations(cls, text: str, sources: dict[str, dict[str, Any]]) -> CitationResult:
+        """チャンクID形式の引用マーカーを、保存済みの位置メタデータから解決する.
+
+        Args:
+            text: AIレスポンステキスト
+            sources: プロンプトに含めたチャンクIDとチャンクのメタデータの対応
+
+        Returns:
+            引用情報を含む辞書
+
+        """
+        citations = []
+        markers_found = []
+
+        for match in re.finditer(cls.CHUNK_ID_PATTERN, text):
+            marker = match.group(0)
+            if marker in markers_found:
+                continue
+            markers_found.append(marker)
+
+            source = sources.get(match.group(1))
+            if source is None:
+                logger.warning(f"Unknown citation marker: {marker}")
+                continue
+
+            position_percent = source.get("book_percentage")
+            citations.append(
+                CitationData(
+                    marker=marker,
+                    number=match.group(2),
+                    chapter=source.get("chapter_title") or "",
+                    position_percent=float(position_percent) if position_percent is not None else None,
+                    cfi=source.get("cfi_range") or None,
+                    location_info=source.get("chunk_id"),
+                    is_highlight=False,
+                )
+            )
+
+        return CitationResult(
+            citations=citations,
+            has_citations=len(citations) > 0,
+            markers_found=markers_found,
+        )
+
     @classmethod
     def extract_citations(cls, text: str) -> CitationResult:
         """テキストから引用情報を抽出する.
@@ -1,5 +1,6 @@
 """メッセージ作成ユースケース."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 from typing import Any
@@ -9,6 +10,7 @@ from src.domain.message.repositories.message_repository import MessageRepository
 from src.infrastructure.memory.memory_service import MemoryService
 from src.usecase.message.ai_response_generator import AIResponseGenerator
 from src.usecase.message.chat_manager import ChatManager
+from src.usecase.message.citation_parser import CitationParser
 from src.usecase.message.message_processor import MessageProcessor
 
 
@@ -57,19 +59,32 @@ class CreateMessageUseCaseImpl(CreateMessageUseCase):
         metadata: dict[str, Any] | None = None,
     ) -> AsyncGenerator[str]:
         """ユーザーメッセージを保存し、AIの応答をストリーミングで返す."""
-        self.chat_manager.ensure_chat_exists(chat_id, sender_id, book_id, content)
+        # LLMや埋め込みを同期で呼ぶ処理は、イベントループを止めないよう1つずつスレッドで実行する
+        await asyncio.to_thread(self.chat_manager.ensure_chat_exists, chat_id, sender_id, book_id, content)
 
-        self.message_processor.save_user_message(content, sender_id, chat_id, metadata)
+        await asyncio.to_thread(self.message_processor.save_user_message, content, sender_id, chat_id, metadata)
 
         self.message_processor.process_summarization(chat_id, sender_id)
 
         latest_messages = self.message_processor.get_latest_messages(chat_id)
-        memory_prompt = self.memory_service.build_memory_prompt(buffer=latest_messages, user_query=content, user_id=sender_id, chat_id=chat_id)
+        memory_prompt = await asyncio.to_thread(
+            self.memory_service.build_memory_prompt, buffer=latest_messages, user_query=content, user_id=sender_id, chat_id=chat_id
+        )
 
         ai_response_chunks = []
-        async for chunk in self.ai_response_generator.stream_ai_response(question=memory_prompt, user_id=sender_id, book_id=book_id):
+        citation_sources: dict[str, dict[str, Any]] = {}
+        async for chunk in self.ai_response_generator.stream_ai_response(
+            question=memory_prompt, user_id=sender_id, book_id=book_id, citation_sources=citation_sources
+        ):
             ai_response_chunks.append(chunk)
             yield chunk
 
         full_ai_response = "".join(ai_response_chunks)
-        self.message_processor.save_ai_message(full_ai_response, sender_id, chat_id, metadata)
+
+        # プロンプトに含めたチャンクIDから引用の位置情報を解決する
+        ai_metadata = dict(metadata or {})
+        citation_result = CitationParser.resolve_chunk_citations(full_ai_response, citation_sources)
+        if citation_result["has_citations"]:
+            ai_metadata["citations"] = citation_result["citations"]
+
+        await asyncio.to_thread(self.message_processor.save_ai_message, full_ai_response, sender_id, chat_id, ai_metadata)
@@ -1,5 +1,6 @@
 """メッセージ処理サービス."""
 
+import asyncio
 from typing import Any
 
 from src.domain.message.entities.message import Message
@@ -8,6 +9,9 @@ from src.domain.message.value_objects.message_content import MessageContent
 from src.domain.message.value_objects.sender_type import SenderType
 from src.infrastructure.memory.memory_service import MemoryService
 
+# 実行中の要約タスク（完了前にガベージコレクションされないよう参照を保持する）
+_summarization_tasks: set[asyncio.Task[None]] = set()
+
 
 class MessageProcessor:
     """メッセージの保存とベクトル化を行うサービス."""
@@ -58,16 +62,24 @@ class MessageProcessor:
         return ai_message
 
     def process_summarization(self, chat_id: str, sender_id: str) -> None:
-        """必要に応じてチャットの要約を実行する."""
+        """必要に応じてチャットの要約を、応答を待たせないようバックグラウンドのスレッドで実行する.
+
+        イベントループから呼び出すこと。要約は記憶ストアだけを使うため、このリクエストのDBセッションとは並行して動かせる。
+        """
         # チャットのメッセージ数を取得
         message_count = self.message_repository.count_by_chat_id(chat_id)
 
         # 必要に応じて要約を実行
-        self.memory_service.summarize_chat(
-            chat_id=chat_id,
-            user_id=sender_id,
-            message_count=message_count,
+        task = asyncio.create_task(
+            asyncio.to_thread(
+                self.memory_service.summarize_chat,
+                chat_id=chat_id,
+                user_id=sender_id,
+                message_count=message_count,
+            )
         )
+        _summarization_tasks.add(task)
+        task.add_done_callback(_summarization_tasks.discard)
 
     def get_latest_messages(self, chat_id: str) -> list[Message]:
         """最新のメッセージを取得し、古い順にソートして返す."""
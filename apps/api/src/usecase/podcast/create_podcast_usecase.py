@@ -6,10 +6,12 @@ from src.domain.book.value_objects.book_id import BookId
 from src.domain.chat.value_objects.user_id import UserId
 from src.domain.podcast.entities.podcast import Podcast
 from src.domain.podcast.exceptions.podcast_exceptions import PodcastAlreadyExistsError
+from src.domain.podcast.repositories.podcast_artifact_repository import PodcastArtifactRepository
 from src.domain.podcast.repositories.podcast_repository import PodcastRepository
 from src.domain.podcast.value_objects.language import PodcastLanguage
 from src.domain.podcast.value_objects.podcast_id import PodcastId
 from src.domain.podcast.value_objects.podcast_status import PodcastStatus
+from src.usecase.podcast.reuse_podcast_artifact_usecase import ReusePodcastArtifactUseCase
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +19,19 @@ logger = logging.getLogger(__name__)
 class CreatePodcastUseCase:
     """Use case for creating a new podcast"""
 
-    def __init__(self, podcast_repository: PodcastRepository, book_repository: BookRepository) -> None:
+    def __init__(
+        self, podcast_repository: PodcastRepository, book_repository: BookRepository, artifact_repository: PodcastArtifactRepository
+    ) -> None:
         self.podcast_repository = podcast_repository
         self.book_repository = book_repository
+        self.artifact_reuser = ReusePodcastArtifactUseCase(podcast_repository, artifact_repository)
 
-    async def execute(self, book_id: BookId, user_id: UserId, title: str, language: PodcastLanguage) -> PodcastId:
+    async def execute(self, book_id: BookId, user_id: UserId, title: str, language: PodcastLanguage) -> Podcast:
         """Create a new podcast for a book
 
+        When the same book content has already been generated in this language
+        (by any user), the podcast is linked to that audio and created completed.
+
         Args:
             book_id: ID of the book to create podcast for
             user_id: ID of the user creating the podcast
@@ -31,7 +39,7 @@ class CreatePodcastUseCase:
             language: PodcastLanguage enum (BCP-47)
 
         Returns:
-            ID of the created podcast
+            The created podcast; completed if it reuses an existing generation, pending otherwise
 
         Raises:
             PodcastAlreadyExistsError: If podcast already exists for this book and user
@@ -65,4 +73,6 @@ class CreatePodcastUseCase:
 
         logger.info(f"Created podcast {podcast_id} for book {book_id} with language {language}")
 
-        return saved_podcast.id
+        await self.artifact_reuser.execute(saved_podcast, book)
+
+        return saved_podcast
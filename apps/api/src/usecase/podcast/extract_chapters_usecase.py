@@ -1,11 +1,13 @@
+import asyncio
 import logging
 import os
 import tempfile
 
 import aiohttp
-from ebooklib import ITEM_DOCUMENT, epub
 
-from src.infrastructure.external.epub import Chapter
+from src.infrastructure.book_file_cache import BookFileCache
+from src.infrastructure.external.epub import Chapter, EpubParser
+from src.infrastructure.external.gcs import GCSClient
 
 logger = logging.getLogger(__name__)
 
@@ -14,31 +16,23 @@ class ExtractChaptersUseCase:
     """Use case for extracting and processing chapters from EPUB files"""
 
     def __init__(self) -> None:
-        self.max_chapter_length = 10000  # Maximum characters per chapter for processing
+        self.gcs_client = GCSClient()
+        self.book_file_cache = BookFileCache.get_shared()
 
     async def execute(self, epub_path: str) -> list[Chapter]:
-        """Extract and process chapters from an EPUB file
+        """Extract chapters from an EPUB file
+
+        All chapters are returned; sizing them for the model is left to the summarizer.
 
         Args:
             epub_path: Path to the EPUB file (can be URL)
-            max_chapters: Maximum number of chapters to process (defaults to config value)
 
         Returns:
-            List of processed chapters ready for summarization
+            List of chapters ready for summarization
 
         """
         logger.info(f"Extracting chapters from {epub_path}")
-
-        # Extract chapters using infrastructure service
-        chapters = await self._extract_chapters(epub_path)
-
-        # Apply business logic for filtering and processing
-        filtered_chapters = self._filter_chapters(chapters)
-        processed_chapters = self._split_long_chapters(filtered_chapters)
-
-        logger.info(f"Processed {len(processed_chapters)} chapters (original: {len(chapters)})")
-
-        return processed_chapters
+        return await self._extract_chapters(epub_path)
 
     async def _extract_chapters(self, epub_path: str) -> list[Chapter]:
         """Extract chapters from an EPUB file
@@ -51,64 +45,14 @@ class ExtractChaptersUseCase:
 
         """
         try:
-            # If `epub_path` is a URL, download it first.
-            if epub_path.startswith(("http://", "https://")):
-                try:
-                    async with aiohttp.ClientSession() as session, session.get(epub_path) as resp:
-                        resp.raise_for_status()
-                        data = await resp.read()
-
-                    # ebooklib.read_epub expects a file path or a file-like object that
-                    # behaves like a zip file. Passing BytesIO directly triggers an
-                    # os.path.isdir check inside ebooklib and results in a TypeError.
-                    # To avoid this, write the bytes to a temporary file and pass the
-                    # file path to read_epub, then clean up the file afterwards.
-
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".epub") as tmp_file:
-                        tmp_file.write(data)
-                        tmp_path = tmp_file.name
-
-                    try:
-                        book = epub.read_epub(tmp_path)
-                    finally:
-                        # Ensure the temporary file is removed
-                        try:
-                            os.remove(tmp_path)
-                        except OSError:
-                            logger.warning(
-                                "Failed to remove temporary EPUB file %s after processing.",
-                                tmp_path,
-                            )
-                except Exception as url_err:
-                    logger.error(f"Failed to download EPUB from URL {epub_path}: {url_err}")
-                    raise
+            object_name = self.gcs_client.get_object_name(epub_path)
+            if object_name != epub_path:
+                chapters = await self._read_stored_chapters(object_name)
+            elif epub_path.startswith(("http://", "https://")):
+                chapters = await self._read_remote_chapters(epub_path)
             else:
                 # Assume local filesystem path
-                book = epub.read_epub(epub_path)
-            chapters = []
-            chapter_index = 0
-
-            # Get all items of type ITEM_DOCUMENT
-            for item in book.get_items_of_type(ITEM_DOCUMENT):
-                # Get content
-                content = item.get_content().decode("utf-8", errors="ignore")
-
-                # Skip if content is too short (likely navigation or metadata)
-                if len(content) < 100:
-                    continue
-
-                # Extract title if available
-                title = item.get_name()
-                if hasattr(item, "title") and item.title:
-                    title = item.title
-
-                chapter = Chapter(index=chapter_index, title=title, content=content)
-
-                # Only include chapters with substantial text content
-                text_content = chapter.get_text_content()
-                if len(text_content) > 50:  # Minimum text length
-                    chapters.append(chapter)
-                    chapter_index += 1
+                chapters = await EpubParser.read_chapters(epub_path)
 
             if not chapters:
                 raise ValueError("No chapters found in EPUB file")
@@ -120,73 +64,34 @@ class ExtractChaptersUseCase:
             logger.error(f"Error extracting chapters from EPUB: {str(e)}")
             raise
 
-    def _split_long_chapters(self, chapters: list[Chapter]) -> list[Chapter]:
-        """Split chapters that are too long for processing
-
-        Args:
-            chapters: List of chapters to process
-
-        Returns:
-            List of chapters with long ones split
+    async def _read_stored_chapters(self, object_name: str) -> list[Chapter]:
+        """Read chapters of a book in our bucket through the local book file cache
 
+        Regenerating a podcast for the same content neither downloads nor parses it again.
         """
-        processed_chapters = []
-
-        for chapter in chapters:
-            text = chapter.get_text_content()
-
-            if len(text) <= self.max_chapter_length:
-                processed_chapters.append(chapter)
-            else:
-                # Split long chapter into chunks
-                chunks = []
-                words = text.split()
-                current_chunk: list[str] = []
-                current_length = 0
-
-                for word in words:
-                    word_length = len(word) + 1  # +1 for space
-                    if current_length + word_length > self.max_chapter_length and current_chunk:
-                        chunk_text = " ".join(current_chunk)
-                        chunks.append(chunk_text)
-                        current_chunk = [word]
-                        current_length = word_length
-                    else:
-                        current_chunk.append(word)
-                        current_length += word_length
-
-                # Add remaining words
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-
-                # Create new Chapter objects for each chunk
-                for i, chunk_text in enumerate(chunks):
-                    chunk_title = f"{chapter.title or 'Chapter'} (Part {i + 1})"
-                    processed_chapters.append(
-                        Chapter(
-                            index=chapter.index,
-                            title=chunk_title,
-                            content=chunk_text,  # Already plain text
-                        )
-                    )
-
-        return processed_chapters
-
-    def _filter_chapters(self, chapters: list[Chapter]) -> list[Chapter]:
-        """Filter chapters to a manageable number for processing
-
-        Args:
-            chapters: List of all chapters
+        with tempfile.TemporaryDirectory(prefix="podcast-epub-") as work_dir:
+            local_path = os.path.join(work_dir, "book.epub")
+            content_hash = await asyncio.to_thread(self.book_file_cache.download_to_file, self.gcs_client, object_name, local_path)
+            return await EpubParser.read_chapters(local_path, content_hash)
 
-        Returns:
-            Filtered list of chapters
+    async def _read_remote_chapters(self, url: str) -> list[Chapter]:
+        """Download an EPUB from an external URL and read its chapters"""
+        try:
+            async with aiohttp.ClientSession() as session, session.get(url) as resp:
+                resp.raise_for_status()
+                data = await resp.read()
+        except Exception as url_err:
+            logger.error(f"Failed to download EPUB from URL {url}: {url_err}")
+            raise
 
-        """
-        if len(chapters) <= self.max_chapter_length:
-            return chapters
+        # The parser worker reads from a file path, so write the bytes to a
+        # temporary file that is removed once parsing has finished.
+        with tempfile.TemporaryDirectory(prefix="podcast-epub-") as work_dir:
+            local_path = os.path.join(work_dir, "book.epub")
+            await asyncio.to_thread(_write_file, local_path, data)
+            return await EpubParser.read_chapters(local_path)
 
-        # Try to evenly sample chapters
-        step = len(chapters) / self.max_chapter_length
-        selected_indices = [int(i * step) for i in range(self.max_chapter_length)]
 
-        return [chapters[i] for i in selected_indices if i < len(chapters)]
+def _write_file(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
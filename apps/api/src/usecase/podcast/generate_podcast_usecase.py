@@ -1,24 +1,39 @@
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
 
+from src.config.app_config import AppConfig
 from src.domain.book.entities.book import Book
 from src.domain.book.repositories.book_repository import BookRepository
 from src.domain.podcast.entities.podcast import Podcast
-from src.domain.podcast.exceptions.podcast_exceptions import PodcastGenerationError, PodcastNotFoundError
+from src.domain.podcast.exceptions.podcast_exceptions import PodcastGenerationError, PodcastNotFoundError, PodcastScriptGenerationError
+from src.domain.podcast.repositories.podcast_artifact_repository import PodcastArtifactRepository
 from src.domain.podcast.repositories.podcast_repository import PodcastRepository
 from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.domain.podcast.value_objects.podcast_audio_segment import PodcastAudioSegment
 from src.domain.podcast.value_objects.podcast_id import PodcastId
-from src.domain.podcast.value_objects.podcast_script import PodcastScript
+from src.domain.podcast.value_objects.podcast_progress import PodcastGenerationStage
+from src.domain.podcast.value_objects.podcast_script import PodcastScript, ScriptTurn
 from src.domain.podcast.value_objects.podcast_status import PodcastStatus
 from src.infrastructure.external.audio import AudioProcessor
 from src.infrastructure.external.gcs import GCSBucketError, GCSClient
 from src.usecase.podcast.extract_chapters_usecase import ExtractChaptersUseCase
 from src.usecase.podcast.generate_script_usecase import GenerateScriptUseCase
+from src.usecase.podcast.podcast_checkpoint_store import PodcastCheckpointStore, content_key, resolve_book_hash
 from src.usecase.podcast.podcast_config import PodcastConfig
+from src.usecase.podcast.podcast_progress_reporter import PodcastProgressReporter, ProgressCounter
+from src.usecase.podcast.reuse_podcast_artifact_usecase import ReusePodcastArtifactUseCase
+from src.usecase.podcast.select_passages_usecase import SelectPassagesUseCase
 from src.usecase.podcast.summarize_chapters_usecase import SummarizeChaptersUseCase
 from src.usecase.podcast.synthesize_audio_usecase import SynthesizeAudioUseCase
+from src.usecase.podcast.translate_script_usecase import TranslateScriptUseCase
 
 logger = logging.getLogger(__name__)
 
+BOOK_SUMMARY_CHECKPOINT = "book_summary.txt"
+SCRIPT_CHECKPOINT = "script.json"
+
 
 class GeneratePodcastUseCase:
     """Use case for generating podcast audio from a book"""
@@ -27,16 +42,24 @@ class GeneratePodcastUseCase:
         self,
         podcast_repository: PodcastRepository,
         book_repository: BookRepository,
+        artifact_repository: PodcastArtifactRepository,
     ) -> None:
         self.podcast_repository = podcast_repository
         self.book_repository = book_repository
         self.gcs_client = GCSClient()
         self.chapter_extractor = ExtractChaptersUseCase()
+        self.passage_selector = SelectPassagesUseCase()
         self.summarizer = SummarizeChaptersUseCase()
         self.script_generator = GenerateScriptUseCase()
+        self.script_translator = TranslateScriptUseCase()
         self.audio_synthesizer = SynthesizeAudioUseCase()
         self.audio_processor = AudioProcessor()
         self.config = PodcastConfig()
+        self.artifact_reuser = ReusePodcastArtifactUseCase(podcast_repository, artifact_repository, self.config, self.gcs_client)
+        app_config = AppConfig.get_config()
+        self.segmented_output = app_config.podcast_segmented_output
+        self.streaming_script = app_config.podcast_streaming_script
+        self.translate_scripts = app_config.podcast_translate_scripts
 
     async def execute(self, podcast_id: PodcastId) -> None:
         """Generate podcast audio for the given podcast ID"""
@@ -60,31 +83,76 @@ class GeneratePodcastUseCase:
                 await self._mark_as_failed(podcast_id, "Book not found")
                 return
 
+            # Another user may have generated the same book meanwhile (or since a failed attempt)
+            if await self.artifact_reuser.execute(podcast, book):
+                return
+
             # Generate podcast
             await self._generate_podcast_audio(podcast, book)
 
+            # Share the result with later podcasts of the same book
+            await self.artifact_reuser.publish(podcast, book)
+
         except Exception as e:
             logger.error(f"Error generating podcast {podcast_id}: {str(e)}")
             await self._mark_as_failed(podcast_id, str(e))
             raise PodcastGenerationError(str(e))
 
     async def _generate_podcast_audio(self, podcast: Podcast, book: Book) -> None:
-        """Generate the actual podcast audio"""
+        """Generate the actual podcast audio, resuming from the last checkpointed stage"""
         try:
-            # Step 1: Extract and process chapters
-            processed_chapters = await self._extract_and_process_chapters(book)
+            checkpoint_store = await self._create_checkpoint_store(book, podcast.language)
+            progress = PodcastProgressReporter(self.podcast_repository, podcast)
+
+            # Steps 1-3: Extract chapters, summarize and write the script (skipped when already checkpointed)
+            script = await self._load_checkpointed_script(checkpoint_store)
+            if script is None and self.translate_scripts:
+                # Translation mode: a script of this book in another language only needs translating
+                script = await self._translate_existing_script(book, podcast.language, checkpoint_store, progress)
+                if script is not None:
+                    await checkpoint_store.save_json(SCRIPT_CHECKPOINT, script.to_list())
+            streamed_audio: list[bytes] | None = None
+            if script is None:
+                book_summary = await checkpoint_store.load_text(BOOK_SUMMARY_CHECKPOINT)
+                if book_summary is None:
+                    await progress.report(PodcastGenerationStage.EXTRACTING)
+                    processed_chapters = await self._extract_and_process_chapters(book)
+                    book_summary = await self._generate_book_summary(
+                        processed_chapters, book.name.value, podcast.language, checkpoint_store, progress
+                    )
+                    await checkpoint_store.save_text(BOOK_SUMMARY_CHECKPOINT, book_summary)
+                else:
+                    logger.info("Reusing checkpointed book summary")
 
-            # Step 2: Generate book summary
-            book_summary = await self._generate_book_summary(processed_chapters, book.name.value, podcast.language)
+                await progress.report(PodcastGenerationStage.SCRIPTING)
+                if self.streaming_script:
+                    script, streamed_audio = await self._stream_script_and_synthesize(
+                        book_summary, book.name.value, podcast.language, checkpoint_store, progress
+                    )
+                else:
+                    script = await self._generate_script(book_summary, book.name.value, podcast.language)
+                await checkpoint_store.save_json(SCRIPT_CHECKPOINT, script.to_list())
 
-            # Step 3: Generate and save podcast script
-            script = await self._generate_and_save_script(podcast, book_summary, book.name.value, podcast.language)
+            await self._save_script(podcast, script)
 
             # Step 4: Synthesize and process audio
-            processed_audio = await self._synthesize_and_process_audio(script, podcast.language)
+            if self.segmented_output:
+                # Segments are published while synthesis continues; the full file is encoded once they are all synthesized
+                segmented_audio = await self._synthesize_and_publish_segments(podcast, script, checkpoint_store, progress, streamed_audio)
+                await self._upload_and_complete(podcast, segmented_audio, progress)
+                logger.info(f"Podcast {podcast.id} generated successfully")
+                return
+
+            final_audio_checkpoint = f"audio/final-{content_key(json.dumps(script.to_list(), ensure_ascii=False))}.mp3"
+            processed_audio = await checkpoint_store.load_bytes(final_audio_checkpoint)
+            if processed_audio is None:
+                processed_audio = await self._synthesize_and_process_audio(script, podcast.language, checkpoint_store, progress, streamed_audio)
+                await checkpoint_store.save_bytes(final_audio_checkpoint, processed_audio, "audio/mpeg")
+            else:
+                logger.info("Reusing checkpointed podcast audio")
 
             # Step 5: Upload audio and mark as completed
-            await self._upload_and_complete(podcast, processed_audio)
+            await self._upload_and_complete(podcast, processed_audio, progress)
 
             logger.info(f"Podcast {podcast.id} generated successfully")
 
@@ -92,43 +160,201 @@ class GeneratePodcastUseCase:
             logger.error(f"Error in podcast generation steps: {str(e)}")
             raise
 
+    async def _create_checkpoint_store(self, book: Book, language: PodcastLanguage) -> PodcastCheckpointStore:
+        """Create the checkpoint store for this book's content, language and config"""
+        book_hash = await resolve_book_hash(book, self.gcs_client)
+        if not book_hash:
+            # Content identity unknown; fall back to the identity of the file
+            book_hash = content_key(book.id.value, book.file_path)
+        return PodcastCheckpointStore(book_hash, language, self.config, self.gcs_client)
+
+    async def _load_checkpointed_script(self, checkpoint_store: PodcastCheckpointStore) -> PodcastScript | None:
+        """Load the script saved by an earlier attempt"""
+        data = await checkpoint_store.load_json(SCRIPT_CHECKPOINT)
+        if not data:
+            return None
+        try:
+            script = PodcastScript.from_list(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid script checkpoint: {str(e)}")
+            return None
+        logger.info("Reusing checkpointed podcast script")
+        return script
+
     async def _extract_and_process_chapters(self, book: Book) -> list:
-        """Extract chapters from EPUB and process them"""
+        """Extract chapters from EPUB and process them
+
+        Representative passages picked from the book's vector index are preferred;
+        the full EPUB text is used when the book has not been indexed.
+        """
+        passages = await self.passage_selector.execute(book)
+        if passages:
+            return passages
+        logger.info("No indexed content for book; summarizing the full text")
         return await self.chapter_extractor.execute(book.file_path)
 
-    async def _generate_book_summary(self, chapters: list, book_title: str, language: PodcastLanguage) -> str:
+    async def _generate_book_summary(
+        self,
+        chapters: list,
+        book_title: str,
+        language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore,
+        progress: PodcastProgressReporter,
+    ) -> str:
         """Generate book summary from chapters"""
         logger.info(f"Summarizing {len(chapters)} chapters")
-        return await self.summarizer.execute(chapters, book_title, language)
+        return await self.summarizer.execute(
+            chapters, book_title, language, checkpoint_store, on_progress=progress.counter(PodcastGenerationStage.SUMMARIZING)
+        )
 
-    async def _generate_and_save_script(self, podcast: Podcast, book_summary: str, book_title: str, language: PodcastLanguage) -> PodcastScript:
-        """Generate podcast script and save it"""
+    async def _generate_script(self, book_summary: str, book_title: str, language: PodcastLanguage) -> PodcastScript:
+        """Generate podcast script"""
         logger.info("Generating podcast script")
-        script = await self.script_generator.execute(book_summary=book_summary, book_title=book_title, language=language)
+        return await self.script_generator.execute(book_summary=book_summary, book_title=book_title, language=language)
+
+    async def _translate_existing_script(
+        self, book: Book, language: PodcastLanguage, checkpoint_store: PodcastCheckpointStore, progress: PodcastProgressReporter
+    ) -> PodcastScript | None:
+        """Translate the script generated for this book in another language, if there is one"""
+        source = await self.artifact_reuser.find_in_other_language(checkpoint_store.book_hash, language)
+        if source is None:
+            return None
+
+        logger.info(f"Translating the {source.language.value} script of podcast {source.source_podcast_id} instead of generating one")
+        await progress.report(PodcastGenerationStage.TRANSLATING)
+        return await self.script_translator.execute(
+            source.script,
+            book.name.value,
+            source.language,
+            language,
+            checkpoint_store,
+            on_progress=progress.counter(PodcastGenerationStage.TRANSLATING),
+        )
+
+    async def _stream_script_and_synthesize(
+        self,
+        book_summary: str,
+        book_title: str,
+        language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore,
+        progress: PodcastProgressReporter,
+    ) -> tuple[PodcastScript, list[bytes] | None]:
+        """Generate the script as a stream, synthesizing its turns while later ones are still being written
+
+        When the stream fails or its script does not validate, the script is generated
+        again with the retries of GenerateScriptUseCase.execute and synthesized afterwards
+        (audio is then None); turns already synthesized are reused from the checkpoints.
+        """
+        logger.info("Generating podcast script with streaming synthesis")
+        turns: list[ScriptTurn] = []
 
-        # Save script to podcast
+        async def collect() -> AsyncIterator[ScriptTurn]:
+            async for turn in self.script_generator.stream(book_summary=book_summary, book_title=book_title, language=language):
+                turns.append(turn)
+                yield turn
+
+        try:
+            audio_data = await self.audio_synthesizer.execute_streaming(
+                collect(), language=language, checkpoint_store=checkpoint_store, on_progress=progress.counter(PodcastGenerationStage.SYNTHESIZING)
+            )
+            return self.script_generator.finalize_streamed_script(turns), audio_data
+        except PodcastScriptGenerationError as e:
+            logger.warning(f"Streamed script rejected, generating it again: {str(e)}")
+            await progress.report(PodcastGenerationStage.SCRIPTING)
+            return await self._generate_script(book_summary, book_title, language), None
+
+    async def _save_script(self, podcast: Podcast, script: PodcastScript) -> None:
+        """Save script to podcast"""
         podcast.set_script(script)
         await self.podcast_repository.update(podcast)
 
-        return script
-
-    async def _synthesize_and_process_audio(self, script: PodcastScript, language: PodcastLanguage) -> bytes:
-        """Synthesize and process audio from script"""
-        logger.info("Synthesizing audio")
-        audio_data = await self.audio_synthesizer.execute(script, language=language)
+    async def _synthesize_and_process_audio(
+        self,
+        script: PodcastScript,
+        language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore,
+        progress: PodcastProgressReporter,
+        audio_data: list[bytes] | None = None,
+    ) -> bytes:
+        """Synthesize (unless already synthesized while streaming) and process audio from script"""
+        if audio_data is None:
+            logger.info("Synthesizing audio")
+            audio_data = await self.audio_synthesizer.execute(
+                script, language=language, checkpoint_store=checkpoint_store, on_progress=progress.counter(PodcastGenerationStage.SYNTHESIZING)
+            )
 
         logger.info("Processing audio")
+        await progress.report(PodcastGenerationStage.ENCODING)
         return await self.audio_processor.process_audio(audio_data)
 
-    async def _upload_and_complete(self, podcast: Podcast, audio_data: bytes) -> None:
+    async def _synthesize_and_publish_segments(
+        self,
+        podcast: Podcast,
+        script: PodcastScript,
+        checkpoint_store: PodcastCheckpointStore,
+        progress: PodcastProgressReporter,
+        audio_data: list[bytes] | None = None,
+    ) -> bytes:
+        """Synthesize the script a few requests at a time, uploading each part and extending the manifest
+
+        The next part is synthesized while the current one is encoded and uploaded.
+        Audio already synthesized while the script streamed (one segment per request) is published as is.
+
+        Returns:
+            The whole podcast, encoded once from all the synthesized segments
+
+        """
+        requests = self.audio_synthesizer.plan_requests(script)
+        size = max(1, self.config.requests_per_audio_segment)
+        batches = [requests[i : i + size] for i in range(0, len(requests), size)]
+        synthesis_progress = ProgressCounter(progress.counter(PodcastGenerationStage.SYNTHESIZING), len(requests))
+
+        podcast.audio_segments = []
+        await self.podcast_repository.update_audio_segments(podcast.id, [])
+
+        async def synthesize_batch(index: int) -> list[bytes]:
+            if audio_data is not None:
+                return audio_data[index * size : (index + 1) * size]
+            return await self.audio_synthesizer.synthesize_requests(batches[index], podcast.language, checkpoint_store, synthesis_progress)
+
+        def synthesize(index: int) -> asyncio.Task[list[bytes]]:
+            return asyncio.create_task(synthesize_batch(index))
+
+        all_segments: list[bytes] = []
+        pending = synthesize(0)
+        try:
+            for index in range(len(batches)):
+                wav_segments = await pending
+                if index + 1 < len(batches):
+                    pending = synthesize(index + 1)
+
+                part = await self.audio_processor.process_audio(wav_segments, fade_in=index == 0, fade_out=index == len(batches) - 1)
+                url = await self._upload_audio(podcast, part, f"segments/{index:04d}.mp3")
+                podcast.add_audio_segment(
+                    PodcastAudioSegment(index=index, url=url, duration_seconds=self.audio_processor.get_duration_seconds(wav_segments))
+                )
+                await self.podcast_repository.update_audio_segments(podcast.id, podcast.audio_segments)
+                all_segments.extend(wav_segments)
+                logger.info(f"Published audio segment {index + 1}/{len(batches)} of podcast {podcast.id}")
+        finally:
+            if not pending.done():
+                pending.cancel()
+
+        # Joined MP3 parts would each carry their own headers and encoder padding, so the full file is encoded separately
+        await progress.report(PodcastGenerationStage.ENCODING)
+        return await self.audio_processor.process_audio(all_segments)
+
+    async def _upload_and_complete(self, podcast: Podcast, audio_data: bytes, progress: PodcastProgressReporter) -> None:
         """Upload audio and mark podcast as completed"""
         logger.info("Uploading to storage")
+        await progress.report(PodcastGenerationStage.UPLOADING)
         audio_url = await self._upload_audio(podcast, audio_data)
         await self.podcast_repository.update_status(podcast.id, PodcastStatus.completed(), audio_url=audio_url)
+        podcast.mark_as_completed(audio_url)
 
-    async def _upload_audio(self, podcast: Podcast, audio_data: bytes) -> str:
+    async def _upload_audio(self, podcast: Podcast, audio_data: bytes, name: str | None = None) -> str:
         """Upload audio to cloud storage"""
-        file_name = f"podcasts/{podcast.id.value}/{podcast.id.value}.mp3"
+        file_name = f"podcasts/{podcast.id.value}/{name or f'{podcast.id.value}.mp3'}"
         try:
             return self.gcs_client.upload_file(file_name, audio_data, "audio/mpeg")
         except GCSBucketError as e:
@@ -1,11 +1,12 @@
 import logging
 import random
+from collections.abc import AsyncIterator
 
 from src.domain.podcast.exceptions.podcast_exceptions import PodcastScriptGenerationError
 from src.domain.podcast.value_objects.language import PodcastLanguage
 from src.domain.podcast.value_objects.podcast_script import PodcastScript, ScriptTurn
 from src.domain.podcast.value_objects.speaker_role import SpeakerRole
-from src.infrastructure.external.gemini import GeminiClient
+from src.infrastructure.client_registry import ClientRegistry
 from src.infrastructure.external.gemini.prompts.podcast_prompts import get_prompts_with_language
 from src.usecase.podcast.podcast_config import PodcastConfig
 
@@ -16,7 +17,7 @@ class GenerateScriptUseCase:
     """Use case for generating podcast scripts from book summaries"""
 
     def __init__(self, config: PodcastConfig | None = None) -> None:
-        self.gemini_client = GeminiClient()
+        self.gemini_client = ClientRegistry.get_gemini_client()
         self.config = config or PodcastConfig()
 
     async def execute(
@@ -57,6 +58,85 @@ class GenerateScriptUseCase:
 
         raise PodcastScriptGenerationError("Unexpected error in script generation")
 
+    async def stream(
+        self,
+        book_summary: str,
+        book_title: str,
+        target_words: int | None = None,
+        include_intro_outro: bool = True,
+        language: PodcastLanguage = PodcastLanguage.EN_US,
+    ) -> AsyncIterator[ScriptTurn]:
+        """Generate a podcast script turn by turn while the model is still writing it
+
+        Turns are validated individually as they arrive. Nothing is yielded until the
+        script has its minimum number of turns with both speakers taking part, so a
+        stream that would fail validation is rejected before its turns are synthesized.
+        Pass all yielded turns to finalize_streamed_script to validate the script as a whole.
+
+        Args:
+            book_summary: Summary of the book
+            book_title: Title of the book
+            target_words: Target word count for the script (defaults to config value)
+            include_intro_outro: Whether to add intro and outro
+            language: Language of the script
+
+        Yields:
+            Validated script turns, in order
+
+        """
+        target_words = target_words or self.config.target_words
+        # Turns held back until the opening of the script passes validation
+        held: list[ScriptTurn] | None = [self._create_intro_turn(book_title, language)] if include_intro_outro else []
+
+        async for turn in self._stream_dialogue_turns(book_summary, book_title, target_words, language):
+            if held is None:
+                yield turn
+                continue
+            held.append(turn)
+            if len(held) >= self.config.min_script_turns and self._is_balanced(held):
+                for held_turn in held:
+                    yield held_turn
+                held = None
+
+        if include_intro_outro:
+            if held is not None:
+                held.append(self._create_outro_turn(book_title, language))
+            else:
+                yield self._create_outro_turn(book_title, language)
+        if held is not None:
+            # The whole script arrived without the opening passing validation; reject it before any synthesis
+            self.finalize_streamed_script(held)
+            for held_turn in held:
+                yield held_turn
+
+    def finalize_streamed_script(self, script_turns: list[ScriptTurn]) -> PodcastScript:
+        """Validate the complete list of streamed turns as a script"""
+        if len(script_turns) < self.config.min_script_turns:
+            raise PodcastScriptGenerationError(f"Generated script too short: {len(script_turns)} turns")
+
+        script = PodcastScript(turns=script_turns)
+        self._validate_script_balance(script)
+
+        logger.info(f"Streamed script with {script.get_turn_count()} turns and {script.get_total_length()} characters")
+        return script
+
+    async def _stream_dialogue_turns(
+        self, book_summary: str, book_title: str, target_words: int, language: PodcastLanguage
+    ) -> AsyncIterator[ScriptTurn]:
+        """Stream the model's dialogue turns, skipping invalid ones"""
+        try:
+            async for turn_data in self.gemini_client.stream_podcast_script(
+                summary=book_summary, book_title=book_title, target_words=target_words, temperature=self.config.initial_temperature, language=language
+            ):
+                try:
+                    turn = ScriptTurn(speaker=SpeakerRole.from_string(turn_data["speaker"]), text=turn_data["text"])
+                except Exception as e:
+                    logger.warning(f"Skipping invalid turn: {e}")
+                    continue
+                yield turn
+        except Exception as e:
+            raise PodcastScriptGenerationError(f"Streaming script generation failed: {str(e)}") from e
+
     async def _generate_script_attempt(
         self,
         book_summary: str,
@@ -151,6 +231,14 @@ class GenerateScriptUseCase:
             raise PodcastScriptGenerationError(f"Maximum 2 speakers supported. {len(unique_speakers)} speakers detected: {unique_speakers}")
         logger.info(f"Speaker validation passed: {len(unique_speakers)} speakers detected")
 
+    def _is_balanced(self, script_turns: list[ScriptTurn]) -> bool:
+        """Whether both speakers take a reasonable share of the turns"""
+        try:
+            self._validate_script_balance(PodcastScript(turns=script_turns))
+        except PodcastScriptGenerationError:
+            return False
+        return True
+
     def _validate_script_balance(self, script: PodcastScript) -> None:
         """Validate that the script has reasonable balance between speakers"""
         host_count = sum(1 for turn in script.turns if turn.speaker.is_host())
@@ -4,6 +4,7 @@ from typing import Any
 from src.domain.podcast.exceptions.podcast_exceptions import PodcastNotFoundError
 from src.domain.podcast.repositories.podcast_repository import PodcastRepository
 from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.domain.podcast.value_objects.podcast_status_view import PodcastStatusView
 
 logger = logging.getLogger(__name__)
 
@@ -28,40 +29,50 @@ class GetPodcastStatusUseCase:
 
         """
         try:
-            podcast = await self.podcast_repository.find_by_id(podcast_id)
+            # The status projection never loads the script; its statistics come from the database
+            view = await self.podcast_repository.find_status_view(podcast_id)
 
-            if not podcast:
+            if not view:
                 raise PodcastNotFoundError(str(podcast_id))
 
-            status_info: dict[str, Any] = {
-                "id": str(podcast.id),
-                "status": str(podcast.status),
-                "title": podcast.title,
-                "language": podcast.language,
-                "book_id": str(podcast.book_id),
-                "user_id": str(podcast.user_id),
-                "audio_url": podcast.audio_url,
-                "error_message": podcast.error_message,
-                "created_at": podcast.created_at.isoformat(),
-                "updated_at": podcast.updated_at.isoformat(),
-                "has_script": podcast.script is not None,
-            }
-
-            # Add script details if available
-            if podcast.script:
-                status_info.update(
-                    {
-                        "script_turn_count": podcast.script.get_turn_count(),
-                        "script_character_count": podcast.script.get_total_length(),
-                    }
-                )
+            logger.debug(f"Retrieved status for podcast {podcast_id}: {view.status}")
 
-            logger.debug(f"Retrieved status for podcast {podcast_id}: {podcast.status}")
-
-            return status_info
+            return status_view_to_dict(view)
 
         except PodcastNotFoundError:
             raise
         except Exception as e:
             logger.error(f"Error getting podcast status {podcast_id}: {str(e)}")
             raise
+
+
+def status_view_to_dict(view: PodcastStatusView) -> dict[str, Any]:
+    """Convert a status view to the status information dictionary"""
+    status_info: dict[str, Any] = {
+        "id": view.id.value,
+        "status": str(view.status),
+        "title": view.title,
+        "language": view.language,
+        "book_id": view.book_id,
+        "user_id": view.user_id,
+        "audio_url": view.audio_url,
+        "audio_segments": [segment.to_dict() for segment in view.audio_segments],
+        "error_message": view.error_message,
+        "progress_stage": view.progress.stage.value if view.progress else None,
+        "progress_current": view.progress.current if view.progress else None,
+        "progress_total": view.progress.total if view.progress else None,
+        "created_at": view.created_at.isoformat(),
+        "updated_at": view.updated_at.isoformat(),
+        "has_script": view.script_turn_count is not None,
+    }
+
+    # Add script details if available
+    if view.script_turn_count is not None:
+        status_info.update(
+            {
+                "script_turn_count": view.script_turn_count,
+                "script_character_count": view.script_character_count,
+            }
+        )
+
+    return status_info
@@ -0,0 +1,121 @@
+"""Persistence of intermediate podcast generation artifacts"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from typing import Any
+
+from src.domain.book.entities.book import Book
+from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.infrastructure.external.gcs import GCSBucketError, GCSClient
+from src.usecase.podcast.podcast_config import PodcastConfig
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout or meaning of stored artifacts changes
+CHECKPOINT_FORMAT_VERSION = 1
+CHECKPOINT_ROOT = "podcast_artifacts"
+# Settings that only affect how generation is executed, not what it produces
+EXECUTION_ONLY_CONFIG_FIELDS = {
+    "max_concurrent_summarization_requests",
+    "audio_synthesis_batch_size",
+    "requests_per_audio_segment",
+    "max_concurrent_translation_requests",
+}
+# Settings that only affect translated scripts; their checkpoint names include them instead
+TRANSLATION_CONFIG_FIELDS = {"translation_batch_tokens", "translation_temperature"}
+
+
+def content_key(*parts: str | int) -> str:
+    """Stable short hash of the given values, used to name artifacts"""
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def config_fingerprint(config: PodcastConfig) -> str:
+    """Version of the generation settings; artifacts from other settings are never reused"""
+    excluded = EXECUTION_ONLY_CONFIG_FIELDS | TRANSLATION_CONFIG_FIELDS
+    settings = {key: value for key, value in asdict(config).items() if key not in excluded}
+    payload = json.dumps({"format": CHECKPOINT_FORMAT_VERSION, "config": settings}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+async def resolve_book_hash(book: Book, gcs_client: GCSClient) -> str | None:
+    """Identity of the book's content, shared by every upload of the same EPUB
+
+    Only the MD5 of the stored file identifies content across users. Without it the
+    EPUB metadata identifier (e.g. an ISBN) stands in, scoped to the book's owner:
+    anyone can write any identifier into an EPUB, so it must not select another
+    user's script and audio.
+
+    Returns:
+        The hash, or None when neither is available
+
+    """
+    try:
+        book_hash = await asyncio.to_thread(gcs_client.get_object_md5, gcs_client.get_object_name(book.file_path))
+        if book_hash:
+            return book_hash
+    except GCSBucketError as e:
+        logger.warning(f"Could not read content hash of book {book.id}: {str(e)}")
+    if book.metadata_identifier:
+        return content_key("metadata_identifier", book.user_id, book.metadata_identifier.strip())
+    return None
+
+
+class PodcastCheckpointStore:
+    """Stores stage outputs of podcast generation in cloud storage
+
+    Artifacts are keyed by book content hash, language and config version, so a
+    retry (or a regeneration of the same book) resumes from the last completed
+    stage. Checkpointing is best effort: storage errors are logged and treated
+    as cache misses rather than failing the generation.
+    """
+
+    def __init__(self, book_hash: str, language: PodcastLanguage, config: PodcastConfig, gcs_client: GCSClient | None = None) -> None:
+        self.gcs_client = gcs_client or GCSClient()
+        self.book_hash = book_hash
+        self.prefix = f"{CHECKPOINT_ROOT}/{book_hash}/{language.value}/{config_fingerprint(config)}"
+
+    async def load_bytes(self, name: str) -> bytes | None:
+        """Load a stored artifact, or None if it does not exist"""
+        object_name = f"{self.prefix}/{name}"
+        try:
+            return await asyncio.to_thread(self.gcs_client.download_bytes, object_name)
+        except Exception as e:
+            logger.warning(f"Could not load checkpoint {object_name}: {str(e)}")
+            return None
+
+    async def save_bytes(self, name: str, data: bytes, content_type: str = "application/octet-stream") -> None:
+        """Store an artifact, overwriting any previous version"""
+        object_name = f"{self.prefix}/{name}"
+        try:
+            await asyncio.to_thread(self.gcs_client.upload_file, object_name, data, content_type)
+        except Exception as e:
+            logger.warning(f"Could not save checkpoint {object_name}: {str(e)}")
+
+    async def load_text(self, name: str) -> str | None:
+        """Load a stored text artifact"""
+        data = await self.load_bytes(name)
+        return data.decode("utf-8") if data is not None else None
+
+    async def save_text(self, name: str, text: str) -> None:
+        """Store a text artifact"""
+        await self.save_bytes(name, text.encode("utf-8"), "text/plain; charset=utf-8")
+
+    async def load_json(self, name: str) -> Any | None:  # noqa: ANN401
+        """Load a stored JSON artifact"""
+        data = await self.load_bytes(name)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            logger.warning(f"Ignoring corrupt checkpoint {self.prefix}/{name}")
+            return None
+
+    async def save_json(self, name: str, payload: Any) -> None:  # noqa: ANN401
+        """Store a JSON artifact"""
+        await self.save_bytes(name, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json")
@@ -7,9 +7,6 @@ from dataclasses import dataclass
 class PodcastConfig:
     """Configuration settings for podcast generation"""
 
-    # Chapter extraction settings
-    max_chapters: int = 15
-
     # Script generation settings
     target_words: int = 1000
     min_script_turns: int = 6
@@ -19,18 +16,30 @@ class PodcastConfig:
     temperature_increment: float = 0.1
     max_text_length_per_turn: int = 500
 
-    # Summarization settings
-    max_concurrent_summarization_requests: int = 2
-    chapter_summary_chunk_size: int = 5
-    chapter_content_clip_lengths: tuple[int, ...] = (6000, 4000, 2000)
-    chapter_summary_max_tokens: tuple[int, ...] = (400, 350, 300)
+    # Passage selection settings (chapters are sampled from the book's indexed chunks)
+    passage_token_budget: int = 40_000
+    min_passage_tokens_per_chapter: int = 400
+
+    # Summarization settings (request pacing is handled by the Gemini rate limiter)
+    max_concurrent_summarization_requests: int = 6
+    map_input_token_budget: int = 60_000  # Book tokens packed into one map request
+    max_map_requests: int = 8  # The map budget grows for long books to keep requests bounded
+    max_map_input_tokens: int = 200_000  # Hard cap per map request (stays under free-tier TPM)
+    map_summary_max_tokens: int = 2048
+    reduce_input_token_budget: int = 24_000  # Summary tokens combined in one reduce request
     partial_summary_max_tokens: int = 800
     final_summary_max_tokens: int = 1200
     summarization_temperature: float = 0.3
 
     # Audio synthesis settings
-    max_chars_per_tts_request: int = 5000
+    max_tts_request_bytes: int = 5000  # SSML size limit of one Text-to-Speech request
     audio_synthesis_batch_size: int = 10
+    requests_per_audio_segment: int = 3  # TTS requests per published segment in segmented output mode
+
+    # Script translation settings (translation mode: reuse a script generated in another language)
+    translation_batch_tokens: int = 1500  # Source script tokens translated in one request
+    translation_temperature: float = 0.3
+    max_concurrent_translation_requests: int = 4
 
     # General settings
     min_speaker_participation: float = 0.2  # Each speaker should have at least 20% of turns
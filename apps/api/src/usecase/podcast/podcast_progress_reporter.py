@@ -0,0 +1,79 @@
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from src.domain.podcast.entities.podcast import Podcast
+from src.domain.podcast.repositories.podcast_repository import PodcastRepository
+from src.domain.podcast.value_objects.podcast_progress import PodcastGenerationStage, PodcastProgress
+
+logger = logging.getLogger(__name__)
+
+# Called with (steps done, total steps) as a countable stage advances
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# Minimum interval between writes of n/m updates within one stage
+DEFAULT_MIN_INTERVAL_SECONDS = 1.0
+
+
+class PodcastProgressReporter:
+    """Records the generation stage of a podcast for status watchers
+
+    Stage changes and the last step of a stage are always written; intermediate
+    n/m updates are throttled so fast stages do not turn into a write per step.
+    The podcast entity is kept in step, so saving it does not erase the stage.
+    Reporting is best effort: a failed write is logged and never fails generation.
+    """
+
+    def __init__(self, podcast_repository: PodcastRepository, podcast: Podcast, min_interval_seconds: float = DEFAULT_MIN_INTERVAL_SECONDS) -> None:
+        self.podcast_repository = podcast_repository
+        self.podcast = podcast
+        self.min_interval_seconds = min_interval_seconds
+        self._last: PodcastProgress | None = None
+        self._last_written_at = 0.0
+
+    async def report(self, stage: PodcastGenerationStage, current: int | None = None, total: int | None = None) -> None:
+        """Record the current stage, optionally with n of m steps done"""
+        progress = PodcastProgress(stage=stage, current=current, total=total)
+        if progress == self._last:
+            return
+
+        now = time.monotonic()
+        stage_changed = self._last is None or self._last.stage != stage
+        stage_finished = current is not None and current == total
+        if not stage_changed and not stage_finished and now - self._last_written_at < self.min_interval_seconds:
+            return
+
+        self._last = progress
+        self._last_written_at = now
+        self.podcast.set_progress(progress)
+        try:
+            await self.podcast_repository.update_progress(self.podcast.id, progress)
+        except Exception as e:
+            logger.warning(f"Could not record progress of podcast {self.podcast.id}: {str(e)}")
+
+    def counter(self, stage: PodcastGenerationStage) -> ProgressCallback:
+        """Callback reporting (done, total) steps of the given stage"""
+
+        async def on_progress(current: int, total: int) -> None:
+            await self.report(stage, current, total)
+
+        return on_progress
+
+
+class ProgressCounter:
+    """Counts finished steps of a stage whose total may grow as more work is discovered"""
+
+    def __init__(self, on_progress: ProgressCallback | None = None, total: int = 0) -> None:
+        self.on_progress = on_progress
+        self.total = total
+        self.done = 0
+
+    def add(self, steps: int) -> None:
+        """Extend the total by newly discovered steps"""
+        self.total += steps
+
+    async def step(self) -> None:
+        """Mark one step finished and report it"""
+        self.done += 1
+        if self.on_progress:
+            await self.on_progress(self.done, max(self.done, self.total))
@@ -0,0 +1,121 @@
+import logging
+
+from src.domain.book.entities.book import Book
+from src.domain.podcast.entities.podcast import Podcast
+from src.domain.podcast.entities.podcast_artifact import PodcastArtifact
+from src.domain.podcast.repositories.podcast_artifact_repository import PodcastArtifactRepository
+from src.domain.podcast.repositories.podcast_repository import PodcastRepository
+from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.infrastructure.external.gcs import GCSClient
+from src.usecase.podcast.podcast_checkpoint_store import config_fingerprint, content_key, resolve_book_hash
+from src.usecase.podcast.podcast_config import PodcastConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ReusePodcastArtifactUseCase:
+    """Use case for sharing a generated podcast between all users of the same book
+
+    The first successful generation for a book content, language and config
+    version is published as the canonical artifact. Later podcasts for the same
+    combination link to its script and audio instead of running the pipeline.
+    Reuse is best effort: lookup and publish errors are logged, and generation
+    simply runs as usual.
+    """
+
+    def __init__(
+        self,
+        podcast_repository: PodcastRepository,
+        artifact_repository: PodcastArtifactRepository,
+        config: PodcastConfig | None = None,
+        gcs_client: GCSClient | None = None,
+    ) -> None:
+        self.podcast_repository = podcast_repository
+        self.artifact_repository = artifact_repository
+        self.config = config or PodcastConfig()
+        self.gcs_client = gcs_client or GCSClient()
+
+    async def execute(self, podcast: Podcast, book: Book) -> bool:
+        """Complete the podcast from the canonical artifact of its book, if one exists
+
+        Args:
+            podcast: Podcast that has not been generated yet
+            book: Book of the podcast
+
+        Returns:
+            True if the podcast was linked to an existing artifact
+
+        """
+        try:
+            key = await self._artifact_key(book, podcast.language)
+            artifact = await self.artifact_repository.find_by_key(key) if key else None
+        except Exception as e:
+            logger.warning(f"Could not look up a reusable podcast for book {book.id}: {str(e)}")
+            return False
+        if artifact is None:
+            return False
+
+        podcast.set_script(artifact.script)
+        podcast.audio_segments = list(artifact.audio_segments)
+        podcast.mark_as_completed(artifact.audio_url)
+        await self.podcast_repository.update(podcast)
+        logger.info(f"Podcast {podcast.id} reuses the audio generated for podcast {artifact.source_podcast_id}")
+        return True
+
+    async def publish(self, podcast: Podcast, book: Book) -> None:
+        """Publish a completed podcast as the canonical artifact of its book
+
+        Args:
+            podcast: Podcast with a script and uploaded audio
+            book: Book of the podcast
+
+        """
+        if podcast.script is None or not podcast.audio_url:
+            return
+        try:
+            book_hash = await resolve_book_hash(book, self.gcs_client)
+            if not book_hash:
+                logger.info(f"Book {book.id} has no content identity; podcast {podcast.id} is not shared")
+                return
+            config_version = config_fingerprint(self.config)
+            await self.artifact_repository.save(
+                PodcastArtifact(
+                    key=artifact_key(book_hash, podcast.language, config_version),
+                    book_hash=book_hash,
+                    language=podcast.language,
+                    config_version=config_version,
+                    script=podcast.script,
+                    audio_url=podcast.audio_url,
+                    audio_segments=podcast.audio_segments,
+                    source_podcast_id=podcast.id,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Could not publish podcast {podcast.id} for reuse: {str(e)}")
+
+    async def find_in_other_language(self, book_hash: str, language: PodcastLanguage) -> PodcastArtifact | None:
+        """Find an artifact of the same book content and config version in a different language
+
+        Args:
+            book_hash: Content identity of the book
+            language: Language that is wanted (and therefore not returned)
+
+        Returns:
+            The earliest such artifact, or None
+
+        """
+        try:
+            artifacts = await self.artifact_repository.find_by_book_hash(book_hash, config_fingerprint(self.config))
+        except Exception as e:
+            logger.warning(f"Could not look up podcasts of book content {book_hash}: {str(e)}")
+            return None
+        return next((artifact for artifact in artifacts if artifact.language != language), None)
+
+    async def _artifact_key(self, book: Book, language: PodcastLanguage) -> str | None:
+        book_hash = await resolve_book_hash(book, self.gcs_client)
+        return artifact_key(book_hash, language, config_fingerprint(self.config)) if book_hash else None
+
+
+def artifact_key(book_hash: str, language: PodcastLanguage, config_version: str) -> str:
+    """Key of the canonical artifact for a book content, language and config version"""
+    return content_key(book_hash, language.value, config_version)
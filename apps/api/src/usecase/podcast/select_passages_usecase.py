@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from itertools import groupby
+
+import numpy as np
+
+from src.domain.book.entities.book import Book
+from src.infrastructure.external.epub import Chapter
+from src.infrastructure.memory.memory_vector_store import MemoryVectorStore
+from src.usecase.podcast.podcast_config import PodcastConfig
+
+logger = logging.getLogger(__name__)
+
+KMEANS_MAX_ITERATIONS = 25
+# Fixed seed so the same book always yields the same passages (and checkpoint keys)
+KMEANS_SEED = 0
+PASSAGE_SEPARATOR = "\n…\n"
+
+
+class SelectPassagesUseCase:
+    """Use case for picking representative passages of a book from its indexed vectors
+
+    Chunks already embedded into the ``BookContent`` collection are clustered per
+    chapter, and the chunk closest to each cluster centre is kept. Each chapter
+    gets a share of the token budget proportional to its length, so the whole
+    book is covered while far less text is sent to the summarizer.
+    """
+
+    def __init__(self, config: PodcastConfig | None = None) -> None:
+        self.config = config or PodcastConfig()
+        self.vector_store: MemoryVectorStore | None = None
+
+    async def execute(self, book: Book) -> list[Chapter] | None:
+        """Select passages for each chapter of the book
+
+        Args:
+            book: Book whose content has been vector indexed
+
+        Returns:
+            One Chapter per spine section containing the selected passages in reading order,
+            or None when the book has no indexed content or was indexed without position metadata
+
+        """
+        try:
+            # Connect lazily so generation still works (from the full text) when the vector store is down
+            self.vector_store = self.vector_store or MemoryVectorStore()
+            chunks = await asyncio.to_thread(self.vector_store.get_book_chunks, book.user_id, book.id.value)
+        except Exception as e:
+            logger.warning(f"Could not load indexed chunks for book {book.id}: {str(e)}")
+            return None
+        if not chunks:
+            return None
+        if not all(_has_position(chunk) for chunk in chunks):
+            # Indexed before chunks carried their position: the reading order cannot be restored
+            logger.info(f"Indexed chunks for book {book.id} have no position metadata; using the full text")
+            return None
+
+        chapters_chunks = [list(group) for _, group in groupby(chunks, key=lambda chunk: chunk.get("spine_index") or 0)]
+        total_tokens = sum(_token_count(chunk) for chunk in chunks)
+        budget = self.config.passage_token_budget
+
+        chapters: list[Chapter] = []
+        selected_tokens = 0
+        for chapter_chunks in chapters_chunks:
+            chapter_tokens = sum(_token_count(chunk) for chunk in chapter_chunks)
+            if total_tokens <= budget:
+                selected = chapter_chunks
+            else:
+                chapter_budget = max(self.config.min_passage_tokens_per_chapter, budget * chapter_tokens // total_tokens)
+                selected = select_representative_chunks(chapter_chunks, chapter_budget)
+
+            selected_tokens += sum(_token_count(chunk) for chunk in selected)
+            first = chapter_chunks[0]
+            chapters.append(
+                Chapter(
+                    index=first.get("spine_index") or 0,
+                    title=first.get("chapter_title") or None,
+                    content=PASSAGE_SEPARATOR.join(str(chunk["content"]) for chunk in selected),
+                )
+            )
+
+        logger.info(f"Selected {selected_tokens} of {total_tokens} tokens across {len(chapters)} chapters from indexed passages")
+        return chapters
+
+
+def select_representative_chunks(chunks: list[dict], token_budget: int) -> list[dict]:
+    """Pick the chunks closest to k-means centroids, within a token budget, in reading order"""
+    if sum(_token_count(chunk) for chunk in chunks) <= token_budget:
+        return chunks
+
+    mean_tokens = max(1, sum(_token_count(chunk) for chunk in chunks) // len(chunks))
+    k = min(len(chunks), max(1, token_budget // mean_tokens))
+
+    vectors = np.asarray([chunk["vector"] for chunk in chunks], dtype=np.float32)
+    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    labels, centroids = _spherical_kmeans(vectors, k)
+
+    # One representative per cluster; larger clusters (more of the chapter's content) first
+    representatives: list[tuple[int, int]] = []
+    for cluster in range(k):
+        members = np.flatnonzero(labels == cluster)
+        if members.size == 0:
+            continue
+        best = members[np.argmax(vectors[members] @ centroids[cluster])]
+        representatives.append((members.size, int(best)))
+    representatives.sort(key=lambda item: -item[0])
+
+    selected: list[int] = []
+    used_tokens = 0
+    for _size, index in representatives:
+        tokens = _token_count(chunks[index])
+        if selected and used_tokens + tokens > token_budget:
+            continue
+        selected.append(index)
+        used_tokens += tokens
+
+    return [chunks[index] for index in sorted(selected)]
+
+
+def _spherical_kmeans(vectors: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """K-means on unit vectors (cosine similarity) with k-means++ seeding"""
+    rng = np.random.default_rng(KMEANS_SEED)
+    centroids = [vectors[rng.integers(len(vectors))]]
+    for _ in range(1, k):
+        similarities = np.max(vectors @ np.asarray(centroids).T, axis=1)
+        weights = np.square(np.clip(1.0 - similarities, 0.0, None)).astype(np.float64)
+        total = weights.sum()
+        index = rng.choice(len(vectors), p=weights / total) if total > 0 else rng.integers(len(vectors))
+        centroids.append(vectors[index])
+    centroid_matrix = np.asarray(centroids)
+
+    labels = np.zeros(len(vectors), dtype=np.int64)
+    for iteration in range(KMEANS_MAX_ITERATIONS):
+        new_labels = np.argmax(vectors @ centroid_matrix.T, axis=1)
+        if iteration > 0 and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for cluster in range(k):
+            members = vectors[labels == cluster]
+            if len(members):
+                centroid = members.sum(axis=0)
+                centroid_matrix[cluster] = centroid / max(float(np.linalg.norm(centroid)), 1e-12)
+
+    return labels, centroid_matrix
+
+
+def _has_position(chunk: dict) -> bool:
+    return chunk.get("spine_index") is not None and chunk.get("chunk_index") is not None
+
+
+def _token_count(chunk: dict) -> int:
+    return int(chunk.get("token_count") or 0) or max(1, len(str(chunk.get("content", ""))) // 4)
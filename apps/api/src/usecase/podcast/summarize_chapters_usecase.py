@@ -1,146 +1,230 @@
 import asyncio
 import logging
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
 from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.infrastructure.client_registry import ClientRegistry
 from src.infrastructure.external.epub import Chapter
-from src.infrastructure.external.gemini import GeminiClient
 from src.infrastructure.external.gemini.prompts.podcast_prompts import get_prompts_with_language
+from src.infrastructure.memory.book_text_chunker import BookTextChunker
+from src.infrastructure.tokenizer import count_tokens
+from src.usecase.podcast.podcast_checkpoint_store import PodcastCheckpointStore, content_key
 from src.usecase.podcast.podcast_config import PodcastConfig
+from src.usecase.podcast.podcast_progress_reporter import ProgressCallback, ProgressCounter
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _Section:
+    """A labelled piece of text fed to one map or reduce request"""
+
+    label: str
+    text: str
+    token_count: int
+
+
 class SummarizeChaptersUseCase:
-    """Use case for summarizing book chapters"""
+    """Use case for summarizing a whole book with hierarchical map-reduce
+
+    Map: chapters are packed into as few requests as the input token budget
+    allows (the budget grows with the book so the number of map requests stays
+    bounded). Reduce: the resulting summaries are combined in groups, level by
+    level, until they fit a single final request. Total requests therefore grow
+    roughly logarithmically with book length instead of one per chapter.
+    """
 
     def __init__(self) -> None:
-        self.gemini_client = GeminiClient()
+        self.gemini_client = ClientRegistry.get_gemini_client()
         self.config = PodcastConfig()
 
-    async def execute(self, chapters: list[Chapter], book_title: str, language: PodcastLanguage = PodcastLanguage.EN_US) -> str:
-        """Summarize all chapters and create a comprehensive book summary"""
-        try:
-            # NOTE: Limit chapters to 6 to avoid API rate limits
-            chapters_to_summarize = chapters[:6]
-            logger.info(f"Starting summarization of {len(chapters_to_summarize)} chapters (limited to 6)")
+    async def execute(
+        self,
+        chapters: list[Chapter],
+        book_title: str,
+        language: PodcastLanguage = PodcastLanguage.EN_US,
+        checkpoint_store: PodcastCheckpointStore | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> str:
+        """Summarize all chapters and create a comprehensive book summary
+
+        Args:
+            chapters: Chapters to summarize
+            book_title: Title of the book
+            language: Language of the summaries
+            checkpoint_store: When given, intermediate summaries are reused from and saved to it
+            on_progress: Called with (requests done, requests planned so far); reduce levels extend the total
+
+        Returns:
+            Book summary
 
-            # First, summarize individual chapters
-            chapter_summaries = await self._summarize_chapters_batch(chapters_to_summarize, language)
+        """
+        try:
+            sections = self._build_sections(chapters)
+            if not sections:
+                raise ValueError("No chapter text to summarize")
 
-            # Then, combine chapter summaries into a book summary
-            logger.info("Combining chapter summaries into book summary")
-            return await self._create_book_summary(chapter_summaries, book_title, language)
+            progress = ProgressCounter(on_progress)
+            summaries = await self._map(sections, language, checkpoint_store, progress)
+            return await self._reduce(summaries, book_title, language, checkpoint_store, progress)
 
         except Exception as e:
             logger.error(f"Error during chapter summarization: {str(e)}")
             raise
 
-    async def _summarize_chapters_batch(self, chapters: list[Chapter], language: PodcastLanguage = PodcastLanguage.EN_US) -> list[str]:
-        """Summarize chapters sequentially with a delay to respect rate limits."""
-        summaries = []
-        # 15 requests per minute for the free tier. Wait 4 seconds between requests.
-        delay_seconds = 4
-        for i, chapter in enumerate(chapters):
-            summary = await self._summarize_single_chapter(chapter, language)
-            summaries.append(summary)
-            if i < len(chapters) - 1:  # Don't sleep after the last chapter
-                await asyncio.sleep(delay_seconds)
-        return summaries
-
-    async def _summarize_single_chapter(self, chapter: Chapter, language: PodcastLanguage = PodcastLanguage.EN_US) -> str:
-        """Summarize a single chapter"""
-        try:
-            # Get plain text content once (may be large)
-            raw_text = chapter.get_text_content()
-
-            # Retry with progressively shorter inputs
-            # Tuple = (max_characters, max_output_tokens)
-            attempts = list(zip(self.config.chapter_content_clip_lengths, self.config.chapter_summary_max_tokens, strict=False))
-
-            for idx, (clip_len, max_tokens) in enumerate(attempts):
-                try:
-                    lang_prompts = get_prompts_with_language(language)
-                    prompt = lang_prompts["chapter_summary"]
-                    if isinstance(prompt, str):
-                        prompt = prompt.format(chapter_content=raw_text[:clip_len])
-                    else:
-                        raise ValueError(f"Expected string for chapter_summary prompt, got {type(prompt)}")
-
-                    return await self.gemini_client.summarize_text(
-                        text=prompt,
-                        max_output_tokens=max_tokens,
-                        temperature=0.3,
+    def _build_sections(self, chapters: list[Chapter]) -> list[_Section]:
+        """Turn chapters into labelled sections, splitting any that exceed one map request"""
+        sections: list[_Section] = []
+        for chapter in chapters:
+            text = chapter.get_text_content().strip()
+            if not text:
+                continue
+            label = chapter.title or f"Chapter {chapter.index + 1}"
+            token_count = count_tokens(text)
+            if token_count <= self.config.max_map_input_tokens:
+                sections.append(_Section(label=label, text=text, token_count=token_count))
+                continue
+
+            chunker = BookTextChunker(chunk_tokens=self.config.max_map_input_tokens, overlap_tokens=0)
+            for part, chunk in enumerate(chunker.split_text(text), start=1):
+                sections.append(_Section(label=f"{label} (Part {part})", text=chunk.text, token_count=chunk.token_count))
+        return sections
+
+    def _map_token_budget(self, sections: list[_Section]) -> int:
+        """Input tokens per map request, grown so the number of map requests stays bounded"""
+        total_tokens = sum(section.token_count for section in sections)
+        budget = max(self.config.map_input_token_budget, math.ceil(total_tokens / self.config.max_map_requests))
+        return min(budget, self.config.max_map_input_tokens)
+
+    async def _map(
+        self,
+        sections: list[_Section],
+        language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore | None,
+        progress: ProgressCounter,
+    ) -> list[_Section]:
+        """Summarize packed groups of chapters concurrently"""
+        groups = _pack(sections, self._map_token_budget(sections))
+        # Map requests plus at least the final combine
+        progress.add(len(groups) + 1)
+        logger.info(f"Map stage: {len(sections)} sections ({sum(s.token_count for s in sections)} tokens) in {len(groups)} requests")
+
+        prompt_template = str(get_prompts_with_language(language)["chapter_group_summary"])
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_summarization_requests)
+
+        async def summarize(group: list[_Section]) -> _Section:
+            content = "\n\n".join(f"## {section.label}\n{section.text}" for section in group)
+            name = f"map_summaries/{content_key(language.value, content)}.txt"
+
+            async def generate() -> str:
+                async with semaphore:
+                    return await self._summarize_with_retry(prompt_template.format(chapter_content=content), self.config.map_summary_max_tokens)
+
+            summary = await _cached(checkpoint_store, name, generate)
+            await progress.step()
+            return _Section(label=_range_label(group), text=summary, token_count=count_tokens(summary))
+
+        return list(await asyncio.gather(*(summarize(group) for group in groups)))
+
+    async def _reduce(
+        self,
+        summaries: list[_Section],
+        book_title: str,
+        language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore | None,
+        progress: ProgressCounter,
+    ) -> str:
+        """Combine summaries level by level until they fit one final request"""
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_summarization_requests)
+
+        async def combine(group: list[_Section], max_output_tokens: int) -> str:
+            labels = [section.label for section in group]
+            texts = [section.text for section in group]
+            name = f"reduce_summaries/{content_key(language.value, book_title, max_output_tokens, *labels, *texts)}.txt"
+
+            async def generate() -> str:
+                async with semaphore:
+                    return await self.gemini_client.combine_summaries(
+                        texts,
+                        book_title,
+                        max_output_tokens=max_output_tokens,
+                        temperature=self.config.summarization_temperature,
+                        language=language,
+                        section_labels=labels,
                     )
-                except ValueError as ve:
-                    # retry only on MAX_TOKENS (finish_reason=2)
-                    if "finish_reason=2" in str(ve) and idx + 1 < len(attempts):
-                        logger.warning(f"Retrying chapter {chapter.index} summarization with shorter input (len={clip_len}) due to token limit")
-                        continue
-                    # For other errors or final attempt, raise
-                    raise ve
-            return f"Chapter {chapter.index + 1}: Summary unavailable due to processing error."
-        except Exception as e:
-            logger.error(f"Error summarizing chapter {chapter.index}: {str(e)}")
-            # Return a fallback summary on error
-            return f"Chapter {chapter.index + 1}: Summary unavailable due to processing error."
-
-    async def _create_book_summary(self, chapter_summaries: list[str], book_title: str, language: PodcastLanguage = PodcastLanguage.EN_US) -> str:
-        """Two-pass summarization to stay within token limits.
 
-        1. Chunk the chapter summaries (default 5 per chunk) and get partial summaries
-        2. Combine those partial summaries into the final book summary
-        """
-        chunk_size = self.config.chapter_summary_chunk_size
-
-        # If we have few chapters, combine directly
-        if len(chapter_summaries) <= chunk_size:
-            return await self.gemini_client.combine_summaries(
-                chapter_summaries,
-                book_title,
-                max_output_tokens=self.config.final_summary_max_tokens,
-                temperature=self.config.summarization_temperature,
-                language=language,
+            text = await _cached(checkpoint_store, name, generate)
+            await progress.step()
+            return text
+
+        level = 1
+        while sum(section.token_count for section in summaries) > self.config.reduce_input_token_budget and len(summaries) > 1:
+            groups = _pack(summaries, self.config.reduce_input_token_budget)
+            if len(groups) == len(summaries):
+                # Every summary fills a request on its own; pair them up to guarantee progress
+                groups = [summaries[i : i + 2] for i in range(0, len(summaries), 2)]
+            logger.info(f"Reduce level {level}: {len(summaries)} summaries in {len(groups)} requests")
+            progress.add(sum(1 for group in groups if len(group) > 1))
+
+            async def reduce_group(group: list[_Section]) -> _Section:
+                if len(group) == 1:
+                    return group[0]
+                text = await combine(group, self.config.partial_summary_max_tokens)
+                return _Section(label=_range_label(group), text=text, token_count=count_tokens(text))
+
+            summaries = list(await asyncio.gather(*(reduce_group(group) for group in groups)))
+            level += 1
+
+        logger.info(f"Combining {len(summaries)} summaries into book summary")
+        return await combine(summaries, self.config.final_summary_max_tokens)
+
+    async def _summarize_with_retry(self, prompt: str, max_output_tokens: int) -> str:
+        """Summarize, retrying once with a larger output budget when the model hits MAX_TOKENS"""
+        try:
+            return await self.gemini_client.summarize_text(
+                prompt, max_output_tokens=max_output_tokens, temperature=self.config.summarization_temperature
+            )
+        except ValueError as ve:
+            # finish_reason=2 (MAX_TOKENS) with no text: the output budget was used up before any text was produced
+            if "finish_reason=2" not in str(ve):
+                raise
+            logger.warning(f"Summary hit the output token limit ({max_output_tokens}); retrying with a larger limit")
+            return await self.gemini_client.summarize_text(
+                prompt, max_output_tokens=max_output_tokens * 2, temperature=self.config.summarization_temperature
             )
 
-        # 1st pass: create partial summaries
-        partial_summaries: list[str] = []
-        # 15 requests per minute for the free tier. Wait 4 seconds between requests.
-        delay_seconds = 4
-        for i in range(0, len(chapter_summaries), chunk_size):
-            chunk = chapter_summaries[i : i + chunk_size]
-            try:
-                partial = await self.gemini_client.combine_summaries(
-                    chunk,
-                    book_title,
-                    max_output_tokens=self.config.partial_summary_max_tokens,
-                    temperature=self.config.summarization_temperature,
-                    language=language,
-                )
-                partial_summaries.append(partial)
-                if i + chunk_size < len(chapter_summaries):
-                    await asyncio.sleep(delay_seconds)
-            except ValueError as ve:
-                # If even a small chunk hits length, fall back to summarize_text on truncated text
-                logger.warning(f"Partial summarization failed for chapters {i}-{i + len(chunk) - 1}: {ve}")
-                lang_prompts = get_prompts_with_language(language)
-                truncated_prompt = lang_prompts["book_summary"]
-                if isinstance(truncated_prompt, str):
-                    truncated_prompt = truncated_prompt.format(
-                        book_title=book_title,
-                        chapter_summaries="\n\n".join(chunk)[:2000],
-                    )
-                else:
-                    raise ValueError(f"Expected string for book_summary prompt, got {type(truncated_prompt)}")
-                partial = await self.gemini_client.summarize_text(
-                    truncated_prompt, max_output_tokens=self.config.partial_summary_max_tokens, temperature=self.config.summarization_temperature
-                )
-                partial_summaries.append(partial)
-
-        # 2nd pass: combine partial summaries into final summary
-        return await self.gemini_client.combine_summaries(
-            partial_summaries,
-            book_title,
-            max_output_tokens=self.config.final_summary_max_tokens,
-            temperature=self.config.summarization_temperature,
-            language=language,
-        )
+
+def _pack(sections: list[_Section], token_budget: int) -> list[list[_Section]]:
+    """Greedily group consecutive sections without exceeding the token budget"""
+    groups: list[list[_Section]] = []
+    current: list[_Section] = []
+    current_tokens = 0
+    for section in sections:
+        if current and current_tokens + section.token_count > token_budget:
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(section)
+        current_tokens += section.token_count
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _range_label(group: list[_Section]) -> str:
+    return group[0].label if len(group) == 1 else f"{group[0].label} – {group[-1].label}"
+
+
+async def _cached(checkpoint_store: PodcastCheckpointStore | None, name: str, generate: Callable[[], Awaitable[str]]) -> str:
+    """Return the checkpointed text, or generate and checkpoint it"""
+    if checkpoint_store:
+        cached = await checkpoint_store.load_text(name)
+        if cached is not None:
+            logger.info(f"Reusing checkpoint {name}")
+            return cached
+
+    text = await generate()
+    if checkpoint_store:
+        await checkpoint_store.save_text(name, text)
+    return text
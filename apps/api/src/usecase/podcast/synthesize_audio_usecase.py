@@ -1,10 +1,15 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 
 from src.domain.podcast.exceptions.podcast_exceptions import PodcastAudioSynthesisError
 from src.domain.podcast.value_objects.language import PodcastLanguage
-from src.domain.podcast.value_objects.podcast_script import PodcastScript
-from src.infrastructure.external.cloud_tts.tts_client import CloudTTSClient
+from src.domain.podcast.value_objects.podcast_script import PodcastScript, ScriptTurn
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.external.cloud_tts.request_planner import TTSRequest, plan_tts_requests
+from src.usecase.podcast.podcast_checkpoint_store import PodcastCheckpointStore, content_key
 from src.usecase.podcast.podcast_config import PodcastConfig
+from src.usecase.podcast.podcast_progress_reporter import ProgressCallback, ProgressCounter
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +21,39 @@ class SynthesizeAudioUseCase:
         self,
         config: PodcastConfig | None = None,
     ) -> None:
-        self.tts_client = CloudTTSClient()
+        self.tts_client = ClientRegistry.get_tts_client()
         self.config = config or PodcastConfig()
 
-    async def execute(self, script: PodcastScript, language: PodcastLanguage = PodcastLanguage.EN_US) -> bytes:
+    async def execute(
+        self,
+        script: PodcastScript,
+        language: PodcastLanguage = PodcastLanguage.EN_US,
+        checkpoint_store: PodcastCheckpointStore | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> list[bytes]:
         """Synthesize audio from a podcast script
 
         Args:
             script: PodcastScript to synthesize
             language: Language of the script
+            checkpoint_store: When given, per-request audio segments are reused from and saved to it
+            on_progress: Called with (requests done, total requests) as synthesis advances
+
+        Returns:
+            Audio segments in WAV (LINEAR16) format, in playback order
+
+        """
+        requests = self.plan_requests(script)
+        return await self.synthesize_requests(requests, language, checkpoint_store, ProgressCounter(on_progress, len(requests)))
+
+    def plan_requests(self, script: PodcastScript) -> list[TTSRequest]:
+        """Validate the script and plan its Text-to-Speech requests
+
+        Args:
+            script: PodcastScript to synthesize
 
         Returns:
-            Complete audio data in MP3 format
+            Requests in playback order; adjacent turns of the same speaker share one request
 
         """
         try:
@@ -37,36 +63,145 @@ class SynthesizeAudioUseCase:
             # Convert script to dict format
             dialogue_turns = self._script_to_dict_list(script)
 
-            # Check if we need to split into chunks
-            if self._should_use_chunking(script, self.config.max_chars_per_tts_request):
-                logger.info(f"Splitting script into chunks (total: {script.get_total_length()} chars)")
-                audio_chunks = await self.tts_client.synthesize_with_chunks(dialogue_turns, self.config.max_chars_per_tts_request, language.value)
-            else:
-                logger.info("Synthesizing script in single request")
-                audio_chunks = [await self.tts_client.synthesize_multi_speaker(dialogue_turns, language.value)]
+            requests = plan_tts_requests(dialogue_turns, self.config.max_tts_request_bytes)
+            logger.info(f"Planned {len(dialogue_turns)} turns as {len(requests)} requests")
+            return requests
+
+        except Exception as e:
+            logger.error(f"Error during audio synthesis: {str(e)}")
+            raise PodcastAudioSynthesisError(str(e))
+
+    async def synthesize_requests(
+        self,
+        requests: list[TTSRequest],
+        language: PodcastLanguage = PodcastLanguage.EN_US,
+        checkpoint_store: PodcastCheckpointStore | None = None,
+        progress: ProgressCounter | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[bytes]:
+        """Synthesize planned requests
+
+        Args:
+            requests: Requests from plan_requests
+            language: Language of the script
+            checkpoint_store: When given, per-request audio segments are reused from and saved to it
+            progress: Advanced by one step per finished (or reused) request
+            semaphore: Shared by calls running at the same time so that together they stay
+                within audio_synthesis_batch_size TTS requests
+
+        Returns:
+            Audio segments in WAV (LINEAR16) format, one per request
 
-            return audio_chunks[0] if len(audio_chunks) == 1 else b"".join(audio_chunks)
+        """
+        try:
+            on_request_done = progress.step if progress else None
+            if checkpoint_store is None:
+                return await self.tts_client.synthesize_requests(
+                    requests, language.value, self.config.audio_synthesis_batch_size, on_request_done, semaphore=semaphore
+                )
+            return await self._synthesize_requests_with_checkpoints(requests, language, checkpoint_store, progress, semaphore)
 
         except Exception as e:
             logger.error(f"Error during audio synthesis: {str(e)}")
             raise PodcastAudioSynthesisError(str(e))
 
-    def _script_to_dict_list(self, script: PodcastScript) -> list[dict[str, str]]:
-        """Convert PodcastScript to list of dictionaries for TTS processing"""
-        return [{"speaker": str(turn.speaker), "text": turn.text} for turn in script.turns]
+    async def execute_streaming(
+        self,
+        turns: AsyncIterator[ScriptTurn],
+        language: PodcastLanguage = PodcastLanguage.EN_US,
+        checkpoint_store: PodcastCheckpointStore | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> list[bytes]:
+        """Synthesize turns while they are still being generated
 
-    def _should_use_chunking(self, script: PodcastScript, max_chars_per_request: int = 5000) -> bool:
-        """Determine if script should be synthesized in chunks
+        A run of same-speaker turns is complete once the speaker changes, so its
+        requests are planned and synthesized right away. The resulting requests are
+        the same as planning the finished script, so checkpoints are shared.
 
         Args:
-            script: PodcastScript to check
-            max_chars_per_request: Maximum characters per TTS request
+            turns: Script turns in order, e.g. from GenerateScriptUseCase.stream
+            language: Language of the script
+            checkpoint_store: When given, per-request audio segments are reused from and saved to it
+            on_progress: Called with (requests done, requests planned so far) as synthesis advances
 
         Returns:
-            True if chunking should be used
+            Audio segments in WAV (LINEAR16) format, in playback order
 
         """
-        return script.get_total_length() > max_chars_per_request
+        progress = ProgressCounter(on_progress)
+        # One limit across all runs, so concurrent runs do not multiply the TTS requests in flight
+        semaphore = asyncio.Semaphore(max(1, self.config.audio_synthesis_batch_size))
+        tasks: list[asyncio.Task[list[bytes]]] = []
+        run: list[dict[str, str]] = []
+
+        def flush() -> None:
+            if run:
+                requests = plan_tts_requests(list(run), self.config.max_tts_request_bytes)
+                progress.add(len(requests))
+                tasks.append(asyncio.create_task(self.synthesize_requests(requests, language, checkpoint_store, progress, semaphore)))
+                run.clear()
+
+        try:
+            async for turn in turns:
+                if run and run[-1]["speaker"] != str(turn.speaker):
+                    flush()
+                run.append({"speaker": str(turn.speaker), "text": turn.text})
+            flush()
+            batches = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        segments = [segment for batch in batches for segment in batch]
+        logger.info(f"Synthesized {len(segments)} requests while the script was streaming")
+        return segments
+
+    async def _synthesize_requests_with_checkpoints(
+        self,
+        requests: list[TTSRequest],
+        language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore,
+        progress: ProgressCounter | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[bytes]:
+        """Synthesize concurrently, skipping requests whose audio segment is already stored"""
+        checkpoint_names = [f"audio_segments/{content_key(language.value, request.speaker, request.ssml)}.wav" for request in requests]
+        load_semaphore = asyncio.Semaphore(self.config.audio_synthesis_batch_size)
+
+        async def load(name: str) -> bytes | None:
+            async with load_semaphore:
+                return await checkpoint_store.load_bytes(name)
+
+        segments = list(await asyncio.gather(*(load(name) for name in checkpoint_names)))
+        missing = [index for index, segment in enumerate(segments) if segment is None]
+        if progress:
+            for _ in range(len(requests) - len(missing)):
+                await progress.step()
+
+        if missing:
+
+            async def save(missing_index: int, segment: bytes) -> None:
+                # Saved as each request finishes, so a failure elsewhere does not lose this segment
+                await checkpoint_store.save_bytes(checkpoint_names[missing[missing_index]], segment, "audio/wav")
+
+            synthesized = await self.tts_client.synthesize_requests(
+                [requests[index] for index in missing],
+                language.value,
+                self.config.audio_synthesis_batch_size,
+                progress.step if progress else None,
+                save,
+                semaphore,
+            )
+            for index, segment in zip(missing, synthesized, strict=True):
+                segments[index] = segment
+
+        logger.info(f"Synthesized {len(missing)} requests ({len(requests) - len(missing)} reused from checkpoints)")
+        return [segment for segment in segments if segment is not None]
+
+    def _script_to_dict_list(self, script: PodcastScript) -> list[dict[str, str]]:
+        """Convert PodcastScript to list of dictionaries for TTS processing"""
+        return [{"speaker": str(turn.speaker), "text": turn.text} for turn in script.turns]
 
     def _validate_for_tts(self, script: PodcastScript) -> None:
         """Validate that a script is suitable for TTS synthesis
@@ -86,8 +221,8 @@ class SynthesizeAudioUseCase:
             if not turn.text.strip():
                 raise ValueError(f"Turn {i} has empty text")
 
-            # Check for excessively long turns
-            if len(turn.text) > 5000:
+            # Excessively long turns are split across requests at sentence boundaries
+            if len(turn.text) > self.config.max_tts_request_bytes:
                 logger.warning(f"Turn {i} has very long text ({len(turn.text)} chars)")
 
         # Check total length
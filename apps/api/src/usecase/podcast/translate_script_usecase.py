@@ -0,0 +1,135 @@
+import asyncio
+import logging
+
+from src.domain.podcast.exceptions.podcast_exceptions import PodcastScriptGenerationError
+from src.domain.podcast.value_objects.language import PodcastLanguage
+from src.domain.podcast.value_objects.podcast_script import PodcastScript, ScriptTurn
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.tokenizer import count_tokens
+from src.usecase.podcast.podcast_checkpoint_store import PodcastCheckpointStore, content_key
+from src.usecase.podcast.podcast_config import PodcastConfig
+from src.usecase.podcast.podcast_progress_reporter import ProgressCallback, ProgressCounter
+
+logger = logging.getLogger(__name__)
+
+
+class TranslateScriptUseCase:
+    """Use case for producing a podcast script by translating one written in another language
+
+    Turns are translated in order-preserving batches, so adding a language costs
+    one translation pass instead of extraction, summarization and scripting.
+    A batch whose response does not line up with its turns is split and retried.
+    """
+
+    def __init__(self, config: PodcastConfig | None = None) -> None:
+        self.gemini_client = ClientRegistry.get_gemini_client()
+        self.config = config or PodcastConfig()
+
+    async def execute(
+        self,
+        script: PodcastScript,
+        book_title: str,
+        source_language: PodcastLanguage,
+        target_language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> PodcastScript:
+        """Translate a script turn by turn
+
+        Args:
+            script: Script to translate
+            book_title: Title of the book
+            source_language: Language of the script
+            target_language: Language of the result
+            checkpoint_store: When given, translated batches are reused from and saved to it
+            on_progress: Called with (batches done, total batches)
+
+        Returns:
+            Script with the same speakers and turn order in the target language
+
+        """
+        batches = self._batch_turns(script.turns)
+        logger.info(f"Translating {len(script.turns)} turns from {source_language.value} to {target_language.value} in {len(batches)} requests")
+
+        progress = ProgressCounter(on_progress, len(batches))
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_translation_requests)
+
+        async def translate(batch: list[ScriptTurn]) -> list[str]:
+            texts = await self._translate_batch(batch, book_title, source_language, target_language, checkpoint_store, semaphore)
+            await progress.step()
+            return texts
+
+        try:
+            translated = await asyncio.gather(*(translate(batch) for batch in batches))
+        except Exception as e:
+            logger.error(f"Error translating podcast script: {str(e)}")
+            raise PodcastScriptGenerationError(f"Script translation failed: {str(e)}") from e
+
+        turns = [
+            ScriptTurn(speaker=turn.speaker, text=text)
+            for batch, texts in zip(batches, translated, strict=True)
+            for turn, text in zip(batch, texts, strict=True)
+        ]
+        return PodcastScript(turns=turns)
+
+    def _batch_turns(self, turns: list[ScriptTurn]) -> list[list[ScriptTurn]]:
+        """Group consecutive turns without exceeding the translation token budget"""
+        batches: list[list[ScriptTurn]] = []
+        current: list[ScriptTurn] = []
+        current_tokens = 0
+        for turn in turns:
+            tokens = count_tokens(turn.text)
+            if current and current_tokens + tokens > self.config.translation_batch_tokens:
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(turn)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _translate_batch(
+        self,
+        batch: list[ScriptTurn],
+        book_title: str,
+        source_language: PodcastLanguage,
+        target_language: PodcastLanguage,
+        checkpoint_store: PodcastCheckpointStore | None,
+        semaphore: asyncio.Semaphore,
+    ) -> list[str]:
+        """Translate one batch, halving it when the response does not match its turns"""
+        turns = [{"speaker": str(turn.speaker), "text": turn.text} for turn in batch]
+        key = content_key(
+            source_language.value, book_title, str(self.config.translation_temperature), *(f"{t['speaker']}:{t['text']}" for t in turns)
+        )
+        name = f"translations/{target_language.value}/{key}.json"
+        if checkpoint_store:
+            cached = await checkpoint_store.load_json(name)
+            if isinstance(cached, list) and len(cached) == len(batch):
+                return [str(text) for text in cached]
+
+        try:
+            async with semaphore:
+                texts = await self.gemini_client.translate_dialogue(
+                    turns,
+                    book_title,
+                    source_language,
+                    target_language,
+                    # Leave room for languages that need more tokens than the source
+                    max_output_tokens=max(1024, sum(count_tokens(turn.text) for turn in batch) * 3),
+                    temperature=self.config.translation_temperature,
+                )
+        except ValueError as e:
+            if len(batch) == 1:
+                raise
+            logger.warning(f"Translation of {len(batch)} turns did not line up ({str(e)}); retrying in halves")
+            middle = len(batch) // 2
+            halves = await asyncio.gather(
+                self._translate_batch(batch[:middle], book_title, source_language, target_language, checkpoint_store, semaphore),
+                self._translate_batch(batch[middle:], book_title, source_language, target_language, checkpoint_store, semaphore),
+            )
+            texts = halves[0] + halves[1]
+
+        if checkpoint_store:
+            await checkpoint_store.save_json(name, texts)
+        return texts
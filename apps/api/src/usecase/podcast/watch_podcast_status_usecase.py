@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import suppress
+from typing import Any
+
+from src.config.app_config import AppConfig
+from src.domain.podcast.exceptions.podcast_exceptions import PodcastNotFoundError
+from src.domain.podcast.repositories.podcast_repository import PodcastRepository
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.usecase.podcast.get_podcast_status_usecase import status_view_to_dict
+
+logger = logging.getLogger(__name__)
+
+
+class WatchPodcastStatusUseCase:
+    """Use case for following podcast generation status as it changes
+
+    The status projection is read again whenever the repository reports a change
+    (and at a long fallback interval), and only changed states are passed on, so
+    clients receive every stage transition without polling the API themselves.
+    """
+
+    def __init__(self, podcast_repository: PodcastRepository) -> None:
+        self.podcast_repository = podcast_repository
+        self.interval_seconds = AppConfig.get_config().podcast_status_stream_interval_seconds
+
+    async def execute(self, podcast_id: PodcastId) -> AsyncGenerator[dict[str, Any]]:
+        """Yield the status information of a podcast each time it changes
+
+        The current state is yielded first. The stream ends once generation has
+        completed or failed.
+
+        Args:
+            podcast_id: ID of the podcast
+
+        Yields:
+            Dictionary containing podcast status information
+
+        Raises:
+            PodcastNotFoundError: If podcast doesn't exist (or is deleted while watched)
+
+        """
+        last: dict[str, Any] | None = None
+        with self.podcast_repository.watch_status_changes(podcast_id) as changed:
+            while True:
+                # Cleared before reading, so a change made during the read wakes the next wait
+                changed.clear()
+                view = await self.podcast_repository.find_status_view(podcast_id)
+                if not view:
+                    raise PodcastNotFoundError(str(podcast_id))
+
+                status_info = status_view_to_dict(view)
+                if status_info != last:
+                    last = status_info
+                    yield status_info
+
+                if view.is_finished():
+                    logger.debug(f"Podcast {podcast_id} finished with status {view.status}; closing status stream")
+                    return
+
+                # The timeout re-reads the state in case a notification was missed, e.g. while the listener reconnects
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(changed.wait(), timeout=self.interval_seconds)
@@ -0,0 +1,69 @@
+import unittest
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import uuid4
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.config.db import engine
+from src.domain.book.entities.book_index_job import BookIndexJobStatus
+from src.domain.book.value_objects.book_id import BookId
+from src.infrastructure.postgres.book.book_dto import BookDTO
+from src.infrastructure.postgres.book.book_index_job_queue import BookIndexJobQueueImpl
+from src.infrastructure.postgres.user.user_dto import UserDTO
+
+
+def _postgres_available() -> bool:
+    try:
+        with engine.connect():
+            return True
+    except OperationalError:
+        return False
+
+
+@unittest.skipUnless(_postgres_available(), "PostgreSQL is not reachable at DATABASE_URL")
+class BookIndexJobQueueTest(unittest.IsolatedAsyncioTestCase):
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        # Everything runs in one transaction that is rolled back; the queue's commits only release savepoints
+        with engine.connect() as connection, connection.begin() as transaction:
+            session = Session(bind=connection, join_transaction_mode="create_savepoint")
+            try:
+                yield session
+            finally:
+                session.close()
+                transaction.rollback()
+
+    def _add_book(self, session: Session) -> BookId:
+        user_id, book_id = str(uuid4()), str(uuid4())
+        session.add(UserDTO(id=user_id, username=f"user-{user_id}", email=f"{user_id}@example.com"))
+        session.add(BookDTO(id=book_id, user_id=user_id, name="Book", file_path="books/book.epub", size=1))
+        session.flush()
+        return BookId(book_id)
+
+    async def test_enqueue_reuses_the_active_job_of_the_book(self) -> None:
+        with self._session() as session:
+            book_id = self._add_book(session)
+            queue = BookIndexJobQueueImpl(session, max_attempts=3)
+
+            first = await queue.enqueue(book_id)
+            second = await queue.enqueue(book_id)
+
+            assert first.status == BookIndexJobStatus.QUEUED
+            assert second.id == first.id
+
+    async def test_finished_job_does_not_block_a_new_one(self) -> None:
+        with self._session() as session:
+            book_id = self._add_book(session)
+            queue = BookIndexJobQueueImpl(session, max_attempts=3)
+
+            first = await queue.enqueue(book_id)
+            await queue.complete(first.id)
+            second = await queue.enqueue(book_id)
+
+            assert second.id != first.id
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import io
+import unittest
+import zipfile
+
+from src.infrastructure.external.epub.epub_metadata import extract_epub_metadata
+from src.infrastructure.external.gcs import RANGE_READ_BUFFER_SIZE, GCSRangeReader
+
+CONTAINER = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>
+</container>"""
+
+PACKAGE = """<?xml version="1.0"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:title> Title </dc:title>
+    <dc:creator>Author</dc:creator>
+    <dc:date>2021-01-01</dc:date>
+    <meta property="rendition:layout">pre-paginated</meta>
+  </metadata>
+</package>"""
+
+
+def _epub(padding_bytes: int = 0) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        archive.writestr("META-INF/container.xml", CONTAINER)
+        archive.writestr("OEBPS/content.opf", PACKAGE)
+        archive.writestr("OEBPS/images/cover.bin", bytes(padding_bytes), compress_type=zipfile.ZIP_STORED)
+    return buffer.getvalue()
+
+
+class _FakeBlob:
+    name = "books/book.epub"
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.downloaded = 0
+
+    def download_as_bytes(self, start: int, end: int) -> bytes:
+        self.downloaded += end - start + 1
+        return self.data[start : end + 1]
+
+
+class ExtractEpubMetadataTest(unittest.TestCase):
+    def test_metadata_is_read_from_the_package_document(self) -> None:
+        metadata = extract_epub_metadata(io.BytesIO(_epub()))
+
+        assert metadata == {"title": "Title", "creator": "Author", "pubdate": "2021-01-01", "layout": "pre-paginated"}
+
+    def test_ranged_reader_skips_the_rest_of_the_book(self) -> None:
+        data = _epub(padding_bytes=8 * RANGE_READ_BUFFER_SIZE)
+        blob = _FakeBlob(data)
+
+        with io.BufferedReader(GCSRangeReader(blob, len(data)), buffer_size=RANGE_READ_BUFFER_SIZE) as epub_file:  # type: ignore[arg-type]
+            metadata = extract_epub_metadata(epub_file)
+
+        assert metadata["title"] == "Title"
+        assert blob.downloaded < 2 * RANGE_READ_BUFFER_SIZE
+
+    def test_non_epub_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):  # noqa: PT027
+            extract_epub_metadata(io.BytesIO(b"not a zip"))
+
+
+if __name__ == "__main__":
+    unittest.main()
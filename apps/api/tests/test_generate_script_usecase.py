@@ -0,0 +1,65 @@
+import unittest
+from collections.abc import AsyncIterator
+from unittest import mock
+
+from src.domain.podcast.exceptions.podcast_exceptions import PodcastScriptGenerationError
+from src.domain.podcast.value_objects.podcast_script import ScriptTurn
+from src.usecase.podcast.generate_script_usecase import GenerateScriptUseCase
+
+
+class _FakeGeminiClient:
+    def __init__(self, speakers: list[str], fail_after: int | None = None) -> None:
+        self.speakers = speakers
+        self.fail_after = fail_after
+
+    async def stream_podcast_script(self, **kwargs: object) -> AsyncIterator[dict]:
+        for index, speaker in enumerate(self.speakers):
+            if index == self.fail_after:
+                raise RuntimeError("stream interrupted")
+            yield {"speaker": speaker, "text": f"Line {index}."}
+
+
+class GenerateScriptStreamTest(unittest.IsolatedAsyncioTestCase):
+    def _use_case(self, client: _FakeGeminiClient) -> GenerateScriptUseCase:
+        with mock.patch("src.usecase.podcast.generate_script_usecase.ClientRegistry.get_gemini_client", return_value=client):
+            return GenerateScriptUseCase()
+
+    async def _stream(self, client: _FakeGeminiClient, received: list[ScriptTurn]) -> None:
+        async for turn in self._use_case(client).stream(book_summary="summary", book_title="Title"):
+            received.append(turn)
+
+    async def test_balanced_script_streams_every_turn(self) -> None:
+        received: list[ScriptTurn] = []
+
+        await self._stream(_FakeGeminiClient(["GUEST", "HOST"] * 5), received)
+
+        # Intro, ten dialogue turns and outro
+        assert len(received) == 12
+
+    async def test_one_sided_script_is_rejected_before_any_turn_is_yielded(self) -> None:
+        received: list[ScriptTurn] = []
+
+        with self.assertRaises(PodcastScriptGenerationError):  # noqa: PT027
+            await self._stream(_FakeGeminiClient(["HOST"] * 10), received)
+
+        assert received == []
+
+    async def test_short_script_is_rejected_before_any_turn_is_yielded(self) -> None:
+        received: list[ScriptTurn] = []
+
+        with self.assertRaises(PodcastScriptGenerationError):  # noqa: PT027
+            await self._stream(_FakeGeminiClient(["GUEST", "HOST"]), received)
+
+        assert received == []
+
+    async def test_interrupted_stream_raises_script_generation_error(self) -> None:
+        received: list[ScriptTurn] = []
+
+        with self.assertRaises(PodcastScriptGenerationError):  # noqa: PT027
+            await self._stream(_FakeGeminiClient(["GUEST", "HOST"] * 5, fail_after=7), received)
+
+        assert len(received) == 8
+
+
+if __name__ == "__main__":
+    unittest.main()
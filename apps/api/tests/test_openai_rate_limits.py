@@ -0,0 +1,75 @@
+import unittest
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest import mock
+
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_openai import ChatOpenAI
+
+from src.infrastructure.openai_rate_limits import OpenAIRateLimiter, RateLimitedChatOpenAI
+
+
+class _RecordingLimiter:
+    def __init__(self) -> None:
+        self.acquired = 0
+        self.refunded = 0
+
+    async def acquire(self, tokens: int = 0, **kwargs: Any) -> None:  # noqa: ANN401
+        self.acquired += tokens
+
+    def refund(self, tokens: int) -> None:
+        if tokens > 0:
+            self.refunded += tokens
+
+
+def _chunks(usage_tokens: int | None, fail: bool = False) -> Any:  # noqa: ANN401
+    async def astream(self: ChatOpenAI, *args: Any, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:  # noqa: ANN401
+        yield ChatGenerationChunk(message=AIMessageChunk(content="Hello"))
+        if fail:
+            raise RuntimeError("connection reset")
+        usage = {"input_tokens": usage_tokens - 1, "output_tokens": 1, "total_tokens": usage_tokens} if usage_tokens else None
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=usage))
+
+    return astream
+
+
+class RateLimitedChatStreamTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.limiter = _RecordingLimiter()
+        patcher = mock.patch.object(OpenAIRateLimiter, "_chat_limiter", self.limiter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.model = RateLimitedChatOpenAI(model_name="gpt-4o", streaming=True, stream_usage=True, api_key="test")  # type: ignore[arg-type]
+
+    async def _consume(self, astream: Any, limit: int | None = None) -> None:  # noqa: ANN401
+        with mock.patch.object(ChatOpenAI, "_astream", astream):
+            stream = self.model._astream([HumanMessage(content="Hi")])
+            try:
+                count = 0
+                async for _ in stream:
+                    count += 1
+                    if limit is not None and count >= limit:
+                        break
+            finally:
+                await stream.aclose()
+
+    async def test_unused_estimate_is_refunded_from_the_final_usage(self) -> None:
+        await self._consume(_chunks(usage_tokens=12))
+
+        assert self.limiter.acquired - self.limiter.refunded == 12
+
+    async def test_failed_stream_refunds_the_whole_estimate(self) -> None:
+        with self.assertRaises(RuntimeError):  # noqa: PT027
+            await self._consume(_chunks(usage_tokens=12, fail=True))
+
+        assert self.limiter.refunded == self.limiter.acquired
+
+    async def test_closed_stream_refunds_the_whole_estimate(self) -> None:
+        await self._consume(_chunks(usage_tokens=12), limit=1)
+
+        assert self.limiter.refunded == self.limiter.acquired
+
+
+if __name__ == "__main__":
+    unittest.main()
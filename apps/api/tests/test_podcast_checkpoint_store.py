@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+from src.usecase.podcast.podcast_checkpoint_store import resolve_book_hash
+
+
+class _FakeGCSClient:
+    def __init__(self, md5: str | None) -> None:
+        self.md5 = md5
+
+    def get_object_name(self, file_path: str) -> str:
+        return file_path
+
+    def get_object_md5(self, object_name: str) -> str | None:
+        return self.md5
+
+
+def _book(user_id: str, metadata_identifier: str | None = "urn:isbn:9780000000000") -> Any:  # noqa: ANN401
+    return SimpleNamespace(id="book-1", user_id=user_id, file_path="books/book.epub", metadata_identifier=metadata_identifier)
+
+
+class ResolveBookHashTest(unittest.IsolatedAsyncioTestCase):
+    async def test_file_hash_is_shared_across_users(self) -> None:
+        client = _FakeGCSClient("md5-of-file")
+
+        assert await resolve_book_hash(_book("alice"), client) == "md5-of-file"  # type: ignore[arg-type]
+        assert await resolve_book_hash(_book("bob"), client) == "md5-of-file"  # type: ignore[arg-type]
+
+    async def test_metadata_identifier_is_scoped_to_the_owner(self) -> None:
+        client = _FakeGCSClient(None)
+
+        alice = await resolve_book_hash(_book("alice"), client)  # type: ignore[arg-type]
+
+        assert alice is not None
+        assert alice == await resolve_book_hash(_book("alice"), client)  # type: ignore[arg-type]
+        assert alice != await resolve_book_hash(_book("bob"), client)  # type: ignore[arg-type]
+
+    async def test_no_identity_without_file_hash_or_metadata(self) -> None:
+        assert await resolve_book_hash(_book("alice", None), _FakeGCSClient(None)) is None  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import uuid4
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.config.db import engine
+from src.domain.podcast.value_objects.podcast_id import PodcastId
+from src.infrastructure.postgres.book.book_dto import BookDTO
+from src.infrastructure.postgres.podcast.podcast_dto import PodcastDTO
+from src.infrastructure.postgres.podcast.podcast_repository import PodcastRepositoryImpl
+from src.infrastructure.postgres.user.user_dto import UserDTO
+
+
+def _postgres_available() -> bool:
+    try:
+        with engine.connect():
+            return True
+    except OperationalError:
+        return False
+
+
+@unittest.skipUnless(_postgres_available(), "PostgreSQL is not reachable at DATABASE_URL")
+class FindStatusViewTest(unittest.IsolatedAsyncioTestCase):
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        # Everything runs in one transaction that is rolled back; the repository's commits only release savepoints
+        with engine.connect() as connection, connection.begin() as transaction:
+            session = Session(bind=connection, join_transaction_mode="create_savepoint")
+            try:
+                yield session
+            finally:
+                session.close()
+                transaction.rollback()
+
+    def _add_podcast(self, session: Session, script: list | None) -> str:
+        user_id, book_id, podcast_id = str(uuid4()), str(uuid4()), str(uuid4())
+        session.add(UserDTO(id=user_id, username=f"user-{user_id}", email=f"{user_id}@example.com"))
+        session.add(BookDTO(id=book_id, user_id=user_id, name="Book", file_path="books/book.epub", size=1))
+        session.add(PodcastDTO(id=podcast_id, book_id=book_id, user_id=user_id, title="Podcast", script=script))
+        session.flush()
+        return podcast_id
+
+    async def test_podcast_without_script_has_no_script_statistics(self) -> None:
+        with self._session() as session:
+            podcast_id = self._add_podcast(session, None)
+
+            view = await PodcastRepositoryImpl(session).find_status_view(PodcastId(podcast_id))
+
+            assert view is not None
+            assert view.script_turn_count is None
+            assert view.script_character_count is None
+
+    async def test_script_statistics_are_computed_from_the_script(self) -> None:
+        with self._session() as session:
+            podcast_id = self._add_podcast(session, [{"speaker": "HOST", "text": "Hello"}, {"speaker": "GUEST", "text": "Hi there"}])
+
+            view = await PodcastRepositoryImpl(session).find_status_view(PodcastId(podcast_id))
+
+            assert view is not None
+            assert view.script_turn_count == 2
+            assert view.script_character_count == len("Hello") + len("Hi there")
+
+
+if __name__ == "__main__":
+    unittest.main()
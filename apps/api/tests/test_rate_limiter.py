@@ -0,0 +1,48 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.infrastructure.rate_limiter import RequestPriority, TokenBucket
+
+
+class TokenBucketTest(unittest.IsolatedAsyncioTestCase):
+    async def test_blocking_acquire_on_the_event_loop_borrows_instead_of_waiting(self) -> None:
+        bucket = TokenBucket(capacity=1, refill_per_second=10)
+        bucket.acquire_blocking(1)
+
+        started_at = time.monotonic()
+        # Waiting here would stop the loop, including the acquires that should go first
+        bucket.acquire_blocking(1)
+        borrowed_at = time.monotonic()
+        await asyncio.wait_for(bucket.acquire(1, RequestPriority.INTERACTIVE), timeout=5)
+
+        assert borrowed_at - started_at < 0.05
+        # The borrowed token is repaid before the next acquire gets one
+        assert time.monotonic() - borrowed_at >= 0.15
+
+    async def test_blocking_acquire_in_a_thread_yields_to_interactive_waiters(self) -> None:
+        bucket = TokenBucket(capacity=1, refill_per_second=10)
+        bucket.acquire_blocking(1)
+        order: list[str] = []
+
+        def background() -> None:
+            bucket.acquire_blocking(1, RequestPriority.BACKGROUND)
+            order.append("background")
+
+        async def interactive() -> None:
+            await bucket.acquire(1, RequestPriority.INTERACTIVE)
+            order.append("interactive")
+
+        interactive_task = asyncio.create_task(interactive())
+        await asyncio.sleep(0)
+        thread = threading.Thread(target=background)
+        thread.start()
+        await asyncio.wait_for(interactive_task, timeout=5)
+        await asyncio.to_thread(thread.join, 5)
+
+        assert order == ["interactive", "background"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+from src.usecase.podcast.select_passages_usecase import PASSAGE_SEPARATOR, SelectPassagesUseCase
+
+
+class _FakeVectorStore:
+    def __init__(self, chunks: list[dict]) -> None:
+        self.chunks = chunks
+
+    def get_book_chunks(self, user_id: str, book_id: str) -> list[dict]:
+        return self.chunks
+
+
+def _chunk(content: str, vector: list[float], **properties: Any) -> dict:  # noqa: ANN401
+    return {"content": content, "vector": vector, **properties}
+
+
+class SelectPassagesUseCaseTest(unittest.IsolatedAsyncioTestCase):
+    async def _execute(self, chunks: list[dict]) -> Any:  # noqa: ANN401
+        use_case = SelectPassagesUseCase()
+        use_case.vector_store = _FakeVectorStore(chunks)  # type: ignore[assignment]
+        book = SimpleNamespace(id=SimpleNamespace(value="book-1"), user_id="user-1")
+        return await use_case.execute(book)  # type: ignore[arg-type]
+
+    async def test_groups_chunks_by_chapter_in_reading_order(self) -> None:
+        chunks = [
+            _chunk("first", [1.0, 0.0], spine_index=0, chunk_index=0, token_count=1, chapter_title="One"),
+            _chunk("second", [0.0, 1.0], spine_index=0, chunk_index=1, token_count=1, chapter_title="One"),
+            _chunk("third", [1.0, 1.0], spine_index=2, chunk_index=0, token_count=1, chapter_title="Two"),
+        ]
+
+        chapters = await self._execute(chunks)
+
+        assert [(chapter.index, chapter.title) for chapter in chapters] == [(0, "One"), (2, "Two")]
+        assert chapters[0].content == PASSAGE_SEPARATOR.join(["first", "second"])
+
+    async def test_legacy_chunks_without_position_use_the_full_text(self) -> None:
+        # Indexed before chunks carried spine_index / chunk_index / token_count; fetched in UUID order
+        chunks = [_chunk("later passage", [0.0, 1.0]), _chunk("opening passage", [1.0, 0.0])]
+
+        assert await self._execute(chunks) is None
+
+    async def test_partially_reindexed_book_uses_the_full_text(self) -> None:
+        chunks = [
+            _chunk("first", [1.0, 0.0], spine_index=0, chunk_index=0, token_count=1),
+            _chunk("legacy", [0.0, 1.0]),
+        ]
+
+        assert await self._execute(chunks) is None
+
+    async def test_unindexed_book_returns_none(self) -> None:
+        assert await self._execute([]) is None
+
+
+if __name__ == "__main__":
+    unittest.main()
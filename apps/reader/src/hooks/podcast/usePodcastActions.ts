@@ -6,8 +6,8 @@ import { mutate as globalMutate } from 'swr'
 import {
   createPodcast,
   getPodcastById,
-  pollPodcastStatus,
   retryPodcast,
+  watchPodcastStatus,
 } from '../../lib/apiHandler/podcastApiHandler'
 import { useTranslation } from '../useTranslation'
 
@@ -54,8 +54,16 @@ export const usePodcastActions = (): UsePodcastActionsReturn => {
       const result = await createPodcast(bookId, locale, title)
       if (result) {
         notifySuccess('create')
-        if (result.status === 'PROCESSING' || result.status === 'PENDING') {
-          pollPodcastStatus(
+        if (result.status === 'COMPLETED') {
+          // Linked to an existing generation of the same book
+          globalMutate(
+            `${process.env.NEXT_PUBLIC_API_BASE_URL}/podcasts/book/${bookId}`,
+          )
+        } else if (
+          result.status === 'PROCESSING' ||
+          result.status === 'PENDING'
+        ) {
+          watchPodcastStatus(
             result.id,
             (status) => {
               if (status.status === 'COMPLETED' || status.status === 'FAILED') {
@@ -64,7 +72,6 @@ export const usePodcastActions = (): UsePodcastActionsReturn => {
                 )
               }
             },
-            5000,
           )
         }
         return true
@@ -93,7 +100,7 @@ export const usePodcastActions = (): UsePodcastActionsReturn => {
           (result.status === 'PROCESSING' || result.status === 'PENDING') &&
           bookId
         ) {
-          pollPodcastStatus(
+          watchPodcastStatus(
             result.id,
             (status) => {
               if (status.status === 'COMPLETED' || status.status === 'FAILED') {
@@ -102,7 +109,6 @@ export const usePodcastActions = (): UsePodcastActionsReturn => {
                 )
               }
             },
-            5000,
           )
         }
         return true
@@ -101,6 +101,54 @@ export async function createBook(
   }
 }
 
+/**
+ * Uploads an EPUB (and its cover image) to the API as multipart form data.
+ * The server streams the file to storage and indexes it for RAG from there,
+ * so the file is neither base64-encoded nor sent a second time to /rag.
+ * @param file The EPUB file to upload.
+ * @param options Book name, metadata (JSON string) and cover image.
+ * @returns A promise resolving to the created BookDetail or null on error.
+ */
+export async function uploadBook(
+  file: File,
+  options: {
+    bookName?: string
+    bookMetadata?: string
+    coverImage?: Blob | null
+  } = {},
+): Promise<BookDetail | null> {
+  try {
+    const formData = new FormData()
+    formData.append('file', file, file.name)
+    formData.append('user_id', TEST_USER_ID)
+    if (options.bookName) {
+      formData.append('book_name', options.bookName)
+    }
+    if (options.bookMetadata) {
+      formData.append('book_metadata', options.bookMetadata)
+    }
+    if (options.coverImage) {
+      formData.append('cover_image', options.coverImage, 'cover.jpg')
+    }
+
+    const responseData = await apiClient<BookResponse>('/books/upload', {
+      method: 'POST',
+      body: formData,
+    })
+
+    const uploadedApiBook = responseData?.bookDetail
+    if (!uploadedApiBook) {
+      console.error('API did not return book data after upload.')
+      return null
+    }
+
+    return uploadedApiBook
+  } catch (error) {
+    console.error('Error uploading book:', error)
+    return null
+  }
+}
+
 /**
  * Deletes multiple books via the API using their IDs.
  * @param bookIds An array of book IDs to delete.
@@ -1,12 +1,11 @@
 import { v4 as uuidv4 } from 'uuid'
 
-import { TEST_USER_ID } from '../../pages/_app'
-import { fileToEpub, indexEpub } from '../../utils/epub'
-import { fileToBase64, toDataUrl } from '../../utils/fileUtils'
+import { fileToEpub } from '../../utils/epub'
+import { toBlob } from '../../utils/fileUtils'
 import { mapExtToMimes } from '../../utils/mime'
 import { components } from '../openapi-schema/schema'
 
-import { createBook, fetchAllBooks } from './bookApiHandler'
+import { fetchAllBooks, uploadBook } from './bookApiHandler'
 
 type BookDetail = components['schemas']['BookDetail']
 
@@ -23,22 +22,17 @@ export async function addBook(
 
   try {
     const coverUrl = await epub.coverUrl()
-    let coverDataUrl = null
+    let coverImage = null
     if (coverUrl) {
-      coverDataUrl = await toDataUrl(coverUrl)
+      coverImage = await toBlob(coverUrl)
     }
 
-    const bookRequest: components['schemas']['BookCreateRequest'] = {
-      fileData: await fileToBase64(file),
-      fileName: file.name,
-      userId: TEST_USER_ID,
-      bookId: tempBookId,
+    // RAG indexing runs on the server from the stored file
+    const bookData = await uploadBook(file, {
       bookName: file.name || `${metadata.title}.epub`,
       bookMetadata: JSON.stringify(metadata),
-      coverImage: coverDataUrl || null,
-    }
-
-    const bookData = await createBook(bookRequest)
+      coverImage,
+    })
 
     if (!bookData) {
       console.error('APIへの書籍登録に失敗しました')
@@ -46,8 +40,6 @@ export async function addBook(
       return null
     }
 
-    await indexEpub(file, TEST_USER_ID, bookData.id)
-
     setLoading?.(undefined)
     return bookData
   } catch (error) {
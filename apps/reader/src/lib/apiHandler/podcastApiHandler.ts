@@ -186,3 +186,63 @@ export async function pollPodcastStatus(
     poll()
   })
 }
+
+/**
+ * Follows podcast status updates pushed by the server until completion or failure
+ * Falls back to polling when server-sent events are unavailable
+ * @param podcastId The ID of the podcast to watch
+ * @param onUpdate Callback function called on each status update (including stage progress)
+ * @param timeoutMs Maximum time to watch in milliseconds (default: 1800000 - 30 minutes)
+ * @returns A promise that resolves when the podcast is completed or fails
+ */
+export async function watchPodcastStatus(
+  podcastId: string,
+  onUpdate?: (status: PodcastStatusResponse) => void,
+  timeoutMs: number = 1800000,
+): Promise<PodcastStatusResponse | null> {
+  const apiBaseUrl = process.env.NEXT_PUBLIC_API_BASE_URL
+  if (typeof EventSource === 'undefined' || !apiBaseUrl) {
+    return pollPodcastStatus(podcastId, onUpdate, 5000, timeoutMs)
+  }
+
+  return new Promise((resolve) => {
+    let latest: PodcastStatusResponse | null = null
+    let received = false
+    const source = new EventSource(
+      `${apiBaseUrl}/podcasts/${podcastId}/events`,
+    )
+    const finish = (status: PodcastStatusResponse | null) => {
+      clearTimeout(timer)
+      source.close()
+      resolve(status)
+    }
+    const timer = setTimeout(() => {
+      console.warn(`Podcast status stream timed out for ${podcastId}`)
+      finish(latest)
+    }, timeoutMs)
+
+    source.addEventListener('status', (event) => {
+      const status: PodcastStatusResponse = JSON.parse(
+        (event as MessageEvent<string>).data,
+      )
+      received = true
+      latest = status
+      onUpdate?.(status)
+      if (status.status === 'COMPLETED' || status.status === 'FAILED') {
+        finish(status)
+      }
+    })
+
+    source.onerror = () => {
+      // Server-side errors and dropped connections are both reported here
+      clearTimeout(timer)
+      source.close()
+      if (received) {
+        console.warn(
+          `Podcast status stream closed for ${podcastId}; falling back to polling`,
+        )
+      }
+      resolve(pollPodcastStatus(podcastId, onUpdate, 5000, timeoutMs))
+    }
+  })
+}
@@ -8,6 +8,11 @@ export function readBlob(fn: (reader: FileReader) => void) {
   })
 }
 
+export async function toBlob(url: string) {
+  const res = await fetch(url)
+  return res.blob()
+}
+
 export async function toDataUrl(url: string) {
   const res = await fetch(url)
   const buffer = await res.blob()
@@ -1,8 +1,7 @@
-import { createBook, fetchAllBooks } from '../lib/apiHandler/bookApiHandler'
+import { fetchAllBooks, uploadBook } from '../lib/apiHandler/bookApiHandler'
 import { components } from '../lib/openapi-schema/schema'
-import { TEST_USER_ID } from '../pages/_app'
-import { fileToEpub, indexEpub } from '../utils/epub'
-import { fileToBase64, toDataUrl } from '../utils/fileUtils'
+import { fileToEpub } from '../utils/epub'
+import { toBlob } from '../utils/fileUtils'
 import { mapExtToMimes } from '../utils/mime'
 
 type BookDetail = components['schemas']['BookDetail']
@@ -16,12 +15,12 @@ async function addBookToAPI(file: File): Promise<BookDetail | null> {
   const metadata = await epub.loaded.metadata
 
   try {
-    let coverDataUrl = null
+    let coverImage = null
     try {
       // Getting cover URL can fail
       const coverUrl = await epub.coverUrl()
       if (coverUrl) {
-        coverDataUrl = await toDataUrl(coverUrl)
+        coverImage = await toBlob(coverUrl)
       }
     } catch (coverError) {
       console.warn(
@@ -34,20 +33,17 @@ async function addBookToAPI(file: File): Promise<BookDetail | null> {
       payload: { name: file.name, progress: 30 },
     })
 
-    const bookRequest: components['schemas']['BookCreateRequest'] = {
-      fileData: await fileToBase64(file),
-      fileName: file.name,
-      userId: TEST_USER_ID,
-      bookName: file.name || `${metadata.title}.epub`,
-      bookMetadata: JSON.stringify(metadata),
-      coverImage: coverDataUrl || null,
-    }
     postMessage({
       type: 'progress',
       payload: { name: file.name, progress: 50 },
     })
 
-    const bookData = await createBook(bookRequest)
+    // The file is streamed as multipart and indexed for RAG on the server
+    const bookData = await uploadBook(file, {
+      bookName: file.name || `${metadata.title}.epub`,
+      bookMetadata: JSON.stringify(metadata),
+      coverImage,
+    })
     postMessage({
       type: 'progress',
       payload: { name: file.name, progress: 70 },
@@ -58,9 +54,6 @@ async function addBookToAPI(file: File): Promise<BookDetail | null> {
       return null
     }
 
-    // Indexing might be heavy, ensure indexEpub is worker-compatible
-    // or consider moving indexing to the server-side triggered by createBook.
-    await indexEpub(file, TEST_USER_ID, bookData.id)
     postMessage({
       type: 'progress',
       payload: { name: file.name, progress: 90 },
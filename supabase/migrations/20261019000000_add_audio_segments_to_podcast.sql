@@ -0,0 +1 @@
+alter table "public"."podcasts" add column "audio_segments" json;
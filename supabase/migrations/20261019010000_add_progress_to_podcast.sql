@@ -0,0 +1,5 @@
+alter table "public"."podcasts" add column "progress_stage" character varying(32);
+
+alter table "public"."podcasts" add column "progress_current" integer;
+
+alter table "public"."podcasts" add column "progress_total" integer;